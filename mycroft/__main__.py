@@ -30,6 +30,11 @@ from time import sleep
 
 def main():
     parser = ArgumentParser()
+    parser.add_argument('--import-report', action='store_true',
+                        help='Print how long each plugin took to import to stderr')
+    parser.add_argument('--supervise', action='store_true',
+                        help='Import everything once and run in forked workers that are '
+                             'replaced quickly when they crash or restart')
     subparsers = parser.add_subparsers(dest='action')
     subparsers.add_parser('setup')
     args = parser.parse_args()
@@ -39,17 +44,32 @@ def main():
         mycroft.util.log = PrintLogger(Level.INFO)
         mycroft.util.log._get_prefix = lambda level, offset: ''
 
+        from mycroft.plugin.util import format_import_times
+        from mycroft.root import Root
+        # Only what has install steps: wake word downloads and voice setup
+        Root(None, blacklist=['skills'], lazy=True).interfaces
+        if args.import_report:
+            print(format_import_times(), file=sys.stderr)
+        return
+
+    if args.supervise:
+        from mycroft.util.zygote import supervise
+        sys.exit(supervise(lambda: run(args)))
+    sys.exit(run(args))
+
+
+def run(args) -> int:
     from mycroft.util import log
+    from mycroft.plugin.util import format_import_times
     from mycroft.root import Root
-
-    if args.action == 'setup':
-        Root(None, blacklist=['skills'])
-        return
+    from mycroft.util.zygote import RESTART_CODE
 
     rt = Root()
+    if args.import_report:
+        print(format_import_times(), file=sys.__stderr__)
 
     if rt.config['use_server'] and rt.device_info:
-        rt.config.load_remote()
+        rt.config.start_refresh()
 
     rt.intent.context.compile()
     rt.interfaces.all.run(gp_daemon=True)
@@ -61,6 +81,7 @@ def main():
     log.info('Quiting...')
     sleep(0.1)
     print()
+    return RESTART_CODE if rt.main_thread.restart_requested else 0
 
 
 if __name__ == '__main__':
@@ -21,18 +21,108 @@
 # under the License.
 from abc import ABCMeta
 from copy import copy
+from random import uniform
 from threading import Event, Lock
+from time import monotonic, sleep
 
 import requests
 from requests import RequestException
+from requests.adapters import HTTPAdapter
 
 from mycroft.util import log
 from mycroft.util.parallel import run_parallel
 from mycroft.version import get_core_version, get_enclosure_version
 
 
+#: Methods that can be sent again without repeating a side effect
+IDEMPOTENT_METHODS = {'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'}
+
+
+class HttpClient:
+    """
+    Pool of keep-alive connections shared by all api objects
+
+    Requests failing with a connection error or a 5xx response are retried
+    with jittered exponential backoff until the timeout budget of the
+    endpoint runs out. Only idempotent methods are retried unless a
+    request opts in, since a failed request may already have been processed.
+    """
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.adapter = HTTPAdapter(pool_maxsize=config['pool_size'], max_retries=0)
+        self.session = requests.Session()
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0}
+        self.stats_lock = Lock()
+
+    def get_limits(self, path: str) -> tuple:
+        """Returns the (connect, read) timeout and the total budget of an api path"""
+        timeouts = self.config['timeouts']
+        limits = timeouts.get(path.split('/')[0], timeouts['default'])
+        return tuple(limits['timeout']), limits['budget']
+
+    def _count(self, stat: str):
+        with self.stats_lock:
+            self.stats[stat] += 1
+
+    def request(self, method: str, url: str, path: str = '', retry: bool = None,
+                **kwargs) -> requests.Response:
+        """
+        Args:
+            retry: Whether the request can be sent again. By default only idempotent methods are
+        """
+        timeout, budget = self.get_limits(path)
+        end_time = monotonic() + budget
+        retries = self.config['retries']
+        if not (method.upper() in IDEMPOTENT_METHODS if retry is None else retry):
+            retries = 0
+        attempt = 0
+        while True:
+            self._count('requests')
+            try:
+                response = self.session.request(method, url, timeout=timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                response = e
+            else:
+                if response.status_code < 500:
+                    return response
+
+            delay = self.config['backoff'] * 2 ** attempt * uniform(0.5, 1.5)
+            if attempt >= retries or monotonic() + delay + sum(timeout) > end_time:
+                break
+            log.debug('Retrying', method, url, 'in {:.2f}s after'.format(delay), response)
+            self._count('retries')
+            attempt += 1
+            sleep(delay)
+
+        self._count('failures')
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def pool_stats(self) -> dict:
+        """Returns request counters and the connections opened to each host"""
+        pools = self.adapter.poolmanager.pools
+        hosts = {}
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool:
+                hosts['{}://{}:{}'.format(key.key_scheme, key.key_host, key.key_port)] = {
+                    'connections': pool.num_connections, 'requests': pool.num_requests
+                }
+        with self.stats_lock:
+            return dict(self.stats, hosts=hosts)
+
+    def close(self):
+        self.session.close()
+
+
 class Api(metaclass=ABCMeta):
     """ Generic object to wrap web APIs """
+    client = None  # type: HttpClient
+    client_lock = Lock()
 
     def __init__(self, rt, path):
         self.rt = rt
@@ -40,6 +130,11 @@ class Api(metaclass=ABCMeta):
         self.url = rt.config['server_url']
         self.old_params = None
         self.refresh_lock = Lock()
+        self.etags = {}  # url -> (etag, data) of responses to conditional requests
+        if not Api.client:
+            with Api.client_lock:
+                if not Api.client:
+                    Api.client = HttpClient(rt.config['http'])
 
     def request(self, params, refresh=True):
         if refresh and self.rt.identity.is_expired():
@@ -71,16 +166,25 @@ class Api(metaclass=ABCMeta):
         json = self.build_json(params)
         query = self.build_query(params)
         url = self.build_url(params)
+        cached = params.get('conditional') and self.etags.get(url)
+        if cached:
+            headers['If-None-Match'] = cached[0]
         try:
-            response = requests.request(method, url, headers=headers, params=query,
-                                        data=data, json=json, timeout=(3.05, 5))
+            response = self.client.request(method, url, params.get('path', ''),
+                                           params.get('retry'), headers=headers,
+                                           params=query, data=data, json=json)
         except RequestException as e:
             response = e
         else:
             log.debug(method, url, response.status_code, stack_offset=3)
         if isinstance(response, Exception):
             raise ConnectionError('Failed to {} {}: {}'.format(method, url, response))
-        return self.get_response(response)
+        if cached and response.status_code == 304:
+            return cached[1]
+        data = self.get_response(response)
+        if params.get('conditional') and 'ETag' in response.headers:
+            self.etags[url] = (response.headers['ETag'], data)
+        return data
 
     def get_response(self, response):
         data = self.get_data(response)
@@ -167,19 +271,25 @@ class DeviceApi(Api):
             'path': '/' + self.rt.identity.uuid
         })
 
-    def get_settings(self):
+    def get_settings(self, conditional=False):
         """ Retrieve device settings information from the web backend
 
+        Args:
+            conditional (bool): Send the ETags of the last responses so
+                the server can skip resending unchanged data
+
         Returns:
             dict: JSON with user configuration information.
         """
 
         def get_settings():
-            out = self.request({'path': '/' + self.rt.identity.uuid + '/setting'})
+            out = self.request({'path': '/' + self.rt.identity.uuid + '/setting',
+                                'conditional': conditional})
             return out or {}
 
         def get_location():
-            return self.request({'path': '/' + self.rt.identity.uuid + '/location'})
+            return self.request({'path': '/' + self.rt.identity.uuid + '/location',
+                                 'conditional': conditional})
 
         loc, settings = run_parallel([get_location, get_settings], label='Getting Settings')
         if not settings:
@@ -208,6 +318,7 @@ class STTApi(Api):
         """
         return self.request({
             'method': 'POST',
+            'retry': True,  # Transcribing has no side effects
             'headers': {'Content-Type': 'audio/x-flac'},
             'query': {'lang': language, 'limit': limit},
             'data': audio
@@ -19,7 +19,6 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from os.path import join
 from padaos import IntentContainer
 from typing import Any
 
@@ -34,20 +33,16 @@ class PadaosFileIntent(IntentPlugin):
         super().__init__(rt)
         self.container = IntentContainer()
 
-    def _read_file(self, file_name):
-        with open(file_name) as f:
-            return [i.strip() for i in f.readlines() if i.strip()]
-
     def register(self, intent: Any, skill_name: str, intent_id: str):
         if not isinstance(intent, DynamicIntent):
-            file_name = join(self.rt.paths.skill_locale(skill_name), intent + '.intent')
-            intent = DynamicIntent(intent, self._read_file(file_name))
+            lines = self.rt.locales.get(skill_name).lines(intent + '.intent')
+            intent = DynamicIntent(intent, lines)
         self.container.add_intent(intent_id, intent.data)
 
     def register_entity(self, entity: Any, skill_name: str, entity_id: str):
         if not isinstance(entity, DynamicEntity):
-            file_name = join(self.rt.paths.skill_locale(skill_name), entity + '.entity')
-            entity = DynamicEntity(entity, self._read_file(file_name))
+            lines = self.rt.locales.get(skill_name).lines(entity + '.entity')
+            entity = DynamicEntity(entity, lines)
         self.container.add_entity(entity_id, entity.data)
 
     def unregister(self, intent_id: str):
@@ -59,7 +54,9 @@ class PadaosFileIntent(IntentPlugin):
     def compile(self):
         self.container.compile()
 
-    def calc_intents(self, query):
+    def calc_intents(self, query, floor=0.0):
+        if floor >= 1.0:
+            return []
         return [
             IntentMatch(intent_id=match['name'], confidence=1.0,
                         matches=match['entities'], query=query)
@@ -36,12 +36,12 @@ class PadatiousFileIntent(IntentPlugin):
         self.container = IntentContainer(join(rt.paths.user_config, 'intent_cache'))
 
     def register(self, intent: Any, skill_name: str, intent_id: str):
-        file_name = join(self.rt.paths.skill_locale(skill_name), intent + '.intent')
-        self.container.load_intent(name=intent_id, file_name=file_name)
+        lines = self.rt.locales.get(skill_name).lines(intent + '.intent')
+        self.container.add_intent(intent_id, lines)
 
-    def register_entity(self, entity: Any, entity_id: str, skill_name: str):
-        file_name = join(self.rt.paths.skill_locale(skill_name), entity + '.intent')
-        self.container.load_intent(name=entity_id, file_name=file_name)
+    def register_entity(self, entity: Any, skill_name: str, entity_id: str):
+        lines = self.rt.locales.get(skill_name).lines(entity + '.entity')
+        self.container.add_entity(entity_id, lines)
 
     def unregister(self, intent_id: str):
         self.container.remove_intent(intent_id)
@@ -54,9 +54,10 @@ class PadatiousFileIntent(IntentPlugin):
         self.container.train()
         log.info('Training complete!')
 
-    def calc_intents(self, query):
+    def calc_intents(self, query, floor=0.0):
         return [
             IntentMatch(intent_id=data.name, confidence=data.conf,
                         matches=data.matches, query=query)
             for data in self.container.calc_intents(query)
+            if data.conf > floor
         ]
@@ -80,11 +80,12 @@ class IntentPlugin(BasePlugin):
         """Remove the registered intent from the intent engine"""
         raise MustOverride
 
-    def calc_intents(self, query: str) -> List[IntentMatch]:
+    def calc_intents(self, query: str, floor: float = 0.0) -> List[IntentMatch]:
         """
         Run the intent engine to determine the probability of each intent against the query
         Args:
             query: input sentence as a single string
+            floor: matches with this confidence or less will be discarded and can be skipped
         Returns:
             intent matches: describes how the intent engine matched each intent with the query
         """
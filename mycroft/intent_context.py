@@ -19,11 +19,14 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from typing import Any, List
+from typing import Any
 
 from mycroft.plugin.group_plugin import GroupPlugin, GroupMeta
-from mycroft.intent_match import IntentMatch
+from mycroft.intent_match import TopMatches
 from mycroft.intent.intent_plugin import IntentPlugin
+from mycroft.util.metrics import timer
+from mycroft.util.tracing import span
+from mycroft.util.parallel import run_parallel
 
 
 class IntentContext(GroupPlugin, metaclass=GroupMeta, base=IntentPlugin, package='mycroft.intent',
@@ -86,5 +89,24 @@ class IntentContext(GroupPlugin, metaclass=GroupMeta, base=IntentPlugin, package
         """Prepare intents for calculation"""
         self.all.compile()
 
-    def calc_intents(self, query: str) -> List[IntentMatch]:
-        return sum(filter(bool, self.all.calc_intents(query)), [])
+    def calc_intents(self, query: str, floor: float = 0.0, k: int = 16) -> TopMatches:
+        """
+        Run all intent engines on the query
+
+        Returns:
+            matches: the k most confident matches above floor, best first when iterated
+        """
+        top = TopMatches(k, floor)
+
+        def make_calc(name, engine):
+            def calc():
+                with timer('intent.' + name), span('intent.' + name):
+                    top.add(engine.calc_intents(query, floor=top.floor))
+            calc.__name__ = name
+            return calc
+
+        run_parallel(
+            [make_calc(name, engine) for name, engine in self._plugins.items()],
+            label='Running all.calc_intents'
+        )
+        return top
@@ -19,6 +19,10 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from heapq import heappush, heappushpop
+from itertools import count
+from threading import Lock
+from typing import Iterable, Iterator
 
 
 class MissingIntentMatch(KeyError):
@@ -54,3 +58,46 @@ class IntentMatch:
 
     def __bool__(self):
         return any(bool(i) for i in [self.intent_id, self.confidence, self.matches, self.query])
+
+
+class TopMatches:
+    """
+    Keeps the k most confident matches above a floor
+
+    Matches from many engines can be added from different threads.
+    Iterating yields the kept matches, most confident first
+    """
+
+    def __init__(self, k: int = 16, floor: float = 0.0):
+        self.k = k
+        self.base_floor = floor
+        self.heap = []  # Least confident kept match first
+        self.ids = count()  # Breaks confidence ties in order of arrival
+        self.lock = Lock()
+
+    @property
+    def floor(self) -> float:
+        """Matches at or below this confidence would be discarded"""
+        heap = self.heap
+        if len(heap) < self.k:
+            return self.base_floor
+        return max(self.base_floor, heap[0][0])
+
+    def add(self, matches: Iterable[IntentMatch]):
+        for match in matches or ():
+            if match.confidence is None or match.confidence <= self.floor:
+                continue
+            with self.lock:
+                entry = (match.confidence, -next(self.ids), match)
+                if len(self.heap) < self.k:
+                    heappush(self.heap, entry)
+                else:
+                    heappushpop(self.heap, entry)
+
+    def __iter__(self) -> Iterator[IntentMatch]:
+        with self.lock:
+            entries = sorted(self.heap, reverse=True)
+        return (match for _, _, match in entries)
+
+    def __len__(self):
+        return len(self.heap)
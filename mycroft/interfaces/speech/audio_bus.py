@@ -0,0 +1,127 @@
+"""
+Microphone audio shared between consumers that read at their own pace
+
+A capture thread is the only writer of a ring buffer. Each consumer
+reads through its own Cursor, an absolute byte position in the stream,
+so a slow consumer falls behind (and eventually loses the oldest
+audio) without holding up the microphone or the other consumers.
+
+Usage:
+    >>> bus = AudioBus(stream, chunk_size=1024, sample_width=2, buffer_size=160000)
+    >>> wake_word = bus.cursor('wake_word')
+    >>> chunk = wake_word.read(2048)
+"""
+from threading import Condition, Thread
+
+from mycroft.util import log
+
+
+class Cursor:
+    """A consumer's read position in an AudioBus"""
+
+    def __init__(self, bus: 'AudioBus', name: str, position: int):
+        self.bus = bus
+        self.name = name
+        self.position = position
+        self.overflows = 0  # Times the writer overtook this consumer
+        self.lost_bytes = 0
+
+    def available(self) -> int:
+        return self.bus.written - self.position
+
+    def seek(self, position: int):
+        """Move to an absolute position. Positions still in the buffer can be re-read"""
+        self.position = max(position, self.bus.oldest())
+
+    def read(self, num_bytes: int, timeout=None) -> bytes:
+        """Blocks until num_bytes are available. Returns less if the bus closes or on timeout"""
+        bus = self.bus
+        end = self.position + num_bytes
+        if bus.written < end:
+            with bus.new_data:
+                bus.new_data.wait_for(lambda: bus.written >= end or bus.closed, timeout)
+        end = min(end, bus.written)
+
+        while True:
+            oldest = bus.oldest()
+            if self.position < oldest:
+                self.overflows += 1
+                self.lost_bytes += oldest - self.position
+                log.warning('Audio consumer', self.name, 'fell behind by',
+                            oldest - self.position, 'bytes')
+                self.position = oldest
+                end = min(oldest + num_bytes, bus.written)
+            data = bus.get(self.position, end)
+            if self.position >= bus.oldest():  # Not overwritten while copying
+                break
+        self.position = end
+        return data
+
+
+class AudioBus:
+    """Single writer ring buffer filled from an audio input stream by a capture thread"""
+
+    def __init__(self, stream, chunk_size: int, sample_width: int, buffer_size: int,
+                 channels: int = 1):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.chunk_bytes = chunk_size * sample_width * channels  # chunk_size counts frames
+        self.size = buffer_size - buffer_size % self.chunk_bytes
+        self.buffer = bytearray(self.size)
+        self.written = 0  # Total bytes ever written. Only the capture thread changes it
+        self.closed = False
+        self.new_data = Condition()
+        self.thread = None
+
+    def cursor(self, name: str, position: int = None) -> Cursor:
+        """Create a consumer that starts reading at position, by default only new audio"""
+        cursor = Cursor(self, name, self.written)
+        if position is not None:
+            cursor.seek(position)
+        return cursor
+
+    def start(self):
+        self.thread = Thread(target=self._capture, daemon=True)
+        self.thread.start()
+
+    def close(self):
+        self.closed = True
+        with self.new_data:
+            self.new_data.notify_all()
+        if self.thread:
+            self.thread.join()
+
+    def oldest(self) -> int:
+        """Position of the oldest audio that can still be read"""
+        return max(0, self.written - self.size + self.chunk_bytes)  # One chunk may be mid-write
+
+    def write(self, chunk: bytes):
+        start = self.written % self.size
+        first = min(len(chunk), self.size - start)
+        self.buffer[start:start + first] = chunk[:first]
+        self.buffer[:len(chunk) - first] = chunk[first:]
+        with self.new_data:
+            self.written += len(chunk)
+            self.new_data.notify_all()
+
+    def get(self, start: int, end: int) -> bytes:
+        """Bytes between two absolute positions. The caller checks they weren't overwritten"""
+        a, b = start % self.size, end % self.size
+        if end - start == 0:
+            return b''
+        if a < b:
+            return bytes(self.buffer[a:b])
+        return bytes(self.buffer[a:] + self.buffer[:b])
+
+    def _capture(self):
+        try:
+            while not self.closed:
+                chunk = self.stream.read(self.chunk_size, exception_on_overflow=False)
+                self.write(chunk)
+        except OSError:
+            log.exception('Reading microphone')
+        finally:
+            # Wake up consumers so they see the bus closed instead of waiting forever
+            with self.new_data:
+                self.closed = True
+                self.new_data.notify_all()
@@ -20,14 +20,17 @@
 # specific language governing permissions and limitations
 # under the License.
 import audioop
+from time import monotonic
 
 import pyaudio
 from speech_recognition import AudioData
 
+from mycroft.interfaces.speech.audio_bus import AudioBus, Cursor
 from mycroft.interfaces.speech.wake_word_engines.wake_word_engine_plugin import WakeWordEnginePlugin
 from mycroft.interfaces.speech.wake_word_service import WakeWordService
 from mycroft.plugin.base_plugin import BasePlugin
 from mycroft.util import log
+from mycroft.util.audio import Playback
 
 
 class RecognizerService(BasePlugin):
@@ -43,7 +46,9 @@ class RecognizerService(BasePlugin):
         'max_di_dt': 0.4,
         'noise_max_out_sec': 0.2,
         'sec_between_ww_checks': 0.2,
-        'recording_timeout': 10
+        'recording_timeout': 10,
+        'buffer_sec': 10,  # Audio kept for consumers that fall behind
+        'pre_roll_sec': 0.2  # Audio before the end of the wake word included in the recording
     }
 
     def __init__(self, rt):
@@ -58,6 +63,12 @@ class RecognizerService(BasePlugin):
         self.stream = self.p.open(format=self.format, channels=self.channels,
                                   rate=self.sample_rate, input=True,
                                   frames_per_buffer=self.chunk_size)
+        frame_bytes = self.sample_width * self.channels
+        self.bus = AudioBus(self.stream, self.chunk_size, self.sample_width,
+                            int(self.config['buffer_sec'] * self.sample_rate) * frame_bytes,
+                            self.channels)
+        self.wake_word_audio = self.bus.cursor('wake_word')
+        self.bus.start()
 
         self.talking_volume_ratio = self.config['talking_volume_ratio']
         self.required_integral = self.config['required_noise_integral']
@@ -75,9 +86,20 @@ class RecognizerService(BasePlugin):
         self.noise_level = 0
         self._intercept = None
         self._has_activated = False
+        self.wake_word_end = None  # Position in self.bus where the last wake word ended
         self.engine = WakeWordService(rt, self.on_activation)  # type: WakeWordEnginePlugin
         self.engine.startup()
 
+    def listen(self, name: str, position: int = None) -> Cursor:
+        """Read microphone audio independently of other consumers, ie. for a debug tap"""
+        return self.bus.cursor(name, position)
+
+    def _read_chunk(self, cursor: Cursor) -> bytes:
+        chunk = cursor.read(self.bus.chunk_bytes)
+        if not chunk and self.bus.closed:  # Exiting or the microphone failed
+            raise SystemExit
+        return chunk
+
     def intercept(self, exception):
         self._intercept = exception
 
@@ -104,14 +126,15 @@ class RecognizerService(BasePlugin):
     def wait_for_wake_word(self):
         """Listens to the microphone and returns when it hears the wake word"""
         log.debug('Waiting for wake word...')
-        self.av_energy = self._calc_energy(self.stream.read(self.chunk_size))
+        self.wake_word_audio.seek(self.bus.written)
+        self.av_energy = self._calc_energy(self._read_chunk(self.wake_word_audio))
         self.engine.continue_listening()
 
         while not self._has_activated:
             self._check_intercept()
-            chunk = self.stream.read(self.chunk_size)
+            chunk = self._read_chunk(self.wake_word_audio)
             self.update_energy(self._calc_energy(chunk))
-            self.engine.update(chunk)
+            self.engine.update(chunk, self.wake_word_audio.position)
 
         self._has_activated = False
         self.engine.pause_listening()
@@ -134,18 +157,44 @@ class RecognizerService(BasePlugin):
                 di = dt * self.max_di_dt
             self.integral += di
 
-    def record_phrase(self) -> AudioData:
-        """Records until a period of silence"""
+    def _mute_end(self, mute: Playback) -> int:
+        """Bus position where a finished sound stopped reaching the microphone"""
+        end_time = mute.end_time or monotonic()
+        byte_rate = self.sample_rate * self.sample_width * self.channels
+        return self.bus.written + int((end_time - monotonic()) * byte_rate)
+
+    def record_phrase(self, mute: Playback = None) -> AudioData:
+        """
+        Records until a period of silence, starting where the last wake word ended
+
+        Args:
+            mute: Sound starting now, like the listening earcon. Audio captured
+                while it plays is silenced and left out of the endpointing
+        """
         log.info('Recording...')
+        mute_start = self.bus.written if mute else None
+        mute_end = None
         raw_audio = b'\0' * self.sample_width
         self.integral = 0
         self.noise_level = 0
         total_sec = 0
+        start = None
+        if self.wake_word_end is not None:
+            pre_roll = int(self.config['pre_roll_sec'] * self.sample_rate)
+            start = self.wake_word_end - pre_roll * self.sample_width * self.channels
+            self.wake_word_end = None
+        recorder = self.bus.cursor('recorder', start)
         while total_sec < self.recording_timeout:
             self._check_intercept()
-            chunk = self.stream.read(self.chunk_size)
-            raw_audio += chunk
+            chunk = self._read_chunk(recorder)
             total_sec += self.chunk_sec
+            if mute_start is not None and recorder.position > mute_start:
+                if mute_end is None and mute.finished.is_set():
+                    mute_end = self._mute_end(mute)
+                if mute_end is None or recorder.position - len(chunk) < mute_end:
+                    raw_audio += b'\0' * len(chunk)
+                    continue
+            raw_audio += chunk
             energy = self._calc_energy(chunk)
             self.update_energy(energy)
             if self.integral > self.required_integral and self.noise_level == 0:
@@ -155,12 +204,20 @@ class RecognizerService(BasePlugin):
         return AudioData(raw_audio, self.sample_rate, self.sample_width)
 
     def on_exit(self):
+        self.bus.close()
         self.stream.stop_stream()
         self.stream.close()
         self.p.terminate()
         self.engine.shutdown()
 
-    def on_activation(self):
-        """Called by child classes"""
+    def on_activation(self, position: int = None):
+        """
+        Called by the wake word engine
+
+        Args:
+            position: Bus position where the wake word ended, if the engine
+                lags behind the audio given to it
+        """
         log.info('Heard wake word!')
+        self.wake_word_end = self.wake_word_audio.position if position is None else position
         self._has_activated = True
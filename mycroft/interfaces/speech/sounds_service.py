@@ -0,0 +1,67 @@
+from os.path import isfile, splitext
+from threading import Thread
+
+import pyaudio
+
+from mycroft.plugin.base_plugin import BasePlugin
+from mycroft.util import log
+from mycroft.util.audio import Mixer, Playback, load_pcm, play_audio
+
+
+class SoundsService(BasePlugin):
+    """Plays short sounds, like the listening earcons, through an output stream that stays open"""
+    _config = {
+        'sample_rate': 44100,
+        'channels': 2,
+        'chunk_size': 256
+    }
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        self.sample_rate = self.config['sample_rate']
+        self.channels = self.config['channels']
+        self.mixer = Mixer(self.sample_rate, self.channels)
+        self.sounds = {}
+
+        for path in [rt.paths.audio_start_listening, rt.paths.audio_stop_listening]:
+            if isfile(path) and splitext(path)[-1] == '.wav':
+                self.sounds[path] = load_pcm(path, self.sample_rate, self.channels)
+
+        self.p = pyaudio.PyAudio()
+        try:
+            self.stream = self.p.open(format=pyaudio.paInt16, channels=self.channels,
+                                      rate=self.sample_rate, output=True,
+                                      frames_per_buffer=self.config['chunk_size'],
+                                      stream_callback=self._callback)
+        except (OSError, ValueError) as e:
+            log.warning('Playing sounds with play_audio. Could not open output stream --', e)
+            self.stream = None
+        else:
+            self.mixer.latency = self.stream.get_output_latency()
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        return self.mixer.render(frame_count), pyaudio.paContinue
+
+    def play(self, path: str, delay=0.0) -> Playback:
+        """Start playing a sound after delay seconds. Wait on the result to know when it ended"""
+        if self.stream:
+            data = self.sounds.get(path)
+            if data is None and splitext(path)[-1] == '.wav' and isfile(path):
+                data = self.sounds[path] = load_pcm(path, self.sample_rate, self.channels)
+            if data is not None:
+                return self.mixer.schedule(data, delay)
+
+        playback = Playback(b'', 0, 1)
+        if isfile(path):
+            process = play_audio(path)
+            Thread(target=lambda: (process.wait(), playback.finished.set()), daemon=True).start()
+        else:
+            log.debug('Missing sound:', path)
+            playback.finished.set()
+        return playback
+
+    def on_exit(self):
+        if self.stream:
+            self.stream.stop_stream()
+            self.stream.close()
+        self.p.terminate()
@@ -0,0 +1,49 @@
+from speech_recognition import UnknownValueError
+
+from mycroft.interfaces.speech.stt.stt_plugin import NoWordsError, SttPlugin
+from mycroft.plugin.util import load_class, load_plugin
+from mycroft.util import log
+from mycroft.util.hedge import Hedger
+
+
+class HedgedStt(SttPlugin):
+    """Sends each recording to several STT backends and uses the first transcription"""
+    _config = {
+        'backends': ['mycroft', 'google'],  # Initial order. Faster backends move up over time
+        'hedge_delay': 0.5,  # Seconds to wait for one backend before starting the next
+        'timeout': 10.0
+    }
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        base_path = self._plugin_path.rsplit('.', 1)[0]
+        backends = {}
+        for name in self.config['backends']:
+            cls = load_class('mycroft.interfaces.speech.stt', '_stt', name, base_path)
+            plugin = load_plugin(cls, [rt], {})
+            if plugin:
+                backends[name] = self._no_words_check(plugin.transcribe)
+        if not backends:
+            raise RuntimeError('No STT backends could be loaded')
+        # Finding no words is an answer, so silence isn't sent to every backend
+        self.hedger = Hedger(
+            backends, self.config['hedge_delay'], self.config['timeout'],
+            conclusive=(NoWordsError,)
+        )
+
+    @staticmethod
+    def _no_words_check(transcribe):
+        def wrapper(audio):
+            try:
+                text = transcribe(audio)
+            except UnknownValueError as e:  # From speech_recognition backends
+                raise NoWordsError('Found no words') from e
+            if not text or not text.strip():
+                raise NoWordsError('Found no words')
+            return text
+        return wrapper
+
+    def transcribe(self, audio):
+        name, text = self.hedger.call(audio)
+        log.debug('Transcribed by', name, '-- Latencies:', self.hedger.latency)
+        return text
@@ -20,17 +20,37 @@
 # specific language governing permissions and limitations
 # under the License.
 from mycroft.api import STTApi
-from mycroft.interfaces.speech.stt.stt_plugin import SttPlugin
+from mycroft.interfaces.speech.stt.stt_plugin import NoWordsError, SttPlugin
+from mycroft.util import log
+from mycroft.util.audio import encode_flac, trim_silence
 
 
 class MycroftStt(SttPlugin):
+    _config = {
+        'trim_silence': True
+    }
+
     def __init__(self, rt):
         super().__init__(rt)
 
         self.api = STTApi(rt)
+        try:
+            import soundfile  # noqa: F401
+            self.in_process = True
+        except (ImportError, OSError):
+            log.warning('Install soundfile to encode audio without running flac')
+            self.in_process = False
+
+    def _encode(self, audio) -> bytes:
+        raw_audio = audio.frame_data
+        if self.config['trim_silence']:
+            raw_audio = trim_silence(raw_audio, audio.sample_rate, audio.sample_width)
+        if self.in_process:
+            return encode_flac(raw_audio, audio.sample_rate, audio.sample_width)
+        return type(audio)(raw_audio, audio.sample_rate, audio.sample_width).get_flac_data()
 
     def transcribe(self, audio):
-        result = self.api.stt(audio.get_flac_data(), self.lang, 1)
+        result = self.api.stt(self._encode(audio), self.lang, 1)
         if not result:
-            raise ValueError
+            raise NoWordsError('Found no words')
         return result[0]
@@ -26,6 +26,10 @@ from speech_recognition import AudioData
 from mycroft.plugin.base_plugin import BasePlugin
 
 
+class NoWordsError(ValueError):
+    """The audio was transcribed but contained no speech"""
+
+
 class SttPlugin(BasePlugin):
     def __init__(self, rt):
         super().__init__(rt)
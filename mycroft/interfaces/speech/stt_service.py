@@ -7,7 +7,7 @@ class SttService(BasePlugin, OptionPlugin, metaclass=OptionMeta, base=SttPlugin,
                  package='mycroft.interfaces.speech.stt', suffix='_stt', default='mycroft'):
     _config = {
         'module': 'mycroft',
-        'module.options': ['mycroft', 'google', 'ibm', 'wit']
+        'module.options': ['mycroft', 'google', 'ibm', 'wit', 'hedged']
     }
 
     def __init__(self, rt, plugin_base):
@@ -86,7 +86,7 @@ class PocketsphinxEngine(WakeWordEnginePlugin):
     def continue_listening(self):
         pass
 
-    def update(self, raw_audio: bytes):
+    def update(self, raw_audio: bytes, position: int = None):
         self.buffer = self.buffer[len(raw_audio):] + raw_audio
 
         transcription = self._transcribe(self.buffer + self.padding)
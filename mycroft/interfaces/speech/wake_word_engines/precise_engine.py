@@ -19,17 +19,37 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import os
 import platform
-from os.path import join
+from collections import deque
+from os.path import isfile, join
 from shutil import which
-from typing import Callable
+from subprocess import PIPE, Popen
+from threading import Lock, Thread
+from time import monotonic, sleep
+from typing import Callable, Optional
 
 from mycroft.interfaces.speech.wake_word_engines.wake_word_engine_plugin import WakeWordEnginePlugin
 from mycroft.util import log
 from mycroft.util.misc import download_extract_tar
+from mycroft.util.parallel import run_parallel
 
 
 class PreciseEngine(WakeWordEnginePlugin):
+    """
+    Runs the precise-engine program on the recognizer's audio
+
+    Chunks given to update() are written to the program's stdin without
+    blocking. A thread reads its predictions and triggers activations. It
+    prints one prediction per chunk, so counting them tells which audio
+    bus position an activation belongs to
+    """
+    _config = {
+        'sensitivity': 0.5,
+        'trigger_level': 3,  # Chunks above the threshold needed to activate
+        'max_backlog_sec': 1.0,  # Audio queued for the program before old chunks are dropped
+        'max_restart_delay': 60.0  # Longest wait in seconds before restarting a crashed program
+    }
     program_url = (
         'https://raw.githubusercontent.com/MycroftAI/'
         'precise-data/dist/{arch}/precise-engine.tar.gz'
@@ -44,33 +64,162 @@ class PreciseEngine(WakeWordEnginePlugin):
 
         exe_file = which('precise-engine')
         precise_folder = join(self.rt.paths.user_config, 'precise')
-        if not exe_file:
-            exe_file = join(precise_folder, 'precise-engine', 'precise-engine')
+        model_folder = join(precise_folder, 'models', self.wake_word)
+        model_file = join(model_folder, self.wake_word + '.pb')
+        model_url = self.model_url.format(model_name=self.wake_word)
+
+        def download_engine():
             download_extract_tar(
                 self.program_url.format(arch=platform.machine()),
                 precise_folder, check_md5=False, subdir='precise-engine',
                 on_update=lambda: self.rt.interfaces.faceplate.text('Updating listener...'),
                 on_complete=lambda: self.rt.interfaces.faceplate.reset()
             )
-        log.debug('Using precise executable: ' + exe_file)
 
-        model_folder = join(precise_folder, 'models', self.wake_word)
-        model_file = join(model_folder, self.wake_word + '.pb')
-        model_url = self.model_url.format(model_name=self.wake_word)
-        download_extract_tar(model_url, model_folder, check_md5=True)
+        def download_model():
+            download_extract_tar(model_url, model_folder, check_md5=True)
 
-        from precise_runner import PreciseRunner, PreciseEngine
-        engine = PreciseEngine(exe_file, model_file, chunk_size=1024)
-        self.runner = PreciseRunner(engine, on_activation=on_activation)
+        downloads = [download_model]
+        if not exe_file:
+            exe_file = join(precise_folder, 'precise-engine', 'precise-engine')
+            downloads.append(download_engine)
+        run_parallel(downloads, label='Downloading precise')
+        for file_name in [exe_file, model_file]:
+            if not isfile(file_name):
+                raise RuntimeError('Missing precise file: ' + file_name)
+        log.debug('Using precise executable: ' + exe_file)
+
+        self.args = [exe_file, model_file]
+        self.chunk_bytes = self.rec_config['chunk_size'] * self.rec_config['sample_width']
+        self.max_backlog = int(
+            self.config['max_backlog_sec'] * self.rec_config['sample_rate']
+        ) * self.rec_config['sample_width']
+        self.proc = None
+        self.backlog = bytearray()
+        self.backlog_end = 0  # Bus position of the end of the backlog
+        self.sent = 0  # Bytes written to the current program
+        self.sent_ends = deque()  # (self.sent, bus position) after each write
+        self.listen_from = 0  # Predictions for audio sent before this are ignored
+        self.write_lock = Lock()
+        self.listening = False
+        self.activation = 0
+        self.stopping = False
+        self.restart_delay = 0.0
 
     def startup(self):
-        self.runner.start()
+        self.stopping = False
+        self._start()
+
+    def _start(self):
+        proc = Popen(self.args + [str(self.chunk_bytes)], stdin=PIPE, stdout=PIPE)
+        os.set_blocking(proc.stdin.fileno(), False)
+        with self.write_lock:
+            self.proc = proc
+            self.backlog.clear()
+            self.sent = self.listen_from = 0
+            self.sent_ends.clear()
+        Thread(target=self._read_predictions, args=[proc], daemon=True).start()
 
     def shutdown(self):
-        self.runner.stop()
+        self.stopping = True
+        with self.write_lock:
+            proc, self.proc = self.proc, None
+        if proc:
+            proc.kill()
+            proc.wait()
 
     def continue_listening(self):
-        self.runner.play()
+        with self.write_lock:
+            # Audio that may have triggered the last activation is still queued or in the pipe
+            self.backlog.clear()
+            self.listen_from = self.sent
+            self.activation = 0
+        self.listening = True
 
     def pause_listening(self):
-        self.runner.pause()
+        self.listening = False
+
+    def update(self, audio_buffer: bytes, position: int = None):
+        with self.write_lock:
+            proc = self.proc
+            if not proc:
+                return
+            self.backlog += audio_buffer
+            self.backlog_end = self.backlog_end + len(audio_buffer) if position is None \
+                else position
+            if len(self.backlog) > self.max_backlog:
+                excess = len(self.backlog) - self.max_backlog
+                del self.backlog[:excess + (-excess % self.chunk_bytes)]
+                log.warning('Precise is falling behind. Dropped audio')
+            try:
+                written = os.write(proc.stdin.fileno(), self.backlog)
+            except BlockingIOError:
+                return
+            except BrokenPipeError:  # Exited. _read_predictions restarts it
+                self.backlog.clear()
+                return
+            self.sent += written
+            self.sent_ends.append((self.sent, self.backlog_end - len(self.backlog) + written))
+            del self.backlog[:written]
+
+    def _position(self, consumed: int) -> Optional[int]:
+        """Bus position of the end of the first consumed bytes sent to the program"""
+        with self.write_lock:
+            while self.sent_ends and self.sent_ends[0][0] < consumed:
+                self.sent_ends.popleft()
+            if not self.sent_ends:
+                return None
+            sent, bus_end = self.sent_ends[0]
+            return bus_end - (sent - consumed)
+
+    def _read_predictions(self, proc: Popen):
+        started = monotonic()
+        consumed = 0
+        for line in proc.stdout:
+            try:
+                probability = float(line)
+            except ValueError:
+                continue
+            consumed += self.chunk_bytes
+            if self.proc is not proc:
+                continue
+            position = self._position(consumed)
+            if not self.listening or consumed <= self.listen_from:
+                continue
+            if self._update_trigger(probability):
+                self.on_activation(position)
+        code = proc.wait()
+        if self.proc is proc and not self.stopping:
+            self._restart(proc, code, monotonic() - started)
+
+    def _restart(self, proc: Popen, code: int, uptime: float):
+        """Start the program again, waiting longer each time it keeps crashing"""
+        max_delay = self.config['max_restart_delay']
+        if uptime > max_delay:
+            self.restart_delay = 0.0
+        while self.proc is proc and not self.stopping:
+            self.restart_delay = min(max_delay, max(1.0, self.restart_delay * 2))
+            log.error('Precise engine stopped with code', code,
+                      '-- Restarting in {:.0f}s'.format(self.restart_delay))
+            sleep(self.restart_delay)
+            if self.proc is not proc or self.stopping:
+                return
+            try:
+                self._start()
+                return
+            except OSError as e:
+                code = e.__class__.__name__ + ': ' + str(e)
+
+    def _update_trigger(self, probability: float) -> bool:
+        """Activate after trigger_level chunks above the threshold, then cool down"""
+        chunk_activated = probability > 1.0 - self.config['sensitivity']
+        if chunk_activated or self.activation < 0:
+            self.activation += 1
+            if self.activation > self.config['trigger_level']:
+                self.activation = -(8 * 2048) // self.chunk_bytes
+                return True
+            if chunk_activated and self.activation < 0:
+                self.activation = -(8 * 2048) // self.chunk_bytes
+        elif self.activation > 0:
+            self.activation -= 1
+        return False
@@ -5,7 +5,12 @@ from mycroft.plugin.base_plugin import BasePlugin
 
 
 class WakeWordEnginePlugin(BasePlugin):
-    """Engine that runs self.on_activation() when it hears a wake word"""
+    """
+    Engine that runs self.on_activation() when it hears a wake word
+
+    Engines that detect the wake word after update() returns pass the
+    position given with the audio that triggered it, on_activation(position)
+    """
     def __init__(self, rt, on_activation: Callable):
         super().__init__(rt)
         self.on_activation = on_activation
@@ -30,5 +35,10 @@ class WakeWordEnginePlugin(BasePlugin):
     def pause_listening(self):
         pass
 
-    def update(self, audio_buffer: bytes):
+    def update(self, audio_buffer: bytes, position: int = None):
+        """
+        Args:
+            audio_buffer: Next chunk of microphone audio
+            position: Audio bus position of the end of audio_buffer
+        """
         pass
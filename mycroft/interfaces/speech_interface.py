@@ -20,17 +20,19 @@
 # specific language governing permissions and limitations
 # under the License.
 from contextlib import suppress
-from os.path import isfile
+from threading import Thread
 
 from requests.exceptions import RequestException
 
 from mycroft.interfaces.interface_plugin import InterfacePlugin
 
 from mycroft.interfaces.speech.recognizer_service import RecognizerService
+from mycroft.interfaces.speech.sounds_service import SoundsService
 from mycroft.interfaces.speech.stt_service import SttService
 from mycroft.interfaces.speech.stt.stt_plugin import SttPlugin
 from mycroft.util import log
-from mycroft.util.audio import play_audio
+from mycroft.util.metrics import timer
+from mycroft.util.misc import safe_run
 
 
 class NewQuerySignal(Exception):
@@ -54,6 +56,9 @@ class SpeechInterface(InterfacePlugin):
         RecognizerService._plugin_path = self._plugin_path + '.recognizer'
         RecognizerService._attr_name = 'recognizer'
         self.recognizer = RecognizerService(rt)
+        SoundsService._plugin_path = self._plugin_path + '.sounds'
+        SoundsService._attr_name = 'sounds'
+        self.sounds = SoundsService(rt)
 
     def run(self):
         while not self.rt.main_thread.quit_event.is_set():
@@ -78,29 +83,33 @@ class SpeechInterface(InterfacePlugin):
     def on_exit(self):
         self.recognizer.intercept(SystemExit)
         self.recognizer.on_exit()
+        self.sounds.on_exit()
 
     def record_phrase(self) -> str:
         """Record and transcribe a question from the user. Can raise NewQuerySignal"""
-        self.rt.interfaces.faceplate.listen()
-        self._play_sound(self.rt.paths.audio_start_listening)
-        recording = self.recognizer.record_phrase()
-        self._play_sound(self.rt.paths.audio_stop_listening)
-        self.rt.interfaces.faceplate.reset()
+        faceplate = self.rt.interfaces.faceplate
+        with timer('record'):
+            # Recording starts right where the wake word ended while these catch up
+            listen = Thread(target=safe_run, args=[faceplate.listen], daemon=True)
+            listen.start()
+            earcon = self.sounds.play(self.rt.paths.audio_start_listening)
+            recording = self.recognizer.record_phrase(mute=earcon)
+            self.sounds.play(self.rt.paths.audio_stop_listening)
+            Thread(target=safe_run, args=[lambda: (listen.join(), faceplate.reset())],
+                   daemon=True).start()
         return self._get_transcription(recording)
 
     def _get_transcription(self, recording):
         utterance = ''
         try:
-            utterance = self.stt.transcribe(recording)
+            with timer('stt'):
+                utterance = self.stt.transcribe(recording)
         except ValueError:
             log.info('Found no words in audio')
         except RequestException:
             log.exception('Speech Client')
+        except TimeoutError as e:
+            log.warning('Speech to text timed out --', e)
         else:
             log.info('Utterance: ' + utterance)
         return utterance
-
-    @staticmethod
-    def _play_sound(path):
-        if isfile(path):
-            play_audio(path)
@@ -24,6 +24,7 @@ from threading import Event
 from mycroft.interfaces.interface_plugin import InterfacePlugin
 from mycroft.interfaces.tts.tts_plugin import TtsPlugin
 from mycroft.plugin.option_plugin import OptionMeta, OptionPlugin
+from mycroft.util.metrics import timer
 
 
 class TtsInterface(
@@ -40,7 +41,8 @@ class TtsInterface(
         self.event = Event()
 
     def on_response(self, package):
-        self.read(package.speech)
+        with timer('tts'):
+            self.read(package.speech)
         self.event.set()
         self.event.clear()
 
@@ -0,0 +1,126 @@
+import asyncio
+import json
+from typing import Union
+from urllib.parse import urlparse
+
+from tornado.ioloop import IOLoop
+from tornado.web import Application
+from tornado.websocket import WebSocketHandler, WebSocketClosedError
+
+from mycroft.interfaces.interface_plugin import InterfacePlugin
+from mycroft.package_cls import Package
+from mycroft.util import log
+
+
+class QueryConnection(WebSocketHandler):
+    """
+    A single client. Receives only the responses to its own queries
+
+    Messages:
+        client: {"type": "query", "id": 1, "text": "what time is it"}
+        server: {"type": "response", "id": 1, "package": {"text": "It's 5:30", ...}}
+        server: {"type": "error", "id": 1, "error": "Too many pending queries"}
+        server: {"type": "consumed", "id": 2}  (Answer to a skill's follow up question)
+    """
+
+    def initialize(self, interface: 'WebsocketInterface'):
+        self.interface = interface
+        self.config = interface.config
+        self.loop = IOLoop.current()
+        self.session_id = None
+        self.pending = set()  # Ids of queries without a response yet
+        self.unsent = 0  # Messages not yet flushed to the socket
+
+    def check_origin(self, origin):
+        if urlparse(origin).netloc in self.config['allowed_origins']:
+            return True
+        return super().check_origin(origin)
+
+    def open(self):
+        self.interface.connections.add(self)
+        self.session_id = self.interface.rt.query.create_session(self.on_package)
+
+    def on_close(self):
+        self.interface.connections.discard(self)
+        self.interface.rt.query.close_session(self.session_id)
+
+    def on_message(self, message):
+        try:
+            data = json.loads(message)
+            query_id, query = data.get('id'), data['text']
+        except (ValueError, KeyError, TypeError, AttributeError):
+            self.send({'type': 'error', 'id': None, 'error': 'Invalid message'})
+            return
+        if query_id in self.pending:
+            self.send({'type': 'error', 'id': query_id, 'error': 'Query id already in use'})
+            return
+        if len(self.pending) >= self.config['max_pending']:
+            self.send({'type': 'error', 'id': query_id, 'error': 'Too many pending queries'})
+            return
+        self.pending.add(query_id)
+        self.interface.rt.query.send(query, self.session_id, query_id)
+
+    def on_package(self, package: Package, query_id):
+        """Called from the query thread with each response of the session"""
+        if package is None:
+            message = {'type': 'consumed', 'id': query_id}
+        else:
+            message = {'type': 'response', 'id': query_id,
+                       'package': self.interface.rt.package.to_json_dict(package)}
+        self.loop.add_callback(self.on_response, query_id, json.dumps(message, default=str))
+
+    def on_response(self, query_id, message: str):
+        self.pending.discard(query_id)
+        self.send(message)
+
+    def send(self, message: Union[str, dict]):
+        """Write a message unless the client has stopped reading, in which case disconnect it"""
+        if self.unsent >= self.config['max_unsent']:
+            log.warning('Closing websocket client that stopped reading:', self.request.remote_ip)
+            self.close(1008, 'Not reading responses')
+            return
+        try:
+            future = self.write_message(message)
+        except WebSocketClosedError:
+            return
+        self.unsent += 1
+        future.add_done_callback(self._on_sent)
+
+    def _on_sent(self, future):
+        self.unsent -= 1
+        future.exception()  # Closed connections are handled by on_close
+
+
+class WebsocketInterface(InterfacePlugin):
+    """Serves queries from many remote clients, such as companion apps, over websockets"""
+    _config = {
+        'enabled': False,
+        'host': '127.0.0.1',
+        'port': 8181,
+        'route': '/query',
+        'allowed_origins': [],  # ie. ['app.example.com'], besides the server's own host
+        'max_pending': 4,  # Queries a client can have in progress before new ones are refused
+        'max_unsent': 64  # Responses buffered for a client before it gets disconnected
+    }
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        if not self.config['enabled']:
+            raise NotImplementedError('Websocket interface disabled')
+        self.connections = set()
+        self.loop = None
+
+    def run(self):
+        asyncio.set_event_loop(asyncio.new_event_loop())
+        self.loop = IOLoop.current()
+        app = Application([(self.config['route'], QueryConnection, {'interface': self})])
+        app.listen(self.config['port'], self.config['host'])
+        log.info('Serving websocket at ws://{}:{}{}'.format(
+            self.config['host'], self.config['port'], self.config['route']
+        ))
+        self.loop.start()
+
+    def _unload_plugin(self):
+        super()._unload_plugin()
+        if self.loop:
+            self.loop.add_callback(self.loop.stop)
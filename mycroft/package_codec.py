@@ -0,0 +1,188 @@
+import json
+import marshal
+import pickle
+import struct
+from inspect import isclass
+from zlib import crc32
+
+from mycroft.intent_match import IntentMatch
+from mycroft.package_cls import Package, BoolAttr
+
+#: Increment when the layout written by PackageCodec changes
+FORMAT_VERSION = 1
+
+MAGIC = b'MP'
+HEADER = struct.Struct('<2sBBI')  # magic, format version, body encoding, schema id
+
+MARSHAL_BODY = 0
+PICKLE_BODY = 1
+
+VALUE, SUB_PACKAGE, BOOL_ATTR, MATCH = range(4)
+
+
+def describe_struct(desc) -> str:
+    """Canonical text form of a package struct, used to identify its layout"""
+    if isinstance(desc, dict):
+        return '{' + ','.join(k + ':' + describe_struct(desc[k]) for k in sorted(desc)) + '}'
+    if isinstance(desc, (list, set, tuple)):
+        return type(desc).__name__ + '(' + ','.join(describe_struct(i) for i in desc) + ')'
+    if isclass(desc):
+        return desc.__name__
+    return repr(desc)
+
+
+def _pack_match(match):
+    if isinstance(match, IntentMatch):
+        return match.intent_id, match.confidence, match.matches, match.query
+    return match
+
+
+def _unpack_match(value):
+    if isinstance(value, (list, tuple)):
+        return IntentMatch(*value)
+    if isinstance(value, dict):
+        return IntentMatch(**value)
+    return value
+
+
+class PackageCodec:
+    """
+    Encodes packages laid out by a given package struct
+
+    Binary mode stores attribute values positionally in struct key order,
+    so both ends must use codecs built from the same struct. Every
+    message starts with the schema id of that struct to detect mismatches.
+    JSON mode stores values by name and is meant for logging and replay.
+
+    Usage:
+        >>> codec = PackageCodec({'text': str, 'eyes': {'blink': ()}})
+        >>> p = codec.decode(codec.encode(my_package))
+    """
+
+    def __init__(self, package_struct: dict):
+        self.struct = package_struct
+        self.schema_id = crc32(describe_struct(package_struct).encode())
+        self.fields = []
+        for key in sorted(package_struct):
+            desc = package_struct[key]
+            if isinstance(desc, dict):
+                self.fields.append((key, SUB_PACKAGE, PackageCodec(desc)))
+            elif desc == ():
+                self.fields.append((key, BOOL_ATTR, None))
+            elif desc is IntentMatch:
+                self.fields.append((key, MATCH, None))
+            else:
+                self.fields.append((key, VALUE, desc))
+        self.keys = frozenset(package_struct)
+
+    def pack(self, p: Package) -> tuple:
+        """Convert package into a tuple of builtin values"""
+        attrs = p.__dict__
+        values = []
+        for key, kind, info in self.fields:
+            value = attrs.get(key)
+            if kind == SUB_PACKAGE:
+                value = info.pack(value) if isinstance(value, Package) else None
+            elif kind == BOOL_ATTR:
+                value = bool(value)
+            elif kind == MATCH:
+                value = _pack_match(value)
+            values.append(value)
+        values.append({
+            k: v for k, v in attrs.items() if k not in self.keys and not k.startswith('_')
+        })
+        return tuple(values)
+
+    def unpack(self, values: tuple, p: Package = None) -> Package:
+        """Fill package (or a new one) with values created by pack()"""
+        p = Package(self.struct) if p is None else p
+        attrs = p.__dict__
+        for (key, kind, info), value in zip(self.fields, values):
+            if kind == SUB_PACKAGE:
+                if value is not None:
+                    sub = attrs.get(key)
+                    attrs[key] = info.unpack(value, sub if isinstance(sub, Package) else None)
+            elif kind == BOOL_ATTR:
+                attrs[key] = BoolAttr(value)
+            elif kind == MATCH:
+                attrs[key] = _unpack_match(value)
+            else:
+                attrs[key] = value
+        attrs.update(values[-1])
+        return p
+
+    def encode(self, p: Package) -> bytes:
+        values = self.pack(p)
+        try:
+            body, encoding = marshal.dumps(values), MARSHAL_BODY
+        except ValueError:  # Skill data contains objects marshal can't handle
+            body, encoding = pickle.dumps(values, pickle.HIGHEST_PROTOCOL), PICKLE_BODY
+        return HEADER.pack(MAGIC, FORMAT_VERSION, encoding, self.schema_id) + body
+
+    @staticmethod
+    def read_header(data: bytes) -> tuple:
+        """Returns (body encoding, schema id) of an encoded package"""
+        magic, version, encoding, schema_id = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError('Data is not an encoded package')
+        if version != FORMAT_VERSION:
+            raise ValueError('Unsupported package format version: {}'.format(version))
+        return encoding, schema_id
+
+    def decode(self, data: bytes, p: Package = None) -> Package:
+        encoding, schema_id = self.read_header(data)
+        if schema_id != self.schema_id:
+            raise ValueError('Package was encoded with a different struct')
+        body = memoryview(data)[HEADER.size:]
+        values = marshal.loads(body) if encoding == MARSHAL_BODY else pickle.loads(body)
+        return self.unpack(values, p)
+
+    def to_json_dict(self, p: Package) -> dict:
+        attrs = p.__dict__
+        out = {}
+        for key, kind, info in self.fields:
+            value = attrs.get(key)
+            if kind == SUB_PACKAGE:
+                value = info.to_json_dict(value) if isinstance(value, Package) else None
+            elif kind == BOOL_ATTR:
+                value = bool(value)
+            elif kind == MATCH and isinstance(value, IntentMatch):
+                value = dict(vars(value))
+            out[key] = value
+        out.update({
+            k: v for k, v in attrs.items() if k not in self.keys and not k.startswith('_')
+        })
+        return out
+
+    def from_json_dict(self, data: dict, p: Package = None) -> Package:
+        p = Package(self.struct) if p is None else p
+        attrs = p.__dict__
+        fields = {key: (kind, info) for key, kind, info in self.fields}
+        for key, value in data.items():
+            kind, info = fields.get(key, (VALUE, None))
+            if kind == SUB_PACKAGE:
+                if value is not None:
+                    sub = attrs.get(key)
+                    value = info.from_json_dict(value, sub if isinstance(sub, Package) else None)
+            elif kind == BOOL_ATTR:
+                value = BoolAttr(value)
+            elif kind == MATCH:
+                value = _unpack_match(value)
+            elif isinstance(info, tuple) and isinstance(value, list):
+                value = tuple(value)  # JSON has no tuples
+            attrs[key] = value
+        return p
+
+    def encode_json(self, p: Package, **kwargs) -> str:
+        return json.dumps({
+            'version': FORMAT_VERSION,
+            'schema': self.schema_id,
+            'package': self.to_json_dict(p)
+        }, **kwargs)
+
+    def decode_json(self, text: str, p: Package = None) -> Package:
+        """Decode by attribute name. Works across struct changes"""
+        data = json.loads(text)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError('Unsupported package format version: {}'.format(data.get('version')))
+        return self.from_json_dict(data['package'], p)
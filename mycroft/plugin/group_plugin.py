@@ -24,7 +24,8 @@ from abc import ABCMeta
 from functools import wraps
 from importlib import import_module
 from os.path import abspath
-from typing import Any, Type
+from threading import RLock
+from typing import Any, Type, Dict
 
 from mycroft.plugin.base_plugin import BasePlugin
 from mycroft.plugin.util import load_class, Empty
@@ -63,22 +64,37 @@ class GroupRunner(metaclass=ABCMeta):
 
 
 class GroupPlugin(metaclass=ABCMeta):
-    def __init__(self, *args, gp_order=None, gp_blacklist=None, **kwargs):
+    def __init__(self, *args, gp_order=None, gp_blacklist=None, gp_lazy=False, **kwargs):
         """
         Calls __init__ of all plugins, passing arguments to each plugin's __init__
         Args:
             gp_order (list): List of attribute names in load order.
                     Other attributes will be loaded after or where '*' is in list
+            gp_blacklist (list): Attribute names of plugins to never import
+            gp_lazy (bool): Only load plugins named in gp_order. The rest are
+                    imported and created the first time they are accessed
             gp_alter_class (Callable):
         """
         gp_order = [i for i in (gp_order or []) if i not in (gp_blacklist or [])]
         self._plugins = {}
+        self._lazy_lock = RLock()
         if not isinstance(type(self), GroupMeta):
             raise RuntimeError('{} must have GroupMeta as a metaclass'.format(
                 self.__class__.__name__
             ))
 
-        self._classes = self._load_classes(self._package_, self._suffix_, gp_blacklist or [])
+        if gp_lazy:
+            gp_order = [i for i in gp_order if i != '*']
+            self._index = self._index_modules(self._package_, self._suffix_, gp_blacklist or [])
+            self._classes = {}
+            for name in gp_order:
+                cls = name in self._index and self._load_indexed_class(name)
+                self._index.pop(name, None)  # Created below, not on first access
+                if cls:
+                    self._classes[name] = cls
+        else:
+            self._index = {}
+            self._classes = self._load_classes(self._package_, self._suffix_, gp_blacklist or [])
 
         gp_kwargs = self._extract_gp_kwargs(kwargs)
         alter_class = gp_kwargs.pop('alter_class', None)
@@ -102,11 +118,13 @@ class GroupPlugin(metaclass=ABCMeta):
                 return plugin
             return func
 
+        self._create_plugin = lambda cls: get_function(cls)(*args, **kwargs)
         self._init_threads = run_ordered_parallel(
             self._classes, get_function, args=args, kwargs=kwargs,
             order=gp_order, **gp_kwargs
         )
-        self.all = GroupRunner(self._base_, self._plugins)
+        if not self._index:
+            self.all = GroupRunner(self._base_, self._plugins)
 
     def _on_partial_load(self, plugin_name):
         """Override to specify behavior when a plugin gets partially loaded"""
@@ -120,19 +138,48 @@ class GroupPlugin(metaclass=ABCMeta):
                 gp_kwargs[name.replace('gp_', '')] = kwargs.pop(name)
         return gp_kwargs
 
-    def _load_classes(self, package, suffix, blacklist):
-        classes = (
-            load_class(
-                package, suffix, mod_name[:-len(suffix)], getattr(self, '_plugin_path', '')
-            )
+    @staticmethod
+    def _index_modules(package, suffix, blacklist) -> Dict[str, str]:
+        """Find plugin modules without importing them. Returns {'<name>': '<module path>'}"""
+        return {
+            mod_name[:-len(suffix)]: package + '.' + mod_name
             for folder in set(abspath(i) for i in import_module(package).__path__)
             for loader, mod_name, is_pkg in pkgutil.walk_packages([folder])
             if mod_name.endswith(suffix) and mod_name[:-len(suffix)] not in blacklist
+        }
+
+    def _load_indexed_class(self, name):
+        return load_class(self._package_, self._suffix_, name, getattr(self, '_plugin_path', ''))
+
+    def _load_classes(self, package, suffix, blacklist):
+        classes = (
+            load_class(package, suffix, name, getattr(self, '_plugin_path', ''))
+            for name in self._index_modules(package, suffix, blacklist)
         )
         return {
             cls._attr_name: cls for cls in classes if cls
         }
 
+    def _load_lazy(self, name):
+        """Import and create a plugin that was skipped by gp_lazy"""
+        with self._lazy_lock:
+            if name in self._index and name not in self._plugins:
+                try:
+                    cls = self._load_indexed_class(name)
+                    if cls:
+                        self._classes[name] = cls
+                        self._create_plugin(cls)
+                finally:
+                    # Only now, so other threads wait on the lock instead of finding nothing
+                    self._index.pop(name, None)
+            return self._plugins.get(name)
+
+    def _load_all(self):
+        for name in list(self._index):
+            self._load_lazy(name)
+        self.all = GroupRunner(self._base_, self._plugins)
+        return self.all
+
     def _make_name(self, cls):
         return to_snake(cls.__name__).replace(self._suffix_, '')
 
@@ -147,12 +194,21 @@ class GroupPlugin(metaclass=ABCMeta):
             raise AttributeError(item)
         if '_plugins' not in self.__dict__:
             raise AttributeError(item)
-        if item not in self._plugins:
-            log.warning(item, 'plugin does not exist.', stack_offset=1)
-            self._plugins[item] = Empty()
-        return self._plugins[item]
+        if item == 'all':
+            return self._load_all()
+        plugin = self._plugins.get(item)
+        if plugin is not None:
+            return plugin
+        with self._lazy_lock:
+            plugin = self._load_lazy(item)
+            if plugin is None:
+                log.warning(item, 'plugin does not exist.', stack_offset=1)
+                plugin = self._plugins[item] = Empty()
+        return plugin
 
     def __getitem__(self, item) -> Any:
+        if item not in self._plugins:
+            self._load_lazy(item)
         return self._plugins[item]
 
     def __iter__(self):
@@ -1,5 +1,8 @@
+from collections import OrderedDict
 from importlib import import_module
 from inspect import isclass
+from threading import local
+from time import monotonic
 from typing import Type
 
 from mycroft.plugin.base_plugin import BasePlugin
@@ -14,11 +17,43 @@ def update_dyn_attrs(cls: Type, suffix: str, base_path: str, custom_attr: str =
     return cls
 
 
+#: (self, cumulative) seconds spent importing each dynamically loaded module
+import_times = OrderedDict()
+_import_stack = local()
+
+
+def timed_import(module_name: str):
+    """import_module() that records how long the first import of each module took"""
+    if module_name in import_times:
+        return import_module(module_name)
+    stack = _import_stack.__dict__.setdefault('children', [])
+    stack.append(0.0)
+    start = monotonic()
+    try:
+        return import_module(module_name)
+    finally:
+        cumulative = monotonic() - start
+        children = stack.pop()
+        if stack:
+            stack[-1] += cumulative
+        import_times[module_name] = (cumulative - children, cumulative)
+
+
+def format_import_times() -> str:
+    """Report plugin import times in the same layout as `python -X importtime`"""
+    lines = ['import time: self [us] | cumulative | imported plugin']
+    for name, (self_time, cumulative) in import_times.items():
+        lines.append('import time: {:>9} | {:>10} | {}'.format(
+            int(self_time * 1e6), int(cumulative * 1e6), name
+        ))
+    return '\n'.join(lines)
+
+
 def load_class(package: str, suffix: str, module: str, plugin_path: str, attr_name: str = None):
     package = package + '.' + module + suffix
     log.debug('Loading {}{}...'.format(module, suffix))
     try:
-        mod = import_module(package)
+        mod = timed_import(package)
         cls_name = to_camel(module + suffix)
         cls = getattr(mod, cls_name, '')
         if not isclass(cls):
@@ -19,26 +19,37 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from typing import TYPE_CHECKING
+
 from mycroft.plugin.group_plugin import GroupPlugin, GroupMeta
-from mycroft.services.config_service import ConfigService
-from mycroft.services.contexts_service import ContextsService
-from mycroft.services.device_info_service import DeviceInfoService
-from mycroft.services.filesystem_service import FilesystemService
-from mycroft.services.identity_service import IdentityService
-from mycroft.services.intent_service import IntentService
-from mycroft.services.interfaces_service import InterfacesService
-from mycroft.services.main_thread_service import MainThreadService
-from mycroft.services.package_service import PackageService
-from mycroft.services.paths_service import PathsService
-from mycroft.services.plugin_versions_service import PluginVersionsService
-from mycroft.services.query_service import QueryService
-from mycroft.services.remote_key_service import RemoteKeyService
-from mycroft.services.scheduler_service import SchedulerService
 from mycroft.services.service_plugin import ServicePlugin
-from mycroft.services.skills_service import SkillsService
-from mycroft.services.transformers_service import TransformersService
 from mycroft.util import log
 
+if TYPE_CHECKING:
+    from mycroft.services.config_service import ConfigService
+    from mycroft.services.contexts_service import ContextsService
+    from mycroft.services.device_info_service import DeviceInfoService
+    from mycroft.services.filesystem_service import FilesystemService
+    from mycroft.services.identity_service import IdentityService
+    from mycroft.services.intent_service import IntentService
+    from mycroft.services.interfaces_service import InterfacesService
+    from mycroft.services.locales_service import LocalesService
+    from mycroft.services.metrics_service import MetricsService
+    from mycroft.services.traces_service import TracesService
+    from mycroft.services.main_thread_service import MainThreadService
+    from mycroft.services.package_service import PackageService
+    from mycroft.services.paths_service import PathsService
+    from mycroft.services.plugin_versions_service import PluginVersionsService
+    from mycroft.services.query_service import QueryService
+    from mycroft.services.remote_key_service import RemoteKeyService
+    from mycroft.services.scheduler_service import SchedulerService
+    from mycroft.services.skill_workers_service import SkillWorkersService
+    from mycroft.services.skills_service import SkillsService
+    from mycroft.services.transformers_service import TransformersService
+
+#: Services that BasePlugin.__init__ relies on. Loaded up front even in lazy mode
+CORE_SERVICES = ['config', 'package', 'scheduler', 'paths', 'filesystem', 'plugin_versions']
+
 
 class Root(
     GroupPlugin, metaclass=GroupMeta,
@@ -46,13 +57,19 @@ class Root(
 ):
     """Class to help autocomplete determine types of dynamic root object"""
 
-    def __init__(self, timeout=2.0, blacklist=None):
+    def __init__(self, timeout=2.0, blacklist=None, lazy=False):
+        """
+        Args:
+            timeout: Seconds to wait for service __init__ methods before moving on
+            blacklist: Names of services to never load
+            lazy: Only load CORE_SERVICES up front. Other services are
+                imported and created the first time they are accessed
+        """
         GroupPlugin.__init__(
-            self, self, gp_order=[
-                'config', 'package', 'scheduler', 'paths', 'filesystem', 'plugin_versions',
+            self, self, gp_order=CORE_SERVICES + ([] if lazy else [
                 'identity', 'device_info', 'remote_key', 'query', 'transformers', 'interfaces',
-                'intent', '*', 'skills', 'main_thread'
-            ], gp_timeout=timeout, gp_daemon=True, gp_blacklist=blacklist
+                'locales', 'intent', '*', 'skills', 'main_thread'
+            ]), gp_timeout=timeout, gp_daemon=True, gp_blacklist=blacklist, gp_lazy=lazy
         )
         for name, thread in self._init_threads.items():
             if thread.is_alive():
@@ -75,3 +92,7 @@ class Root(
         self.remote_key = ''  # type: RemoteKeyService
         self.plugin_versions = ''  # type: PluginVersionsService
         self.contexts = ''  # type: ContextsService
+        self.skill_workers = ''  # type: SkillWorkersService
+        self.locales = ''  # type: LocalesService
+        self.metrics = ''  # type: MetricsService
+        self.traces = ''  # type: TracesService
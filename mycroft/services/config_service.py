@@ -19,8 +19,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import json
 from genericpath import isfile
+from hashlib import md5
 from os.path import join, expanduser
+from threading import Event, Thread
 
 import yaml
 from pkg_resources import Requirement, resource_filename
@@ -29,6 +32,7 @@ from typing import Callable
 from mycroft.api import DeviceApi
 from mycroft.services.service_plugin import ServicePlugin
 from mycroft.util import log
+from mycroft.util.misc import recursive_merge, safe_run
 from mycroft.util.text import to_snake
 
 SYSTEM_CONFIG = '/etc/mycroft/mycroft.conf'
@@ -42,21 +46,70 @@ DEFAULT_CONFIG = resource_filename(Requirement.parse('mycroft-light'), 'mycroft/
 
 LOAD_ORDER = [DEFAULT_CONFIG, REMOTE_CACHE, SYSTEM_CONFIG, USER_CONFIG]
 
+_missing = object()
+
+
+def config_diff(old: dict, new: dict) -> dict:
+    """Parts of new that are missing or different in old"""
+    out = {}
+    for k, v in new.items():
+        old_v = old.get(k, _missing)
+        if isinstance(v, dict) and isinstance(old_v, dict):
+            changes = config_diff(old_v, v)
+            if changes:
+                out[k] = changes
+        elif old_v != v:
+            out[k] = v
+    return out
+
+
+def config_hash(config: dict) -> str:
+    return md5(json.dumps(config, sort_keys=True, default=str).encode()).hexdigest()
+
 
 class ConfigService(ServicePlugin, dict):
     def __init__(self, rt):
         ServicePlugin.__init__(self, rt)
         dict.__init__(self)
         self.handlers = {}
+        self.remote_api = None
+        self.remote_hash = None
+        self.stop_event = Event()
         self.load_local()
 
-    def load_remote(self, settings=None):
+    def load_remote(self, settings=None) -> bool:
+        """Fetch remote settings and apply the parts that changed. Returns if anything did"""
         log.debug('Loading remote config...')
         try:
-            self.__store_cache(settings or DeviceApi(self.rt).get_settings())
-            self.load_local()
+            if not settings:
+                self.remote_api = self.remote_api or DeviceApi(self.rt)
+                settings = self.remote_api.get_settings(conditional=True)
         except ConnectionError:
             log.exception('Loading Remote Config')
+            return False
+
+        config = {}
+        self.__conv(config, settings)
+        remote_hash = config_hash(config)
+        if remote_hash == self.remote_hash:
+            log.debug('Remote config is unchanged')
+            return False
+        self.remote_hash = remote_hash
+        self.__store_cache(config)
+        self.reload_local()
+        return True
+
+    def start_refresh(self):
+        """Check remote settings in the background"""
+        Thread(target=self._refresh_loop, daemon=True).start()
+
+    def _refresh_loop(self):
+        while not self.stop_event.is_set():
+            safe_run(self.load_remote, label='Refreshing remote config')
+            self.stop_event.wait(self['remote_refresh_interval'])
+
+    def _unload_plugin(self):
+        self.stop_event.set()
 
     def _update(self, out, inp, pos):
         for i in inp:
@@ -84,11 +137,28 @@ class ConfigService(ServicePlugin, dict):
                 config = config.setdefault(i, {})
         return config
 
-    def load_local(self):
+    def read_local(self):
+        """Generates the contents of each config file in LOAD_ORDER"""
         for file_name in LOAD_ORDER:
             if isfile(file_name):
                 with open(file_name) as f:
-                    self.inject(yaml.safe_load(f))
+                    config = yaml.safe_load(f) or {}
+                if file_name == REMOTE_CACHE:
+                    self.remote_hash = config_hash(config)
+                yield config
+
+    def load_local(self):
+        for config in self.read_local():
+            self.inject(config)
+
+    def reload_local(self):
+        """Inject only the values in config files that differ from the current config"""
+        merged = {}
+        for config in self.read_local():
+            merged = dict(recursive_merge(merged, config))
+        changes = config_diff(self, merged)
+        if changes:
+            self.inject(changes)
 
     def __conv(self, out, inp):
         """
@@ -118,10 +188,8 @@ class ConfigService(ServicePlugin, dict):
             out[mod] = out.get(mod, {})
             self.__conv(out[mod], v)
 
-    def __store_cache(self, setting):
+    def __store_cache(self, config):
         """Save last version of remote config for future use"""
-        config = {}
-        self.__conv(config, setting)
         with open(REMOTE_CACHE, 'w') as f:
             yaml.dump(config, f)
 
@@ -19,15 +19,18 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from heapq import heapify, heappop
 from inspect import signature
 from math import sqrt
-from typing import Callable, List, Union, Any
+from typing import Callable, Iterable, List, Union, Any
 
 from mycroft.intent_context import IntentContext
 from mycroft.intent_match import IntentMatch, MissingIntentMatch
 from mycroft.package_cls import Package
 from mycroft.services.service_plugin import ServicePlugin
 from mycroft.util import log
+from mycroft.util.metrics import timer
+from mycroft.util.tracing import span
 from mycroft.util.parallel import run_parallel
 
 
@@ -36,6 +39,9 @@ UNSET_ACTION = '__unset__'
 
 class IntentService(ServicePlugin):
     """Used to handle creating both intents and intent engines"""
+    _config = {
+        'max_matches': 16  # Most confident intent matches given to prehandlers
+    }
     _package_struct = {
         'data': dict,
         'skill': str,
@@ -142,11 +148,12 @@ class IntentService(ServicePlugin):
         log.info('Query:', query)
         query = query.strip().lower()
 
-        matches = self.context.calc_intents(query)
-        matches = [i for i in matches if i.confidence > 0.5]
+        matches = self.context.calc_intents(query, floor=0.5, k=self.config['max_matches'])
 
-        packages = self._run_prehandlers(matches)
-        result_package = self._try_run_packages([i for i in packages if i.confidence > 0.5])
+        with timer('prehandlers'):
+            packages = [i for i in self._run_prehandlers(matches) if i.confidence > 0.5]
+        with timer('handler'):
+            result_package = self._try_run_packages(packages)
         if result_package:
             return result_package
         log.info('No intents matched. Falling back.')
@@ -156,8 +163,10 @@ class IntentService(ServicePlugin):
             for intent_id in self.fallback_intents
         ]
 
-        packages = self._run_prehandlers(matches)
-        result_package = self._try_run_packages(list(packages))
+        with timer('fallback_prehandlers'):
+            packages = list(self._run_prehandlers(matches))
+        with timer('fallback_handler'):
+            result_package = self._try_run_packages(packages)
         if result_package:
             return result_package
         log.info('All fallbacks failed.')
@@ -177,16 +186,28 @@ class IntentService(ServicePlugin):
             p.confidence = 0.0
             return p
 
-    def _run_prehandlers(self, matches: List[IntentMatch]) -> List[Package]:
+    def run_local_handler(self, intent_id: str, handler_type: str, p: Package) -> Package:
+        """Run the prehandler or handler of an intent in this process"""
+        default = self.default_prehandler if handler_type == 'prehandler' else self.default_handler
+        handler = self.intent_data[intent_id].get(handler_type, default)
+        return self._run_handler(handler, p)
+
+    def _call_handler(self, intent_id: str, handler_type: str, p: Package) -> Package:
+        """Run the prehandler or handler of an intent, in a skill worker if the skill is isolated"""
+        if 'skill_workers' in self.rt and \
+                self.rt.skill_workers.is_isolated(self.intent_to_skill[intent_id]):
+            return self.rt.skill_workers.call(intent_id, handler_type, p)
+        return self.run_local_handler(intent_id, handler_type, p)
+
+    def _run_prehandlers(self, matches: Iterable[IntentMatch]) -> List[Package]:
         """Iterate through matches, executing prehandlers"""
         package_generators = []
         for match in matches:
             def callback(match=match):
-                data = self.intent_data[match.intent_id]
-                prehandler = data.get('prehandler', self.default_prehandler)
                 package = self.rt.package(match=match)
                 package.skill = self.intent_to_skill[match.intent_id]
-                return self._run_handler(prehandler, package)
+                with span('prehandler', intent=match.intent_id):
+                    return self._call_handler(match.intent_id, 'prehandler', package)
 
             package_generators.append(callback)
 
@@ -202,14 +223,15 @@ class IntentService(ServicePlugin):
 
     def _try_run_packages(self, packages: List[Package]) -> Union[Package, None]:
         """Iterates through packages, executing handlers until one succeeds"""
-        while len(packages) > 0:
-            package = max(packages, key=lambda x: x.confidence)
+        heap = [(-package.confidence, i, package) for i, package in enumerate(packages)]
+        heapify(heap)
+        while heap:
+            _, _, package = heappop(heap)
             intent_id = package.match.intent_id
-            del packages[packages.index(package)]
             log.info('Selected intent', intent_id, package.confidence)
             try:
-                handler = self.intent_data[intent_id].get('handler', self.default_handler)
-                return self._run_handler(handler, package)
+                with span('handler', intent=intent_id):
+                    return self._call_handler(intent_id, 'handler', package)
             except Exception:
                 log.exception(intent_id, 'callback')
         return None
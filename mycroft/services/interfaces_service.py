@@ -19,20 +19,28 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from mycroft.interfaces.faceplate_interface import FaceplateInterface
+from typing import TYPE_CHECKING
+
 from mycroft.interfaces.interface_plugin import InterfacePlugin
 from mycroft.plugin.group_plugin import GroupPlugin, GroupMeta
-from mycroft.interfaces.speech_interface import SpeechInterface
-from mycroft.interfaces.text_interface import TextInterface
-from mycroft.interfaces.tts_interface import TtsInterface
 from mycroft.services.service_plugin import ServicePlugin
 
+if TYPE_CHECKING:
+    from mycroft.interfaces.faceplate_interface import FaceplateInterface
+    from mycroft.interfaces.speech_interface import SpeechInterface
+    from mycroft.interfaces.text_interface import TextInterface
+    from mycroft.interfaces.tts_interface import TtsInterface
+
 
 class InterfacesService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=InterfacePlugin,
                         package='mycroft.interfaces', suffix='_interface'):
+    _config = {
+        'blacklist': []
+    }
+
     def __init__(self, rt):
         ServicePlugin.__init__(self, rt)
-        GroupPlugin.__init__(self, rt)
+        GroupPlugin.__init__(self, rt, gp_blacklist=self.config['blacklist'])
 
     def __type_hinting__(self):
         self.faceplate = ''  # type: FaceplateInterface
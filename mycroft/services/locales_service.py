@@ -0,0 +1,113 @@
+from os import walk
+from os.path import join, relpath, splitext
+from threading import Lock
+from typing import List, Optional
+
+from mycroft.services.service_plugin import ServicePlugin
+from mycroft.transformers.dialog_transformer import DialogTemplate
+from mycroft.util import log
+
+
+class LocaleIndex:
+    """Contents of every resource file in one skill's locale/<lang> folder"""
+    dialog_exts = ['.dialog', '.speech', '.text']
+    line_exts = ['.intent', '.entity', '.voc', '.txt']
+
+    def __init__(self, folder: str):
+        self.folder = folder
+        self.texts = {}
+        self.parsed = {}
+        self.reload()
+
+    def reload(self):
+        """Read all resource files with a single scan of the folder"""
+        self.texts.clear()
+        self.parsed.clear()
+        for root, dirs, files in walk(self.folder):
+            for file_name in files:
+                self.update(relpath(join(root, file_name), self.folder))
+
+    def update(self, file_name: str):
+        """Re-read a single file, given relative to the locale folder"""
+        ext = splitext(file_name)[-1]
+        if ext not in self.dialog_exts and ext not in self.line_exts:
+            return
+        path = join(self.folder, file_name)
+        try:
+            with open(path) as f:
+                text = f.read()
+        except (FileNotFoundError, IsADirectoryError):
+            self.texts.pop(file_name, None)
+            self.parsed.pop(file_name, None)
+            return
+        except (OSError, UnicodeDecodeError) as e:
+            log.warning('Could not read', path, '--', e)
+            return
+
+        if ext in self.dialog_exts:
+            self.parsed[file_name] = DialogTemplate(text)
+        else:
+            self.parsed[file_name] = [i.strip() for i in text.split('\n') if i.strip()]
+        self.texts[file_name] = text
+
+    def __contains__(self, file_name):
+        return file_name in self.texts
+
+    def read(self, file_name: str) -> str:
+        """Text of a resource file, read from disk if its type isn't indexed"""
+        text = self.texts.get(file_name)
+        if text is not None:
+            return text
+        ext = splitext(file_name)[-1]
+        if ext in self.dialog_exts or ext in self.line_exts:
+            raise FileNotFoundError(join(self.folder, file_name))
+        with open(join(self.folder, file_name)) as f:
+            return f.read()
+
+    def lines(self, file_name: str) -> List[str]:
+        """Stripped, non-empty lines of a .intent, .entity, .voc or .txt file"""
+        self.read(file_name)
+        return self.parsed[file_name]
+
+    def template(self, file_name: str) -> Optional[DialogTemplate]:
+        """Parsed .dialog, .speech or .text file or None if it doesn't exist"""
+        return self.parsed.get(file_name)
+
+
+class LocalesService(ServicePlugin):
+    """
+    Keeps the locale resources of each skill in memory
+
+    Usage:
+        rt.locales.get('weather').lines('current.weather.intent')
+    """
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        self.indexes = {}
+        self.indexes_lock = Lock()
+
+    def get(self, skill_name: str, lang: str = None) -> LocaleIndex:
+        """Get locale index of a skill, scanning its folder the first time"""
+        lang = lang or self.rt.config['lang']
+        key = (skill_name, lang)
+        index = self.indexes.get(key)
+        if index is None:
+            with self.indexes_lock:
+                index = self.indexes.get(key)
+                if index is None:
+                    folder = self.rt.paths.skill_locale(skill_name=skill_name, lang=lang)
+                    index = self.indexes[key] = LocaleIndex(folder)
+        return index
+
+    def remove(self, skill_name: str):
+        """Forget the indexes of a skill so they are rebuilt when it loads again"""
+        with self.indexes_lock:
+            for key in [i for i in self.indexes if i[0] == skill_name]:
+                del self.indexes[key]
+
+    def on_file_change(self, path: str):
+        """Called by the skills file watcher when any file in the skills folder changes"""
+        for index in list(self.indexes.values()):
+            if path.startswith(join(index.folder, '')):
+                index.update(relpath(path, index.folder))
@@ -28,6 +28,7 @@ class MainThreadService(ServicePlugin):
     def __init__(self, rt):
         super().__init__(rt)
         self.quit_event = Event()
+        self.restart_requested = False
 
     def __bool__(self):
         return not self.quit_event.is_set()
@@ -35,5 +36,10 @@ class MainThreadService(ServicePlugin):
     def quit(self):
         self.quit_event.set()
 
+    def restart(self):
+        """Quit and, when running under --supervise, start again in a freshly forked worker"""
+        self.restart_requested = True
+        self.quit()
+
     def wait(self):
         self.quit_event.wait()
@@ -0,0 +1,66 @@
+import os
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread, Event
+
+from mycroft.services.service_plugin import ServicePlugin
+from mycroft.util import log
+from mycroft.util.metrics import format_prometheus
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != '/metrics':
+            self.send_error(404)
+            return
+        body = format_prometheus().encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class MetricsService(ServicePlugin):
+    """
+    Exposes the stage latency histograms of mycroft.util.metrics
+
+    They can be scraped by Prometheus at http://<host>:<port>/metrics
+    and/or written periodically to dump_file in the same text format
+    """
+    _config = {
+        'host': '127.0.0.1',
+        'port': 0,  # 0 disables the endpoint
+        'dump_file': '',
+        'dump_interval': 60
+    }
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        self.server = None
+        self.stop_event = Event()
+        if self.config['port']:
+            self.server = HTTPServer((self.config['host'], self.config['port']), MetricsHandler)
+            Thread(target=self.server.serve_forever, daemon=True).start()
+            log.info('Serving metrics at http://{}:{}/metrics'.format(
+                self.config['host'], self.config['port']
+            ))
+        if self.config['dump_file']:
+            Thread(target=self._dump_loop, daemon=True).start()
+
+    def dump(self):
+        file_name = os.path.expanduser(self.config['dump_file'])
+        with open(file_name + '.tmp', 'w') as f:
+            f.write(format_prometheus())
+        os.replace(file_name + '.tmp', file_name)
+
+    def _dump_loop(self):
+        while not self.stop_event.wait(self.config['dump_interval']):
+            self.dump()
+
+    def _unload_plugin(self):
+        self.stop_event.set()
+        if self.server:
+            self.server.shutdown()
@@ -1,6 +1,7 @@
 from copy import deepcopy
 
 from mycroft.package_cls import Package
+from mycroft.package_codec import PackageCodec
 from mycroft.services.service_plugin import ServicePlugin
 
 
@@ -8,6 +9,8 @@ class PackageService(ServicePlugin):
     def __init__(self, rt):
         super().__init__(rt)
         self._package = Package()
+        self._codec = PackageCodec(self._package._struct)
+        self._codecs = {self._codec.schema_id: self._codec}
 
     def add_struct(self, struct):
         """
@@ -18,6 +21,13 @@ class PackageService(ServicePlugin):
             ...     p.album_art.url = 'http://foo.com/bar.png'
         """
         self._package.add_struct(struct)
+        self._codec = PackageCodec(self._package._struct)
+        self._codecs[self._codec.schema_id] = self._codec
+
+    @property
+    def struct(self) -> dict:
+        """Layout of the global package, including all added structs"""
+        return self._package._struct
 
     def __setattr__(self, key, value):
         if key in ('config', 'rt') or key.startswith('_'):
@@ -31,6 +41,32 @@ class PackageService(ServicePlugin):
             pass
         return self._package.__getattribute__(item)
 
+    def encode(self, p: Package) -> bytes:
+        """Serialize package into compact bytes for sending to another process"""
+        return self._codec.encode(p)
+
+    def decode(self, data: bytes) -> Package:
+        """
+        Deserialize package created by encode(). Packages encoded before
+        a struct was added in this process are still decoded
+        """
+        _, schema_id = PackageCodec.read_header(data)
+        codec = self._codecs.get(schema_id)
+        if not codec:
+            raise ValueError('Package was encoded with an unknown struct')
+        return codec.decode(data, self())
+
+    def encode_json(self, p: Package, **kwargs) -> str:
+        """Serialize package into JSON for logging and replaying"""
+        return self._codec.encode_json(p, **kwargs)
+
+    def decode_json(self, text: str) -> Package:
+        return self._codec.decode_json(text, self())
+
+    def to_json_dict(self, p: Package) -> dict:
+        """Package as builtin values ready to embed in a larger JSON message"""
+        return self._codec.to_json_dict(p)
+
     def __call__(self, **kwargs):
         """Get an empty package instance"""
         return deepcopy(self._package).add(**kwargs)
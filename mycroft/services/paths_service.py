@@ -22,16 +22,20 @@
 from copy import deepcopy
 
 import re
+from functools import lru_cache
 from os.path import expanduser
 from pkg_resources import Requirement, resource_filename
 from threading import Lock
+from types import MappingProxyType
 
 from mycroft.services.service_plugin import ServicePlugin
 from mycroft.util import log
 
+ref_regex = re.compile(r'\${[a-zA-Z_]+}')
+
 
 def find_refs(path):
-    return re.findall('\${[a-zA-Z_]+}', path)
+    return ref_regex.findall(path)
 
 
 def get_var_name(ref):
@@ -59,6 +63,8 @@ class StringGetter:
     def __init__(self, path):
         self.path = path
         self.refs = find_refs(path)
+        self.var_names = [get_var_name(s) for s in self.refs]
+        self._cached_format = lru_cache(maxsize=1024)(self._format)
 
     def __repr__(self):
         return self.path
@@ -70,11 +76,14 @@ class StringGetter:
         return other + self.path
 
     def __call__(self, *args, **kwargs):
-        kwargs.update(dict(zip([get_var_name(s) for s in self.refs], map(str, args))))
+        return self._cached_format(tuple(map(str, args)), tuple(sorted(kwargs.items())))
+
+    def _format(self, args, kwarg_items):
+        kwargs = dict(kwarg_items)
+        kwargs.update(zip(self.var_names, args))
 
         path = self.path
-        for ref in self.refs:
-            var = get_var_name(ref)
+        for ref, var in zip(self.refs, self.var_names):
             if var in kwargs:
                 path = path.replace(ref, kwargs[var])
         return path
@@ -93,26 +102,32 @@ class PathsService(ServicePlugin):
 
     def __init__(self, rt):
         self._config_lock = Lock()
+        self._paths = MappingProxyType({})
         super().__init__(rt)
-        self.config = deepcopy(self.config)
 
     def on_config_change(self, config: dict):
+        """Compile a new snapshot of paths and swap it in. Lookups never wait on this"""
         with self._config_lock:
-            self.config = deepcopy(config)
-            self.config['data'] = resource_filename(Requirement.parse('mycroft-light'), 'mycroft/data')
-            self.config['lang'] = self.rt.config['lang']
+            paths = deepcopy(config)
+            paths['data'] = resource_filename(Requirement.parse('mycroft-light'), 'mycroft/data')
+            paths['lang'] = self.rt.config['lang']
 
-            resolve_refs(self.config)
+            resolve_refs(paths)
 
-            for k, v in self.config.items():
-                self.config[k] = v.replace('~', expanduser('~'))
+            for k, v in paths.items():
+                paths[k] = v.replace('~', expanduser('~'))
 
-            for k, v in self.config.items():
+            for k, v in paths.items():
                 if find_refs(v):
-                    self.config[k] = StringGetter(v)
+                    paths[k] = StringGetter(v)
+
+            self.config = paths
+            self._paths = MappingProxyType(paths)
 
     def __getattr__(self, item):
-        with self._config_lock:
-            if item in self.config:
-                return self.config[item]
-        raise AttributeError("'" + item + "' not in paths config")
+        if item.startswith('_'):
+            raise AttributeError(item)
+        try:
+            return self._paths[item]
+        except KeyError:
+            raise AttributeError("'" + item + "' not in paths config") from None
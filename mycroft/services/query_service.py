@@ -19,16 +19,53 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from threading import Thread, Event
+from contextvars import ContextVar, copy_context
+from threading import Thread, Event, Lock
+from typing import Any, Callable, Optional
+from uuid import uuid4
 
+from mycroft.package_cls import Package
 from mycroft.services.service_plugin import ServicePlugin
-from mycroft.util import log
+from mycroft.util import log, tracing
+from mycroft.util.metrics import timer
 from mycroft.util.misc import safe_run
 from mycroft.util.parallel import run_parallel
 
+#: Session of the interfaces running on this device
+LOCAL_SESSION = 'local'
+
+#: Session and id of the query being processed by the current thread
+current_session = ContextVar('current_session', default=LOCAL_SESSION)
+current_query_id = ContextVar('current_query_id', default=None)
+
+
+class Session:
+    """
+    One conversation with a user
+
+    Responses to queries of the local session go to the on_response callbacks
+    of every interface. Other sessions have a single callback of their own,
+    called as on_response(package, query_id). The package is None when
+    the query was consumed by get_next_query instead of producing a response.
+    """
+
+    def __init__(self, session_id: str, on_response: Callable = None):
+        self.id = session_id
+        self.on_response = on_response
+        self.consumers = []  # Waiting get_next_query calls, oldest first
+        self.lock = Lock()
+
+    def take_consumer(self) -> Optional[Callable]:
+        with self.lock:
+            return self.consumers.pop(0) if self.consumers else None
+
 
 class QueryService(ServicePlugin):
     """Launches queries in separate threads"""
+    _package_struct = {
+        'session': str,
+        'trace_id': str
+    }
 
     def __init__(self, rt):
         super().__init__(rt)
@@ -36,30 +73,76 @@ class QueryService(ServicePlugin):
         self.on_query_callbacks = []
         self.on_response_callbacks = []
         self.response_event = Event()
-        self.query_consumer = None
-
-    def _run_query(self, query):
+        self.sessions = {LOCAL_SESSION: Session(LOCAL_SESSION)}
+
+    def create_session(self, on_response: Callable[[Optional[Package], Any], None]) -> str:
+        """Start a conversation whose responses are only given to on_response"""
+        session_id = uuid4().hex
+        self.sessions[session_id] = Session(session_id, on_response)
+        return session_id
+
+    def close_session(self, session_id: str):
+        session = self.sessions.pop(session_id, None)
+        if session:
+            while True:
+                consumer = session.take_consumer()
+                if not consumer:
+                    break
+                consumer(None)
+
+    def _run_query(self, query, session_id, query_id, trace):
         """Function to run query in a separate thread"""
-        run_parallel(self.on_query_callbacks, label='Running query', args=[query])
-        if self.query_consumer and query:
-            self.query_consumer(query)
-        else:
-            safe_run(self.send_package, args=[self.rt.intent.calc_package(query)], warn=False)
-
-    def send_package(self, package):
+        session = self.sessions.get(session_id)
+        if not session:
+            log.warning('Dropping query for closed session:', query)
+            return
+        current_session.set(session_id)
+        current_query_id.set(query_id)
+        with tracing.activate(trace):
+            if session_id == LOCAL_SESSION:
+                with tracing.span('on_query'):
+                    run_parallel(self.on_query_callbacks, label='Running query', args=[query])
+            consumer = query and session.take_consumer()
+            if consumer:
+                consumer(query)
+                if session.on_response:
+                    safe_run(session.on_response, args=[None, query_id], label='Session response')
+            else:
+                safe_run(self.send_package, args=[self.rt.intent.calc_package(query)], warn=False)
+
+    def send_package(self, package: Package):
         """Generates various forms of the data and gives that formatted data to each callback"""
+        package.session = package.session or current_session.get()
+        session = self.sessions.get(package.session)
+        if not session:
+            log.warning('Dropping response for closed session')
+            return
 
         self.rt.transformers.process(package)
         log.debug('Dialog:', package.speech)
 
+        trace = tracing.current_trace()
+        if trace:
+            package.trace_id = trace.id
+            trace.attrs.setdefault('latency', round(trace.elapsed(), 6))
+
+        if session.on_response:
+            safe_run(session.on_response, args=[package, current_query_id.get()],
+                     label='Session response')
+            return
+
         def mklm(fn):
+            owner = getattr(fn, '__self__', None)
+            stage = 'response.' + (getattr(owner, '_attr_name', '') or fn.__qualname__)
+
             def ca():
-                fn(package)
+                with timer(stage), tracing.span(stage):
+                    fn(package)
 
             return ca
 
         threads = [
-            Thread(target=safe_run, args=(mklm(resp_callback),))
+            Thread(target=copy_context().run, args=(safe_run, mklm(resp_callback)))
             for resp_callback in self.on_response_callbacks
         ]
 
@@ -71,11 +154,19 @@ class QueryService(ServicePlugin):
             i.join()
         self.response_event.clear()
 
-    def send(self, query):
-        """Starts calculating a query in a new thread"""
-        t = Thread(target=self._run_query, args=(query,))
+    def send(self, query, session_id=LOCAL_SESSION, query_id=None):
+        """
+        Starts calculating a query in a new thread
+
+        Args:
+            query: Text spoken or typed by the user
+            session_id: Conversation the query belongs to, from create_session()
+            query_id: Passed back to the session's on_response with the response
+        """
+        trace = tracing.start_trace('query', query=query, session=session_id)
+        t = Thread(target=self._run_query, args=(query, session_id, query_id, trace))
         t.start()
-        self.threads.append(t)
+        self.threads = [i for i in self.threads if i.is_alive()] + [t]
 
     def on_query(self, callback):
         """Assign a callback to be run whenever a new response comes in"""
@@ -87,8 +178,14 @@ class QueryService(ServicePlugin):
     def remove_on_response(self, callback):
         self.on_response_callbacks.remove(callback)
 
-    def get_next_query(self, timeout=None):
-        """Waits for and consume next response"""
+    def expect_query(self) -> Callable[[Optional[float]], Optional[str]]:
+        """
+        Reserve the next query of the session being handled by this thread
+
+        Returns a function that waits for the query with an optional timeout.
+        Call this before prompting the user so a quick answer isn't missed.
+        """
+        session = self.sessions.get(current_session.get())
         on_query = Event()
 
         def consumer(query):
@@ -96,11 +193,23 @@ class QueryService(ServicePlugin):
             on_query.set()
         consumer.query = None
 
-        self.query_consumer = consumer
-        on_query.wait(timeout)
-        self.query_consumer = None
+        if session:
+            with session.lock:
+                session.consumers.append(consumer)
 
-        return consumer.query
+        def wait(timeout=None):
+            if session and not on_query.wait(timeout):
+                with session.lock:
+                    if consumer in session.consumers:
+                        session.consumers.remove(consumer)
+                        return None
+                on_query.wait()  # A query took the consumer just as the wait timed out
+            return consumer.query
+        return wait
+
+    def get_next_query(self, timeout=None):
+        """Waits for and consumes the next query of the session being handled by this thread"""
+        return self.expect_query()(timeout)
 
     def on_response(self, callback):
         """Assign a callback to be run whenever a new response comes in"""
@@ -7,17 +7,33 @@ from urllib.parse import urlparse, quote
 
 from mycroft.services.service_plugin import ServicePlugin
 from mycroft.util import log
+from mycroft.util.http_cache import ResponseCache
 
 
 class RemoteKeyService(ServicePlugin):
+    _config = {
+        'cache': {
+            'enabled': False,  # Cache GET responses made with requests
+            'max_entries': 256,  # Kept in memory
+            'max_disk_entries': 2048,
+            'host_ttls': {}  # Seconds to cache responses of a host, ie. {'example.com': 600}
+        }
+    }
+
     def __init__(self, rt):
         super().__init__(rt)
         self.url_plugins = {}
         self.custom_urls = {}
 
+        cache_config = self.config['cache']
+        self.cache = cache_config['enabled'] and ResponseCache(
+            self.filesystem.path('http_cache'), cache_config['max_entries'],
+            cache_config['max_disk_entries'], cache_config['host_ttls']
+        ) or None
+
         urllib.request.urlopen = self.wrap_function(urllib.request.urlopen)
-        requests.request = self.wrap_function(requests.request, arg_index=1)
-        requests.get = self.wrap_function(requests.get)
+        # Every requests call (requests.get, requests.post, sessions, ...) goes through here
+        requests.Session.request = self.wrap_request(requests.Session.request)
 
     def create_key(self, host: str, path: str, custom_url=None, use_auth=False) -> str:
         log.debug('Registered remote', path, 'key for', host)
@@ -59,3 +75,25 @@ class RemoteKeyService(ServicePlugin):
             log.debug('REQ {}...'.format(url))
             return func(*args, **kwargs)
         return wrapper
+
+    def wrap_request(self, func):
+        """Wrap requests.Session.request to inject keys and cache responses"""
+        @wraps(func)
+        def wrapper(session, method, url, *args, **kwargs):
+            if url.startswith(self.rt.config['server_url']):
+                return func(session, method, url, *args, **kwargs)
+
+            def send(method, url, **kwargs):
+                log.debug('REQ {}...'.format(url))
+                return func(session, method, self.modify_url(url), *args, **kwargs)
+
+            if self.cache and not args:
+                return self.cache.request(send, method, url, **kwargs)
+            return send(method, url, **kwargs)
+        return wrapper
+
+    def cache_stats(self) -> dict:
+        """Returns hit, revalidation and miss counts of the response cache"""
+        if not self.cache:
+            return {}
+        return self.cache.stats_snapshot()
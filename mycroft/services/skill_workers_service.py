@@ -0,0 +1,267 @@
+import multiprocessing
+import resource
+import sys
+from functools import partial
+from os import listdir
+from queue import Queue, Empty as QueueEmpty
+from threading import Lock
+from traceback import format_exc
+from typing import Callable
+
+from mycroft.package_cls import Package
+from mycroft.package_codec import PackageCodec
+from mycroft.services.service_plugin import ServicePlugin
+from mycroft.util import log
+from mycroft.util.misc import MycroftException, safe_run
+
+#: Skill methods that rely on threads of the main process
+MAIN_PROCESS_ONLY = ['execute', 'get_response', 'schedule_once', 'schedule_repeating',
+                     'create_thread']
+
+_serving = False  # Set in a worker process once it handles requests
+
+
+def _isolate(cls):
+    """Subclass a skill so the methods that need the main process fail clearly in a worker"""
+    def make_method(name):
+        def method(self, *args, **kwargs):
+            if not _serving:  # Called from __init__. The main process's copy of the skill does it
+                log.debug('Skipping', name, 'of', self.skill_name, 'in skill worker')
+                return None
+            raise MycroftException(
+                '{}.{}() is not available in isolated skills'.format(self.skill_name, name),
+                stack_trace=False
+            )
+        method.__name__ = name
+        return method
+
+    return type(cls.__name__, (cls,), {name: make_method(name) for name in MAIN_PROCESS_ONLY})
+
+
+def load_skills(skill_names) -> Callable:
+    """
+    Set up a worker process that runs handlers of the given skills
+
+    Builds a Root with only the services the skills access and loads the
+    skills from rt.paths.skills. Returns a function that runs a handler
+    on an encoded package and returns the encoded result.
+    """
+    global _serving
+    from mycroft.root import Root
+    from mycroft.services.skills_service import load_skill_class
+
+    rt = Root(lazy=True, blacklist=['skills', 'skill_workers', 'interfaces'])
+    sys.path.append(rt.paths.skills)
+    for folder_name in sorted(listdir(rt.paths.skills)):
+        skill_name = folder_name.replace('_skill', '')
+        if not folder_name.endswith('_skill') or \
+                not ('*' in skill_names or skill_name in skill_names):
+            continue
+        cls = load_skill_class(folder_name, 'skills')
+        if cls:
+            cls = _isolate(cls)
+            cls.rt = rt
+            safe_run(cls, label='Loading ' + skill_name, custom_exception=NotImplementedError,
+                     custom_handler=lambda e, l: log.info(l + ': Skipping disabled plugin'))
+
+    codecs = {}
+
+    def run(intent_id: str, handler_type: str, struct: dict, data: bytes) -> bytes:
+        if struct is not None:  # The main process added structs since the last call
+            rt.package.add_struct(struct)
+            codec = PackageCodec(struct)
+            codecs[codec.schema_id] = codec
+        codec = codecs[PackageCodec.read_header(data)[1]]
+        p = codec.decode(data, rt.package())
+        return codec.encode(rt.intent.run_local_handler(intent_id, handler_type, p))
+
+    _serving = True
+    return run
+
+
+def _serve(conn, load: Callable):
+    """Main loop of a worker process"""
+    try:
+        run = load()
+    except Exception:
+        conn.send((False, format_exc(), {}))
+        return
+    conn.send((True, None, {}))
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        try:
+            reply = True, run(*request)
+        except Exception:
+            reply = False, format_exc()
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        conn.send(reply + ({'cpu': usage.ru_utime + usage.ru_stime,
+                            'max_rss': usage.ru_maxrss},))
+
+
+class SkillWorker:
+    """
+    A process that runs requests sent over a pipe
+
+    The process is spawned rather than forked since the main process
+    already runs threads that may hold locks when it would fork.
+    """
+
+    def __init__(self, worker_id: int, load: Callable, startup_timeout: float):
+        """
+        Args:
+            worker_id: Index of the worker, used in logs
+            load: Picklable function run in the new process that returns the request handler
+            startup_timeout: Seconds the first request waits for load to finish
+        """
+        self.id = worker_id
+        self.load = load
+        self.startup_timeout = startup_timeout
+        self.calls = 0
+        self.usage = {'cpu': 0.0, 'max_rss': 0}
+        self.schemas = set()  # Package structs the process has received
+        self.stale = False  # Restart when returned since the skills were reloaded
+        self.conn = self.process = None
+        self.ready = False
+        self.start()
+
+    def start(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        self.process = multiprocessing.get_context('spawn').Process(
+            target=_serve, args=(child_conn, self.load), daemon=True,
+            name='skill-worker-{}'.format(self.id)
+        )
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.ready = False
+        self.schemas = set()
+        self.stale = False
+        log.debug('Started skill worker', self.id, 'with pid', self.process.pid)
+
+    def stop(self):
+        self.conn.close()
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(1.0)
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def _receive(self, timeout: float, description: str):
+        if not self.conn.poll(timeout):
+            raise TimeoutError('{} took longer than {} seconds'.format(description, timeout))
+        success, result, usage = self.conn.recv()
+        self.usage = usage or self.usage
+        return success, result
+
+    def call(self, request: tuple, timeout: float):
+        """Send request to the handler returned by load and return its result"""
+        self.calls += 1
+        try:
+            if not self.ready:
+                success, result = self._receive(self.startup_timeout, 'Starting')
+                if not success:
+                    raise MycroftException('Skill worker failed to start:\n' + result,
+                                           stack_trace=False)
+                self.ready = True
+            self.conn.send(request)
+            success, result = self._receive(timeout, str(request[0]))
+        except (EOFError, OSError, TimeoutError, MycroftException) as e:
+            log.warning('Restarting skill worker', self.id, '--', e.__class__.__name__ + ':', e)
+            self.restart()
+            raise MycroftException('Skill worker failed running ' + str(request[0]),
+                                   stack_trace=False)
+
+        if not success:
+            raise MycroftException('Exception in skill worker:\n' + result, stack_trace=False)
+        return result
+
+
+class SkillWorkersService(ServicePlugin):
+    """
+    Runs handlers of isolated skills in worker processes
+
+    Each worker loads the isolated skills itself and is restarted when
+    they are reloaded. Handlers running in a worker cannot affect the main
+    process except through the package they return, so the skill methods
+    in MAIN_PROCESS_ONLY raise an exception there.
+    """
+    _config = {
+        'isolated_skills': [],  # Skill names or ['*'] for all skills
+        'num_workers': 2,
+        'timeout': 10.0,
+        'startup_timeout': 60.0,
+        'idle_timeout': 10.0  # Seconds a call waits for a free worker
+    }
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        if not self.config['isolated_skills']:
+            raise NotImplementedError('No isolated skills')
+        self.isolated_skills = set(self.config['isolated_skills'])
+        self.workers = []
+        self.idle_workers = Queue()
+        self.workers_lock = Lock()
+        load = partial(load_skills, sorted(self.isolated_skills))
+        for i in range(self.config['num_workers']):
+            worker = SkillWorker(i, load, self.config['startup_timeout'])
+            self.workers.append(worker)
+            self.idle_workers.put(worker)
+
+    def is_isolated(self, skill_name: str) -> bool:
+        return '*' in self.isolated_skills or skill_name in self.isolated_skills
+
+    def restart_all(self):
+        """Restart workers so they load the current version of the skills"""
+        with self.workers_lock:
+            for worker in self.workers:
+                worker.stale = True
+            idle = []
+            while True:
+                try:
+                    idle.append(self.idle_workers.get_nowait())
+                except QueueEmpty:
+                    break
+            for worker in idle:
+                worker.restart()
+                self.idle_workers.put(worker)
+
+    def _give_back(self, worker: SkillWorker):
+        with self.workers_lock:
+            if worker.stale:
+                worker.restart()
+            self.idle_workers.put(worker)
+
+    def call(self, intent_id: str, handler_type: str, p: Package) -> Package:
+        """Run the prehandler or handler of an intent in a worker process"""
+        try:
+            worker = self.idle_workers.get(timeout=self.config['idle_timeout'])
+        except QueueEmpty:
+            raise MycroftException(
+                'No idle skill worker after {} seconds'.format(self.config['idle_timeout']),
+                stack_trace=False
+            )
+        try:
+            data = self.rt.package.encode(p)
+            schema_id = PackageCodec.read_header(data)[1]
+            struct = None if schema_id in worker.schemas else self.rt.package.struct
+            result = worker.call((intent_id, handler_type, struct, data), self.config['timeout'])
+            worker.schemas.add(schema_id)
+            return self.rt.package.decode(result)
+        finally:
+            self._give_back(worker)
+
+    def usage(self) -> dict:
+        """Returns CPU seconds, peak memory (KiB) and number of calls of each worker"""
+        return {
+            worker.id: dict(worker.usage, pid=worker.process.pid, calls=worker.calls)
+            for worker in self.workers
+        }
+
+    def _unload_plugin(self):
+        for worker in self.workers:
+            worker.stop()
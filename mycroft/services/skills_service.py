@@ -19,25 +19,53 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import os
 import sys
+from threading import RLock, Thread
+from time import sleep
 
 import pyinotify
-from importlib import import_module, reload
+from importlib import invalidate_caches, reload
 from inspect import isclass
 from os import listdir
-from os.path import isdir, join, dirname, isfile
-from subprocess import call
+from os.path import basename, isdir, join, dirname, isfile, islink, lexists
+from shutil import copy2
+from subprocess import call, DEVNULL
 
 from mycroft.plugin.group_plugin import GroupPlugin, GroupMeta
-from mycroft.plugin.util import update_dyn_attrs
+from mycroft.plugin.util import update_dyn_attrs, timed_import, import_times
 from mycroft.services.service_plugin import ServicePlugin
 from mycroft.skill_plugin import SkillPlugin
 from mycroft.util import log
 from mycroft.util.git_repo import GitRepo
 from mycroft.util.misc import safe_run
+from mycroft.util.parallel import run_parallel
 from mycroft.util.text import to_camel
 
 
+def load_skill_class(folder_name: str, plugin_path: str):
+    """Import the CamelCase class from skill.py in the skill folder, reloading it if imported"""
+    cls_name = to_camel(folder_name)
+    mod_name = folder_name + '.skill'
+
+    try:
+        if mod_name in sys.modules:
+            mod = reload(sys.modules[mod_name])
+        else:
+            mod = timed_import(mod_name)
+        cls = getattr(mod, cls_name, '')
+    except Exception:
+        log.exception('Loading', folder_name)
+        return None
+
+    if not isclass(cls):
+        log.error('Could not find', cls_name, 'in', folder_name)
+        return None
+
+    update_dyn_attrs(cls, '_skill', plugin_path)
+    return cls
+
+
 class EventHandler(pyinotify.ProcessEvent):
     exts = ['.py', '.intent', '.entity', '.txt', '.voc']
 
@@ -53,6 +81,7 @@ class EventHandler(pyinotify.ProcessEvent):
 
         skill_folder = parts[1]
         if skill_folder.endswith('_skill'):
+            self.skills.rt.locales.on_file_change(event.pathname)
             if any(event.name.endswith(ext) for ext in self.exts):
                 self.skills.reload(skill_folder)
 
@@ -64,7 +93,8 @@ class SkillsService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=SkillP
         'blacklist': [],
         'url': 'https://github.com/MatthewScholefield/mycroft-light.git',
         'branch': 'skills',
-        'update_freq': 1
+        'update_freq': 1,
+        'precompile': True
     }
 
     def __init__(self, rt):
@@ -83,25 +113,131 @@ class SkillsService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=SkillP
         log.info('Finished loading skills.')
 
         # The watch manager stores the watches and provides operations on watches
-        wm = pyinotify.WatchManager()
-        mask = pyinotify.IN_MODIFY | pyinotify.IN_CREATE | pyinotify.IN_DELETE | pyinotify.IN_MOVED_TO
+        self.watch_manager = pyinotify.WatchManager()
+        self.watches = {}
         skills_dir = self.rt.paths.skills
 
         handler = EventHandler(self, skills_dir)
-        notifier = pyinotify.ThreadedNotifier(wm, handler)
+        notifier = pyinotify.ThreadedNotifier(self.watch_manager, handler)
         notifier.daemon = True
-        wm.add_watch(skills_dir, mask, rec=True, auto_add=True)
+        self.reload_lock = RLock()
+        self._watch_skills()
         notifier.start()
+
         self.git_repo = self.create_git_repo()
+        Thread(target=self._update_loop, daemon=True).start()
+
+    @property
+    def repo_dir(self):
+        """Clone of the skills repo that is pulled in the background"""
+        return join(dirname(self.rt.paths.skills), 'skills-repo')
+
+    @property
+    def versions_dir(self):
+        """Holds a working tree per commit. rt.paths.skills links to the current one"""
+        return join(dirname(self.rt.paths.skills), 'skills-versions')
 
     def create_git_repo(self):
         config = self.rt.config.get_path(self._plugin_path)
-        return GitRepo(directory=self.rt.paths.skills,
+        return GitRepo(directory=self.repo_dir,
                        url=config['url'],
                        branch=config['branch'],
                        update_freq=config['update_freq'])
 
+    def _watch_skills(self):
+        if self.watches:
+            self.watch_manager.rm_watch(list(self.watches.values()), quiet=True)
+        mask = pyinotify.IN_MODIFY | pyinotify.IN_CREATE | pyinotify.IN_DELETE | pyinotify.IN_MOVED_TO
+        self.watches = self.watch_manager.add_watch(self.rt.paths.skills, mask, rec=True,
+                                                    auto_add=True, quiet=True)
+
+    def _update_loop(self):
+        while True:
+            safe_run(self.update, label='Updating skills')
+            sleep(self.git_repo.update_freq * 60 * 60)
+
+    def update(self):
+        """Pull the skills repo, swap in a working tree of the new commit and reload changes"""
+        if not self.git_repo.try_pull():
+            return
+        new_commit = self.git_repo.head()
+        skills_dir = self.rt.paths.skills
+        old_commit = basename(os.readlink(skills_dir)) if islink(skills_dir) else None
+        if new_commit == old_commit:
+            return
+        if old_commit:
+            modified = GitRepo.modified_files(skills_dir)
+            if modified:
+                log.warning('Not updating skills with local changes to:', ', '.join(modified))
+                return
+        log.info('Updating skills to', new_commit[:8] + '...')
+        old_tree = self._swap_in(new_commit)
+        self._watch_skills()
+
+        if old_commit:
+            changed = self.git_repo.changed_files(old_commit, new_commit)
+            folder_names = sorted({i.split('/')[0] for i in changed if '/' in i})
+        else:
+            folder_names = listdir(self.rt.paths.skills)
+        self.reload_all([i for i in folder_names if i.endswith(self._suffix_)])
+
+        if old_tree:
+            self.git_repo.remove_worktree(old_tree)
+
+    def _swap_in(self, commit, old_tree=None):
+        """
+        Atomically point rt.paths.skills to a working tree of commit. Files
+        that skills wrote into the old tree are copied over. Returns the old tree
+
+        Args:
+            commit: Commit to check out
+            old_tree: Tree to copy untracked files from. Defaults to the current link target
+        """
+        skills_dir = self.rt.paths.skills
+        tree = join(self.versions_dir, commit)
+        if not isdir(tree):
+            os.makedirs(self.versions_dir, exist_ok=True)
+            self.git_repo.add_worktree(tree, commit)
+        if old_tree is None and islink(skills_dir):
+            old_tree = os.readlink(skills_dir)
+        if old_tree and old_tree != tree:
+            self._copy_untracked(old_tree, tree)
+
+        temp_link = skills_dir + '.new'
+        if lexists(temp_link):
+            os.remove(temp_link)
+        os.symlink(tree, temp_link)
+        os.replace(temp_link, skills_dir)
+        # Imports before the first clone cached that the folder had no modules
+        sys.path_importer_cache.pop(skills_dir, None)
+        invalidate_caches()
+        return old_tree if old_tree != tree else None
+
+    @staticmethod
+    def _copy_untracked(old_tree, new_tree):
+        for path in GitRepo.untracked_files(old_tree):
+            if '__pycache__' in path.split('/') or lexists(join(new_tree, path)):
+                continue
+            os.makedirs(dirname(join(new_tree, path)), exist_ok=True)
+            copy2(join(old_tree, path), join(new_tree, path))
+
     def reload(self, folder_name):
+        self.reload_all([folder_name])
+
+    def reload_all(self, folder_names):
+        """Reload several skills, compiling intents once at the end"""
+        with self.reload_lock:
+            reloaded = [i for i in folder_names if self._reload_skill(i)]
+            if reloaded:
+                self.rt.intent.context.compile()
+                log.info('Reloaded', ', '.join(reloaded))
+            if 'skill_workers' in self.rt and any(
+                    self.rt.skill_workers.is_isolated(i.replace(self._suffix_, ''))
+                    for i in folder_names
+            ):
+                self.rt.skill_workers.restart_all()
+
+    def _reload_skill(self, folder_name) -> bool:
         log.debug('Reloading', folder_name + '...')
         skill_name = folder_name.replace(self._suffix_, '')
 
@@ -112,13 +248,14 @@ class SkillsService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=SkillP
         if skill_name in self._classes:
             self.rt.intent.remove_skill(skill_name)
             del self._classes[skill_name]
+        self.rt.locales.remove(skill_name)
 
         if not isfile(join(self.rt.paths.skills, folder_name, 'skill.py')):
-            return
+            return False
 
         cls = self.load_skill_class(folder_name)
         if not cls:
-            return
+            return False
 
         cls.rt = self.rt
         self._classes[skill_name] = cls
@@ -127,36 +264,27 @@ class SkillsService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=SkillP
             self._plugins[skill_name] = cls()
             return True
 
-        if safe_run(
-                init, label='Reloading ' + skill_name, custom_exception=NotImplementedError,
-                custom_handler=lambda e, l: log.info(l + ': Skipping disabled plugin')
-        ):
-            self.rt.intent.context.compile()
-            log.info('Reloaded', folder_name)
+        return bool(safe_run(
+            init, label='Reloading ' + skill_name, custom_exception=NotImplementedError,
+            custom_handler=lambda e, l: log.info(l + ': Skipping disabled plugin')
+        ))
 
     def load_skill_class(self, folder_name):
-        cls_name = to_camel(folder_name)
-
-        try:
-            mod = import_module(folder_name + '.skill')
-            mod = reload(mod)
-            cls = getattr(mod, cls_name, '')
-        except Exception:
-            log.exception('Loading', folder_name)
-            return None
-
-        if not isclass(cls):
-            log.error('Could not find', cls_name, 'in', folder_name)
-            return None
-
-        update_dyn_attrs(cls, '_skill', self._plugin_path)
-        return cls
+        return load_skill_class(folder_name, self._plugin_path)
 
     def setup(self):
+        """Moves old skill folders aside and links rt.paths.skills to the pulled repo"""
         skills_dir = self.rt.paths.skills
-        if isdir(skills_dir) and not isdir(join(skills_dir, '.git')):
-            call(['mv', skills_dir, join(dirname(skills_dir), 'skills-old')])
-        self.create_git_repo().try_pull()
+        old_tree = None
+        if isdir(skills_dir) and not islink(skills_dir):
+            if isdir(join(skills_dir, '.git')) and not isdir(self.repo_dir):
+                os.rename(skills_dir, self.repo_dir)
+                old_tree = self.repo_dir  # Holds the files the skills wrote so far
+            else:
+                call(['mv', skills_dir, join(dirname(skills_dir), 'skills-old')])
+        if isdir(self.repo_dir) and not isdir(skills_dir):
+            self.git_repo = self.create_git_repo()
+            self._swap_in(self.git_repo.head(), old_tree)
 
     def _on_partial_load(self, plugin_name):
         self.rt.intent.remove_skill(plugin_name)
@@ -175,25 +303,48 @@ class SkillsService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=SkillP
         """
         log.info('Loading classes...')
         self.setup()
+        if not isdir(self.rt.paths.skills):
+            log.info('No skills yet. They will load once downloaded')
+            return {}
 
-        classes = {}
-        folder_names, invalid_names = listdir(self.rt.paths.skills), []
-
-        for folder_name in folder_names:
+        folder_names, invalid_names = [], []
+        for folder_name in listdir(self.rt.paths.skills):
             if not folder_name.endswith(suffix) or \
                     not isfile(join(self.rt.paths.skills, folder_name, 'skill.py')):
                 invalid_names.append(folder_name)
-                continue
+            elif folder_name[:-len(suffix)] not in blacklist:
+                folder_names.append(folder_name)
 
-            attr_name = folder_name[:-len(suffix)]
-            if attr_name in blacklist:
-                continue
+        if self.config['precompile'] and folder_names:
+            self._precompile(folder_names)
 
-            cls = self.load_skill_class(folder_name)
-            if not cls:
-                continue
+        def make_loader(folder_name):
+            def loader():
+                return self.load_skill_class(folder_name)
+            loader.__name__ = folder_name
+            return loader
 
-            classes[attr_name] = cls
+        loaded = run_parallel([make_loader(i) for i in folder_names], label='Importing')
+        classes = {
+            folder_name[:-len(suffix)]: cls
+            for folder_name, cls in zip(folder_names, loaded) if cls
+        }
 
         log.info('Skipped folders:', ', '.join(invalid_names))
+        self._log_import_times(folder_names)
         return classes
+
+    def _precompile(self, folder_names):
+        """Byte-compile skills on all cores so the threaded imports only need to read .pyc files"""
+        call([sys.executable, '-m', 'compileall', '-q', '-j', '0'] + [
+            join(self.rt.paths.skills, i) for i in folder_names
+        ], stdout=DEVNULL)
+
+    @staticmethod
+    def _log_import_times(folder_names):
+        times = sorted((
+            (import_times[i + '.skill'][1], i) for i in folder_names if i + '.skill' in import_times
+        ), reverse=True)
+        log.debug('Skill import times:', ', '.join(
+            '{} ({:.0f} ms)'.format(name, seconds * 1000) for seconds, name in times
+        ))
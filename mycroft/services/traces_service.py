@@ -0,0 +1,72 @@
+import json
+import os
+from os.path import expanduser, isfile
+from random import random
+from threading import Lock
+
+from mycroft.services.service_plugin import ServicePlugin
+from mycroft.util import log, tracing
+from mycroft.util.tracing import Trace
+
+
+class TracesService(ServicePlugin):
+    """
+    Writes traces of individual queries to a rotating JSON lines file
+
+    Sampling happens once a trace is complete: slow or failed queries are
+    always kept and only a fraction of the rest is written.
+    """
+    _config = {
+        'enabled': False,
+        'file': '/var/tmp/mycroft-traces.jsonl',
+        'max_bytes': 10 * 1024 * 1024,
+        'backup_count': 3,
+        'slow_threshold': 2.0,  # Seconds until the first response is sent
+        'sample_rate': 0.01  # Fraction of other traces kept
+    }
+
+    def __init__(self, rt):
+        super().__init__(rt)
+        if not self.config['enabled']:
+            raise NotImplementedError('Tracing disabled')
+        self.file_name = expanduser(self.config['file'])
+        self.write_lock = Lock()
+        self.stats = {'kept': 0, 'dropped': 0}
+        tracing.sink = self.on_trace
+
+    def should_keep(self, trace: Trace) -> bool:
+        latency = trace.attrs.get('latency', trace.duration)
+        return trace.error or latency >= self.config['slow_threshold'] or \
+            random() < self.config['sample_rate']
+
+    def on_trace(self, trace: Trace):
+        if not self.should_keep(trace):
+            self.stats['dropped'] += 1
+            return
+        self.stats['kept'] += 1
+        line = json.dumps(trace.to_dict(), default=str) + '\n'
+        try:
+            with self.write_lock:
+                self._rotate(len(line))
+                with open(self.file_name, 'a') as f:
+                    f.write(line)
+        except OSError as e:
+            log.warning('Failed to write trace --', e)
+
+    def _rotate(self, extra_bytes: int):
+        """Shift <file>.1 to <file>.2, and so on, when the file would grow too large"""
+        if not isfile(self.file_name) or \
+                os.path.getsize(self.file_name) + extra_bytes <= self.config['max_bytes']:
+            return
+        for i in range(self.config['backup_count'] - 1, 0, -1):
+            if isfile('{}.{}'.format(self.file_name, i)):
+                os.replace('{}.{}'.format(self.file_name, i),
+                           '{}.{}'.format(self.file_name, i + 1))
+        if self.config['backup_count']:
+            os.replace(self.file_name, self.file_name + '.1')
+        else:
+            os.remove(self.file_name)
+
+    def _unload_plugin(self):
+        if tracing.sink == self.on_trace:
+            tracing.sink = None
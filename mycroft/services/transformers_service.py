@@ -19,13 +19,70 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from typing import TYPE_CHECKING, Dict, List
+
 from mycroft.plugin.group_plugin import GroupPlugin, GroupMeta
 from mycroft.package_cls import Package
 from mycroft.services.intent_service import UNSET_ACTION
 from mycroft.services.service_plugin import ServicePlugin
 from mycroft.transformers.transformer_plugin import TransformerPlugin
-from mycroft.transformers.dialog_transformer import DialogTransformer
 from mycroft.util import log
+from mycroft.util.metrics import timer
+from mycroft.util.misc import safe_run
+from mycroft.util.parallel import run_parallel
+from mycroft.util.tracing import span
+
+if TYPE_CHECKING:
+    from mycroft.transformers.dialog_transformer import DialogTransformer
+
+
+def _conflicts(a: TransformerPlugin, b: TransformerPlugin) -> bool:
+    """Whether the two transformers can't safely process a package at the same time"""
+    if None in (a.reads, a.writes, b.reads, b.writes):
+        return True
+    return bool(set(a.writes) & set(b.reads + b.writes) or set(b.writes) & set(a.reads))
+
+
+def _feeds(a: TransformerPlugin, b: TransformerPlugin) -> bool:
+    """Whether a writes something b reads without b also writing something a reads"""
+    if None in (a.reads, a.writes, b.reads, b.writes):
+        return False
+    return bool(set(a.writes) & set(b.reads)) and not set(b.writes) & set(a.reads)
+
+
+def plan_stages(transformers: Dict[str, TransformerPlugin]) -> List[List[str]]:
+    """
+    Group transformers into stages that run one after another
+
+    Transformers that write an attribute run before those that read it.
+    Within a stage, no two transformers touch the same attributes so
+    they can run concurrently. Ties and cycles are broken by name
+    """
+    names = sorted(transformers)
+    deps = {
+        b: {a for a in names if a != b and _feeds(transformers[a], transformers[b])}
+        for b in names
+    }
+    order = []
+    while len(order) < len(names):
+        left = [name for name in names if name not in order]
+        ready = [name for name in left if deps[name].issubset(order)]
+        if not ready:
+            log.warning('Transformer dependency cycle between:', left)
+        order.append((ready or left)[0])
+
+    stages = []
+    stage_of = {}
+    for i, name in enumerate(order):
+        stage = 1 + max((
+            stage_of[other] for other in order[:i]
+            if _conflicts(transformers[name], transformers[other])
+        ), default=-1)
+        stage_of[name] = stage
+        if stage == len(stages):
+            stages.append([])
+        stages[stage].append(name)
+    return stages
 
 
 class TransformersService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=TransformerPlugin,
@@ -34,16 +91,37 @@ class TransformersService(ServicePlugin, GroupPlugin, metaclass=GroupMeta, base=
     def __init__(self, rt):
         ServicePlugin.__init__(self, rt)
         GroupPlugin.__init__(self, rt)
+        self._stages = None
 
     def __type_hinting__(self):
         self.dialog = ''  # type: DialogTransformer
 
+    def _get_stages(self) -> List[List[TransformerPlugin]]:
+        if self._stages is None:
+            stages = plan_stages(self._plugins)
+            log.debug('Transformer stages:', stages)
+            self._stages = [[self._plugins[name] for name in stage] for stage in stages]
+        return self._stages
+
     def process(self, package: Package):
         """Called to modify attributes within package"""
         if package.action == UNSET_ACTION:
             package.action = package.match.intent_id.split(':')[1] if package.match else ''
         package.action = package.action or ''
 
-        self.all.process(package, gp_warn=False)  # type: ignore
+        def make_process(transformer):
+            def process():
+                with span('transformer.' + transformer._attr_name):
+                    transformer.process(package)
+            process.__name__ = transformer._attr_name
+            return process
+
+        with timer('transformers'):
+            for stage in self._get_stages():
+                if len(stage) == 1:
+                    safe_run(make_process(stage[0]), label='Running all.process', warn=False)
+                else:
+                    run_parallel([make_process(i) for i in stage],
+                                 label='Running all.process', warn=False)
 
         log.debug('Package: \n' + str(package))
@@ -21,6 +21,7 @@
 # under the License.
 import atexit
 from collections import namedtuple
+from contextvars import copy_context
 
 import functools
 from copy import deepcopy
@@ -108,20 +109,20 @@ class SkillPlugin(BasePlugin):
 
     def locale(self, file_name) -> list:
         """Returns lines of file in skill's locale/<lang> folder"""
-        locale_folder = self.rt.paths.skill_locale(self.skill_name)
-        with open(join(locale_folder, file_name), 'r') as f:
-            return f.read().strip().split('\n')
+        return self.rt.locales.get(self.skill_name).read(file_name).strip().split('\n')
 
     def dialog(self, dialog: str, fmt: Format = Format.speech, **kwargs) -> str:
-        local_dir = self.rt.paths.skill_locale(skill_name=self.skill_name, lang=self.lang)
-        dialog_file = join(local_dir, dialog + '.dialog')
+        locale = self.rt.locales.get(self.skill_name, self.lang)
+        template = locale.template(dialog + '.dialog')
+        if not template:
+            raise FileNotFoundError(join(locale.folder, dialog + '.dialog'))
         p = self.package(data=kwargs)
-        _, txt = self.rt.transformers.dialog.render_file(dialog_file, p, fmt)
+        _, txt = self.rt.transformers.dialog.render(template, p, fmt)
         return txt
 
     def create_thread(self, target, *args, **kwargs):
-        t = Thread(target=safe_run, args=[target], kwargs=dict(args=args, kwargs=kwargs,
-                                                               label=self.skill_name + ' thread'),
+        t = Thread(target=copy_context().run, args=[safe_run, target],
+                   kwargs=dict(args=args, kwargs=kwargs, label=self.skill_name + ' thread'),
                    daemon=True)
         t.start()
         return t
@@ -172,14 +173,14 @@ class SkillPlugin(BasePlugin):
         orig_p.action = None
         p.skip_activation = True
         for i in range(1 + repeat_count):
+            wait_for_query = self.rt.query.expect_query()
             self.execute(p)
-            response = self.rt.query.get_next_query()
+            response = wait_for_query()
             if response:
                 if not intent_context:
                     return IntentMatch(confidence=1.0, query=response)
-                matches = intent_context.calc_intents(response)
-                match = max(matches, key=lambda x: x.confidence)
-                if match.confidence > 0.5:
+                match = next(iter(intent_context.calc_intents(response, floor=0.5, k=1)), None)
+                if match:
                     match.intent_id = match.intent_id.split(':')[-1]
                     return match
         return IntentMatch(confidence=0.0, query='', intent_id='')
@@ -20,10 +20,9 @@
 # specific language governing permissions and limitations
 # under the License.
 
-import random
 import re
 
-from os.path import isfile, join
+from os.path import join
 from random import randint
 from typing import Tuple
 
@@ -31,11 +30,24 @@ from mycroft.formatters.formatter_plugin import Format
 from mycroft.package_cls import Package
 from mycroft.transformers.transformer_plugin import TransformerPlugin
 from mycroft.util import log
-from mycroft.util.misc import warn_once
+
+
+class DialogTemplate:
+    """Dialog file parsed into its lines and the placeholders used by each line"""
+    placeholder_regex = re.compile(r'{(\w+)}')
+
+    def __init__(self, text: str):
+        self.lines = [
+            (line, frozenset(self.placeholder_regex.findall(line)))
+            for line in text.split('\n')
+            if line and not line.isspace()
+        ]
 
 
 class DialogTransformer(TransformerPlugin):
     """Format data into sentences"""
+    reads = ('action', 'skill', 'lang', 'data', 'speech', 'text')
+    writes = ('speech', 'text')
 
     _package_struct = {
         'speech': str,
@@ -49,60 +61,53 @@ class DialogTransformer(TransformerPlugin):
     def process(self, p: Package):
         if not p.action:
             return
-        locale_dir = self.rt.paths.skill_locale(skill_name=p.skill, lang=p.lang)
-        file_base = join(locale_dir, p.action)
-        speech = file_base + '.speech'
-        dialog = file_base + '.dialog'
-        text = file_base + '.text'
+        locale = self.rt.locales.get(p.skill, p.lang)
+        speech = locale.template(p.action + '.speech')
+        dialog = locale.template(p.action + '.dialog')
+        text = locale.template(p.action + '.text')
 
         line_id = -1
 
         if not p.speech:
-            if isfile(speech):
-                line_id, p.speech = self.render_file(speech, p, Format.speech, line_id)
-            elif isfile(dialog):
-                line_id, p.speech = self.render_file(dialog, p, Format.speech, line_id)
+            if speech:
+                line_id, p.speech = self.render(speech, p, Format.speech, line_id)
+            elif dialog:
+                line_id, p.speech = self.render(dialog, p, Format.speech, line_id)
             else:
                 p.speech = p.text
         if not p.text:
-            if isfile(text):
-                line_id, p.text = self.render_file(text, p, Format.text, line_id)
-            elif isfile(dialog):
-                line_id, p.text = self.render_file(dialog, p, Format.text, line_id)
+            if text:
+                line_id, p.text = self.render(text, p, Format.text, line_id)
+            elif dialog:
+                line_id, p.text = self.render(dialog, p, Format.text, line_id)
             else:
                 p.text = p.speech
 
         if not p.speech and not p.text:
-            log.warning('No dialog at:', dialog)
+            log.warning('No dialog at:', join(locale.folder, p.action + '.dialog'))
 
-    def render_file(self, filename: str, p: Package, fmt: Format, line_id=-1) -> Tuple[int, str]:
+    def render(self, template: DialogTemplate, p: Package, fmt: Format,
+               line_id=-1) -> Tuple[int, str]:
+        """Pick the line that uses the most data and fill in its placeholders"""
+        keys = {key for key, value in p.data.items() if value is not None}
         best_lines, best_score = [], 0
-        with open(filename) as f:
-            lines = f.read().split('\n')
-
-        for line in lines:
-            if not line or line.isspace():
-                continue
-
-            line_score = 1
-            for key, value in p.data.items():
-                if value is None:
-                    continue
-                token = '{' + key + '}'
-                if token in line:
-                    line = line.replace(token, self.rt.formatter.format(value, fmt))
-                    line_score += 1
-
-            if re.search('{[a-zA-Z_]*}', line):
+
+        for line, placeholders in template.lines:
+            line_score = 1 + len(placeholders & keys)
+            if placeholders - keys:
                 line_score /= 100.
             if line_score > best_score:
-                best_lines = [line]
+                best_lines = [(line, placeholders)]
                 best_score = line_score
             elif line_score == best_score:
-                best_lines.append(line)
+                best_lines.append((line, placeholders))
 
         if 0 <= line_id < len(best_lines):
             choice_id = line_id
         else:
             choice_id = randint(0, len(best_lines) - 1)
-        return choice_id, best_lines[choice_id]
+
+        line, placeholders = best_lines[choice_id]
+        for key in placeholders & keys:
+            line = line.replace('{' + key + '}', self.rt.formatter.format(p.data[key], fmt))
+        return choice_id, line
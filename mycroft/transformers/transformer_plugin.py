@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import Optional, Tuple
 
 from mycroft.plugin.base_plugin import BasePlugin
 from mycroft.package_cls import Package
@@ -9,7 +10,14 @@ class TransformerPlugin(BasePlugin):
     Class used to modify package states.
     For example, to replace a .dialog file with actual translated lines
     Add new attributes in the *constructor* with: self.rt.package.add_struct({'myattr': int})
+
+    Transformers that declare the package attributes they read and write
+    can run alongside others that don't touch the same attributes.
+    Leaving them as None runs the transformer on its own.
     """
+    reads = None  # type: Optional[Tuple[str, ...]]
+    writes = None  # type: Optional[Tuple[str, ...]]
+
     @abstractmethod
     def process(self, p: Package):
         """Modify attributes in package"""
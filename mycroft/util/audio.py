@@ -19,8 +19,13 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import audioop
+import wave
+from io import BytesIO
 from os.path import splitext
 from subprocess import Popen
+from threading import Event, Lock
+from time import monotonic, sleep
 
 
 def play_audio(file_name):
@@ -31,3 +36,121 @@ def play_audio(file_name):
         return Popen(['mpg123', '-q', file_name])
     else:
         raise ValueError('Unknown Extension: ' + ext)
+
+
+def load_pcm(file_name, sample_rate, channels, sample_width=2) -> bytes:
+    """Decode a wav file into raw audio in the given format"""
+    with wave.open(file_name, 'rb') as wf:
+        data = wf.readframes(wf.getnframes())
+        width, file_channels, rate = wf.getsampwidth(), wf.getnchannels(), wf.getframerate()
+    if width != sample_width:
+        data = audioop.lin2lin(data, width, sample_width)
+    if file_channels == 2 and channels == 1:
+        data = audioop.tomono(data, sample_width, 0.5, 0.5)
+    elif file_channels == 1 and channels == 2:
+        data = audioop.tostereo(data, sample_width, 1, 1)
+    elif file_channels != channels:
+        raise ValueError('Cannot convert {} channels to {}'.format(file_channels, channels))
+    if rate != sample_rate:
+        data, _ = audioop.ratecv(data, sample_width, channels, rate, sample_rate, None)
+    return data
+
+
+class Playback:
+    """A sound scheduled on a Mixer"""
+
+    def __init__(self, data: bytes, start: int, frame_bytes: int):
+        self.data = data
+        self.start = start
+        self.end = start + len(data) // frame_bytes
+        self.end_time = None  # Estimated time.monotonic() of the last sample leaving the speaker
+        self.finished = Event()
+
+    def wait(self, timeout=None) -> bool:
+        """Wait until the sound has been heard. Returns False on timeout"""
+        if not self.finished.wait(timeout):
+            return False
+        if self.end_time:
+            sleep(max(0.0, self.end_time - monotonic()))
+        return True
+
+
+class Mixer:
+    """
+    Mixes scheduled sounds into the buffers of an output stream callback
+
+    Positions are counted in frames since the stream started, so sounds
+    start at an exact sample no matter when the callback runs
+    """
+
+    def __init__(self, sample_rate: int, channels: int, sample_width=2):
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.frame_bytes = channels * sample_width
+        self.frame = 0  # First frame of the next buffer
+        self.latency = 0.0  # Seconds between rendering a buffer and hearing it
+        self.playing = []
+        self.lock = Lock()
+
+    def schedule(self, data: bytes, delay=0.0) -> Playback:
+        with self.lock:
+            playback = Playback(data, self.frame + int(delay * self.sample_rate), self.frame_bytes)
+            self.playing.append(playback)
+        return playback
+
+    def render(self, frame_count: int) -> bytes:
+        fb = self.frame_bytes
+        start, end = self.frame, self.frame + frame_count
+        out = bytearray(frame_count * fb)
+        now = monotonic()
+        with self.lock:
+            for playback in list(self.playing):
+                a, b = max(start, playback.start), min(end, playback.end)
+                if a < b:
+                    region = slice((a - start) * fb, (b - start) * fb)
+                    chunk = playback.data[(a - playback.start) * fb:(b - playback.start) * fb]
+                    out[region] = audioop.add(bytes(out[region]), chunk, self.sample_width)
+                if playback.end <= end:
+                    self.playing.remove(playback)
+                    playback.end_time = now + self.latency + \
+                        max(0, playback.end - start) / self.sample_rate
+                    playback.finished.set()
+            self.frame = end
+        return bytes(out)
+
+
+def trim_silence(raw_audio: bytes, sample_rate: int, sample_width=2, channels=1, frame_sec=0.02,
+                 threshold=2.0, min_energy=100, padding_sec=0.2) -> bytes:
+    """
+    Cut off quiet audio at the start and end
+
+    Frames louder than threshold times the background level (the 10th
+    percentile frame energy) count as sound. padding_sec of audio is kept
+    around the outermost loud frames. Audio with no loud frames is returned as is
+    """
+    frame_bytes = max(1, int(sample_rate * frame_sec)) * sample_width * channels
+    energies = [
+        audioop.rms(raw_audio[i:i + frame_bytes], sample_width)
+        for i in range(0, len(raw_audio) - len(raw_audio) % (sample_width * channels), frame_bytes)
+    ]
+    if not energies:
+        return raw_audio
+    level = max(min_energy, sorted(energies)[len(energies) // 10] * threshold)
+    loud = [i for i, energy in enumerate(energies) if energy > level]
+    if not loud:
+        return raw_audio
+    padding = int(padding_sec / frame_sec)
+    start = max(0, loud[0] - padding) * frame_bytes
+    end = min(len(energies), loud[-1] + 1 + padding) * frame_bytes
+    return raw_audio[start:end]
+
+
+def encode_flac(raw_audio: bytes, sample_rate: int, sample_width=2, channels=1) -> bytes:
+    """Compress raw audio to FLAC in this process. Requires soundfile"""
+    import soundfile
+    if sample_width != 2:
+        raw_audio = audioop.lin2lin(raw_audio, sample_width, 2)
+    output = BytesIO()
+    with soundfile.SoundFile(output, 'w', sample_rate, channels, 'PCM_16', format='FLAC') as f:
+        f.buffer_write(raw_audio, dtype='int16')
+    return output.getvalue()
@@ -74,3 +74,27 @@ class GitRepo:
                 self.git.pull(ff_only=True)
             return True
         return False
+
+    def head(self) -> str:
+        return self.git.rev_parse('HEAD')
+
+    def changed_files(self, old_commit, new_commit) -> list:
+        """Paths that differ between two commits"""
+        return self.git.diff('--name-only', old_commit, new_commit).split('\n')
+
+    def add_worktree(self, folder, commit):
+        """Check out commit into a new detached working tree at folder"""
+        self.git.worktree('add', '--detach', folder, commit)
+
+    def remove_worktree(self, folder):
+        self.git.worktree('remove', '--force', folder)
+
+    @staticmethod
+    def modified_files(folder) -> list:
+        """Tracked files with local edits in a working tree"""
+        return [i for i in Git(folder).diff('--name-only', 'HEAD').split('\n') if i]
+
+    @staticmethod
+    def untracked_files(folder) -> list:
+        """Files in a working tree that git doesn't track or ignore, like data written by skills"""
+        return [i for i in Git(folder).ls_files('--others', '--exclude-standard').split('\n') if i]
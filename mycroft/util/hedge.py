@@ -0,0 +1,108 @@
+"""
+Hedged calls across interchangeable backends
+
+The backend that has been fastest so far is called first. If it hasn't
+produced an acceptable result after hedge_delay seconds, or fails, the
+next one is started as well, and so on. The first acceptable result is
+returned and the others are abandoned. A conclusive exception, like
+finding no words in silence, is an answer too and is raised right away.
+
+Usage:
+    >>> hedger = Hedger({'a': backend_a, 'b': backend_b}, hedge_delay=0.3)
+    >>> name, result = hedger.call(audio)
+"""
+from contextvars import copy_context
+from queue import Queue, Empty
+from threading import Lock, Thread
+from time import monotonic
+from typing import Any, Callable, Dict, List, Tuple
+
+from mycroft.util.tracing import span
+
+
+class Hedger:
+    def __init__(self, backends: Dict[str, Callable], hedge_delay=0.5, timeout=10.0,
+                 accept: Callable[[Any], bool] = bool, smoothing=0.3, conclusive=()):
+        """
+        Args:
+            backends: functions that all take the same arguments, by name, in order of preference
+            hedge_delay: seconds to wait for a backend before also starting the next one
+            timeout: seconds until call() gives up
+            accept: whether a result is good enough to be returned
+            smoothing: weight of each new measurement in the average latencies
+            conclusive: exception types that are a valid answer rather than a failure
+        """
+        self.backends = backends
+        self.hedge_delay = hedge_delay
+        self.timeout = timeout
+        self.accept = accept
+        self.smoothing = smoothing
+        self.conclusive = conclusive
+        self.latency = {}  # Moving average of seconds until an acceptable result
+        self.lock = Lock()
+
+    def order(self) -> List[str]:
+        """Backends in the order they will be started. Untried ones go first"""
+        return sorted(self.backends, key=lambda name: self.latency.get(name, 0.0))
+
+    def _record(self, name: str, seconds: float):
+        with self.lock:
+            old = self.latency.get(name)
+            self.latency[name] = seconds if old is None else \
+                old + (seconds - old) * self.smoothing
+
+    def _run(self, name: str, results: Queue, args, kwargs):
+        start = monotonic()
+        failed = False
+        try:
+            with span('backend.' + name):
+                result = self.backends[name](*args, **kwargs)
+            error = None if self.accept(result) else ValueError('Rejected result: {!r}'.format(
+                result
+            ))
+            failed = error is not None
+        except self.conclusive as e:
+            result, error = None, e
+        except Exception as e:
+            result, error, failed = None, e, True
+        # Failures count as slow so the backend is tried later next time
+        self._record(name, self.timeout if failed else monotonic() - start)
+        results.put((name, result, error))
+
+    def call(self, *args, **kwargs) -> Tuple[str, Any]:
+        """
+        Returns:
+            (name of the backend, its result)
+        Raises:
+            A conclusive exception, the last backend's exception if none succeeded,
+            or TimeoutError
+        """
+        results = Queue()
+        waiting = self.order()
+        running = 0
+        error = None
+        deadline = monotonic() + self.timeout
+        next_start = monotonic()
+
+        while waiting or running:
+            now = monotonic()
+            if now >= deadline:
+                raise TimeoutError('No result from: ' + ', '.join(self.backends))
+            if waiting and (now >= next_start or not running):
+                name = waiting.pop(0)
+                Thread(target=copy_context().run, args=(self._run, name, results, args, kwargs),
+                       daemon=True).start()
+                running += 1
+                next_start = now + self.hedge_delay
+            wait_until = min(deadline, next_start) if waiting else deadline
+            try:
+                name, result, error = results.get(timeout=max(0.0, wait_until - monotonic()))
+            except Empty:
+                continue
+            running -= 1
+            if error is None:
+                return name, result
+            if isinstance(error, self.conclusive):
+                raise error
+            next_start = monotonic()  # Don't wait out the delay after a failure
+        raise error
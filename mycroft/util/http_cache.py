@@ -0,0 +1,215 @@
+import os
+import pickle
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from hashlib import sha1
+from os.path import join
+from threading import Lock
+from time import time
+from typing import Callable, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from mycroft.util import log
+
+
+def parse_cache_control(value: str) -> dict:
+    """ie. 'public, max-age=60' -> {'public': None, 'max-age': '60'}"""
+    directives = {}
+    for part in value.split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"') or None
+    return directives
+
+
+class ResponseCache:
+    """
+    Cache of GET responses kept in memory and on disk
+
+    Freshness comes from Cache-Control or Expires unless the host has a
+    TTL override. Stale entries with an ETag or Last-Modified header are
+    revalidated with a conditional request instead of being fetched again.
+    An entry is only used for requests that send the same Authorization
+    header and the same values of the headers named in the response's Vary.
+
+    Usage:
+        >>> cache = ResponseCache('/tmp/http_cache')
+        >>> response = cache.request(requests.request, 'GET', 'https://example.com')
+    """
+
+    def __init__(self, folder: str, max_entries: int = 256, max_disk_entries: int = 2048,
+                 host_ttls: dict = None):
+        self.folder = folder
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.host_ttls = host_ttls or {}
+        self.entries = OrderedDict()
+        self.lock = Lock()
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'uncacheable': 0}
+        os.makedirs(folder, exist_ok=True)
+        self._prune_disk()
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable requests answered without downloading the body"""
+        return self.stats_snapshot()['hit_rate']
+
+    def stats_snapshot(self) -> dict:
+        """Copy of the counters along with the hit rate they give"""
+        with self.lock:
+            stats = dict(self.stats)
+        saved = stats['hits'] + stats['revalidated']
+        total = saved + stats['misses']
+        return dict(stats, hit_rate=saved / total if total else 0.0)
+
+    def _count(self, stat: str):
+        with self.lock:
+            self.stats[stat] += 1
+
+    def request(self, send: Callable, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with send(method, url, **kwargs) unless it can be served from cache"""
+        if method.upper() != 'GET' or kwargs.get('stream') or \
+                kwargs.get('data') or kwargs.get('json'):
+            return send(method, url, **kwargs)
+
+        key = requests.Request('GET', url, params=kwargs.get('params')).prepare().url
+        request_headers = CaseInsensitiveDict(kwargs.get('headers') or {})
+        entry = self._get(key)
+        if entry and entry.get('variant') != self._variant(entry['headers'], request_headers):
+            entry = None  # Cached for a request with different headers
+        now = time()
+        if entry and now < entry['expires']:
+            self._count('hits')
+            return self._to_response(entry)
+
+        if entry:
+            headers = dict(kwargs.get('headers') or {})
+            if entry['headers'].get('ETag'):
+                headers['If-None-Match'] = entry['headers']['ETag']
+            if entry['headers'].get('Last-Modified'):
+                headers['If-Modified-Since'] = entry['headers']['Last-Modified']
+            kwargs['headers'] = headers
+
+        response = send(method, url, **kwargs)
+        if entry and response.status_code == 304:
+            self._count('revalidated')
+            entry['headers'].update(response.headers)
+            entry['expires'] = now + (self._freshness(key, entry['headers'], now) or 0)
+            self._put(key, entry)
+            return self._to_response(entry)
+
+        self._store(key, response, now, request_headers)
+        return response
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+        for file_name in os.listdir(self.folder):
+            os.remove(join(self.folder, file_name))
+
+    def _freshness(self, url: str, headers: CaseInsensitiveDict, now: float) -> Optional[float]:
+        """Seconds the response stays fresh or None if it can't be stored"""
+        host_ttl = self.host_ttls.get(urlparse(url).hostname)
+        if host_ttl is not None:
+            return host_ttl
+        directives = parse_cache_control(headers.get('Cache-Control', ''))
+        if 'no-store' in directives or headers.get('Vary') == '*':
+            return None
+        if 'no-cache' in directives:
+            return 0
+        try:
+            if 'max-age' in directives:
+                return max(0, int(directives['max-age']))
+            if 'Expires' in headers:
+                return max(0, parsedate_to_datetime(headers['Expires']).timestamp() - now)
+        except (TypeError, ValueError):
+            pass
+        return 0
+
+    @staticmethod
+    def _variant(response_headers: CaseInsensitiveDict,
+                 request_headers: CaseInsensitiveDict) -> str:
+        """Digest of the request headers that the response depends on"""
+        names = {i.strip().lower() for i in response_headers.get('Vary', '').split(',')}
+        names = sorted((names - {''}) | {'authorization'})
+        return sha1('\n'.join(
+            name + ':' + request_headers.get(name, '') for name in names
+        ).encode()).hexdigest()
+
+    def _store(self, key: str, response: requests.Response, now: float,
+               request_headers: CaseInsensitiveDict):
+        freshness = self._freshness(key, response.headers, now)
+        validated = 'ETag' in response.headers or 'Last-Modified' in response.headers
+        if response.status_code != 200 or freshness is None or not (freshness or validated):
+            self._count('uncacheable')
+            return
+        self._count('misses')
+        self._put(key, {
+            'url': response.url,
+            'headers': CaseInsensitiveDict(response.headers),
+            'content': response.content,
+            'encoding': response.encoding,
+            'expires': now + freshness,
+            'variant': self._variant(response.headers, request_headers)
+        }, write=True)
+
+    def _file(self, key: str) -> str:
+        return join(self.folder, sha1(key.encode()).hexdigest())
+
+    def _get(self, key: str) -> Optional[dict]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry:
+                self.entries.move_to_end(key)
+                return entry
+        try:
+            with open(self._file(key), 'rb') as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.PickleError, EOFError) as e:
+            log.warning('Removing unreadable cache entry for', key, '--', e)
+            os.remove(self._file(key))
+            return None
+        self._put(key, entry)
+        return entry
+
+    def _put(self, key: str, entry: dict, write=False):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        if write:
+            file_name = self._file(key)
+            temp_name = '{}.{}.tmp'.format(file_name, id(entry))
+            with open(temp_name, 'wb') as f:
+                pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_name, file_name)
+
+    def _prune_disk(self):
+        """Drop leftover temp files and the least recently written entries over the limit"""
+        files = []
+        for file_name in os.listdir(self.folder):
+            path = join(self.folder, file_name)
+            if file_name.endswith('.tmp'):
+                os.remove(path)
+            else:
+                files.append((os.path.getmtime(path), path))
+        files.sort()
+        for mtime, path in files[:max(0, len(files) - self.max_disk_entries)]:
+            os.remove(path)
+
+    @staticmethod
+    def _to_response(entry: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = entry['url']
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = entry['encoding']
+        response._content = entry['content']
+        return response
@@ -0,0 +1,80 @@
+"""
+Latency histograms of each stage of the query pipeline
+
+Usage:
+    >>> with timer('stt'):
+    ...     utterance = stt.transcribe(audio)
+    >>> print(format_prometheus())
+"""
+from bisect import bisect_left
+from threading import Lock
+from time import monotonic
+
+#: Upper bounds in seconds of each histogram bucket
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.lock = Lock()
+
+    def observe(self, seconds: float):
+        index = bisect_left(BUCKETS, seconds)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += seconds
+
+    def snapshot(self) -> tuple:
+        """Returns (cumulative bucket counts, sum)"""
+        with self.lock:
+            counts, total = list(self.counts), self.sum
+        for i in range(1, len(counts)):
+            counts[i] += counts[i - 1]
+        return counts, total
+
+
+histograms = {}
+histograms_lock = Lock()
+
+
+def observe(stage: str, seconds: float):
+    histogram = histograms.get(stage)
+    if histogram is None:
+        with histograms_lock:
+            histogram = histograms.setdefault(stage, Histogram())
+    histogram.observe(seconds)
+
+
+class timer:
+    """Context manager that records how long its block took under the given stage"""
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = monotonic()
+        return self
+
+    def __exit__(self, *_):
+        observe(self.stage, monotonic() - self.start)
+
+
+def format_prometheus() -> str:
+    """All histograms in the Prometheus text exposition format"""
+    name = 'mycroft_stage_seconds'
+    lines = [
+        '# HELP {} Time spent in each stage of handling a query'.format(name),
+        '# TYPE {} histogram'.format(name)
+    ]
+    with histograms_lock:  # Queries may add stages meanwhile
+        stages = sorted(histograms.items())
+    for stage, histogram in stages:
+        counts, total = histogram.snapshot()
+        for bound, count in zip(BUCKETS + ('+Inf',), counts):
+            lines.append('{}_bucket{{stage="{}",le="{}"}} {}'.format(name, stage, bound, count))
+        lines.append('{}_sum{{stage="{}"}} {}'.format(name, stage, total))
+        lines.append('{}_count{{stage="{}"}} {}'.format(name, stage, counts[-1]))
+    return '\n'.join(lines) + '\n'
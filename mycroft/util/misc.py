@@ -20,10 +20,12 @@
 # specific language governing permissions and limitations
 # under the License.
 import hashlib
+import json
+import os
 from os import makedirs
-from urllib.error import URLError
+from urllib.error import URLError, HTTPError
 
-from os.path import isdir, join, basename
+from os.path import isdir, isfile, join, basename, getsize
 from shutil import rmtree
 from typing import Callable, Union, io
 
@@ -109,6 +111,31 @@ def calc_md5(fname):
     return hash_md5.hexdigest()
 
 
+def _stat_key(fname) -> list:
+    stat = os.stat(fname)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def store_md5(fname, md5: str):
+    """Remember the md5 of a file until its size or modification time changes"""
+    with open(fname + '.md5.json', 'w') as f:
+        json.dump({'key': _stat_key(fname), 'md5': md5}, f)
+
+
+def cached_md5(fname) -> str:
+    """Like calc_md5, but only hashes the file if it changed since the last call"""
+    try:
+        with open(fname + '.md5.json') as f:
+            data = json.load(f)
+        if data['key'] == _stat_key(fname):
+            return data['md5']
+    except (OSError, ValueError, KeyError):
+        pass
+    md5 = calc_md5(fname)
+    store_md5(fname, md5)
+    return md5
+
+
 def download(url, file: Union[str, io, None] = None, debug=True, timeout=None) -> Union[bytes,
                                                                                         None]:
     """Pass file as a filename, open file object, or None to return the request bytes"""
@@ -129,19 +156,114 @@ def download(url, file: Union[str, io, None] = None, debug=True, timeout=None) -
             file.close()
 
 
+class _DownloadReader:
+    """
+    Stream that reads a partially downloaded file and then the rest from the response
+
+    New data is appended to the partial file and everything read is hashed.
+    """
+
+    def __init__(self, part_file, response, offset: int):
+        self.md5 = hashlib.md5()
+        self.resumed = open(part_file, 'rb') if offset else None
+        self.out = open(part_file, 'ab' if offset else 'wb')
+        self.response = response
+
+    def read(self, size=-1) -> bytes:
+        if self.resumed:
+            data = self.resumed.read(size)
+            if data:
+                self.md5.update(data)
+                return data
+            self.resumed.close()
+            self.resumed = None
+        data = self.response.read(size)
+        self.out.write(data)
+        self.md5.update(data)
+        return data
+
+    def finish(self) -> str:
+        """Reads what's left after the end of the archive and returns the md5 of it all"""
+        while self.read(65536):
+            pass
+        return self.md5.hexdigest()
+
+    def close(self):
+        if self.resumed:
+            self.resumed.close()
+        self.out.close()
+
+
+def _validator(response) -> str:
+    """ETag or Last-Modified date that identifies the version of a response for If-Range"""
+    etag = response.headers.get('ETag')
+    if etag and not etag.startswith('W/'):  # Weak ETags can't be used with If-Range
+        return etag
+    return response.headers.get('Last-Modified')
+
+
+def download_extract(url, folder, data_file, timeout=None):
+    """
+    Download a tar archive to data_file while extracting it into folder
+
+    An interrupted download is left in <data_file>.part and resumed with a
+    range request the next time, if the server can tell with If-Range that
+    the archive hasn't changed since. The md5 of the archive is stored for cached_md5.
+    """
+    import tarfile
+    import urllib.request
+
+    part_file = data_file + '.part'
+    validator_file = part_file + '.validator'
+    offset = getsize(part_file) if isfile(part_file) else 0
+    validator = None
+    if offset and isfile(validator_file):
+        with open(validator_file) as f:
+            validator = f.read()
+    if not validator:
+        offset = 0
+    headers = {'Range': 'bytes={}-'.format(offset), 'If-Range': validator} if offset else {}
+    log.debug('Downloading:', url, *(['from byte', offset] if offset else []))
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(url, headers=headers),
+                                          timeout=timeout)
+    except HTTPError as e:
+        if e.code != 416:  # Range not satisfiable
+            raise
+        os.remove(part_file)
+        return download_extract(url, folder, data_file, timeout)
+
+    with response:
+        if offset and response.status != 206:  # Changed since the partial download
+            offset = 0
+        if not offset:
+            validator = _validator(response)
+            if validator:
+                with open(validator_file, 'w') as f:
+                    f.write(validator)
+            elif isfile(validator_file):
+                os.remove(validator_file)
+        reader = _DownloadReader(part_file, response, offset)
+        try:
+            with tarfile.open(fileobj=reader, mode='r|*') as tar:
+                tar.extractall(path=folder)
+            md5 = reader.finish()
+        finally:
+            reader.close()
+    os.replace(part_file, data_file)
+    if isfile(validator_file):
+        os.remove(validator_file)
+    store_md5(data_file, md5)
+
+
 def download_extract_tar(tar_url, folder, check_md5=False, subdir='',
                          on_update: Callable = None, on_complete: Callable = None) -> bool:
     """Warning! If check_md5 is True, it will delete <folder>/<subdir> when remote md5 updates"""
     data_file = join(folder, basename(tar_url))
 
-    if not isdir(join(folder, subdir)):
+    if not isdir(join(folder, subdir)) or isfile(data_file + '.part'):
         makedirs(folder, exist_ok=True)
-        download(tar_url, data_file)
-
-        import tarfile
-        tar = tarfile.open(data_file)
-        tar.extractall(path=folder)
-        tar.close()
+        download_extract(tar_url, folder, data_file)
         return True
     elif check_md5:
         md5_url = tar_url + '.md5'
@@ -150,7 +272,7 @@ def download_extract_tar(tar_url, folder, check_md5=False, subdir='',
         except (RequestException, URLError) as e:
             log.warning('Failed to download md5 at url:', md5_url)
             return False
-        if remote_md5 != calc_md5(data_file):
+        if not isfile(data_file) or remote_md5 != cached_md5(data_file):
             on_update and on_update()
             rmtree(join(folder, subdir))
             download_extract_tar(tar_url, folder, subdir=subdir)
@@ -20,6 +20,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import time
+from contextvars import copy_context
 from threading import Thread
 from typing import Any, Dict, List, Union, Callable
 
@@ -103,7 +104,8 @@ def run_parallel(functions: List[Callable], label='',
             fn_label = label + ' - ' + fn.__name__
             return_vals[i] = safe_run(fn, label=fn_label, *safe_args, **safe_kwargs)
 
-        threads.append(Thread(target=wrapper, args=(i,)))
+        # Each thread sees the context variables of the caller, ie. the query session
+        threads.append(Thread(target=copy_context().run, args=(wrapper, i)))
 
     for t in threads:
         t.start()
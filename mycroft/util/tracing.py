@@ -0,0 +1,110 @@
+"""
+Per-query trace spans
+
+A trace is started for each query and stored in a context variable, so
+spans opened in any thread that copies the context (run_parallel,
+SkillPlugin.create_thread) are recorded under it. Without an active
+trace, span() does nothing.
+
+Usage:
+    >>> with span('handler', intent='weather:forecast'):
+    ...     run_handler()
+"""
+from contextvars import ContextVar
+from itertools import count
+from threading import current_thread
+from time import monotonic, time
+from typing import Callable, Optional
+from uuid import uuid4
+
+#: (trace, id of innermost span) in the current context
+_current = ContextVar('current_span', default=None)
+
+#: Receives each finished trace. Tracing is off while this is None
+sink = None  # type: Optional[Callable[[Trace], None]]
+
+
+class Trace:
+    def __init__(self, name: str, **attrs):
+        self.id = uuid4().hex[:16]
+        self.name = name
+        self.attrs = attrs
+        self.start_time = time()
+        self.start = monotonic()
+        self.duration = None
+        self.error = False
+        self.spans = []
+        self.span_ids = count(1)
+
+    def elapsed(self) -> float:
+        return monotonic() - self.start
+
+    def to_dict(self) -> dict:
+        return dict(self.attrs, trace_id=self.id, name=self.name, start_time=self.start_time,
+                    duration=self.duration, error=self.error, spans=self.spans)
+
+
+class span:
+    """Context manager recording a nested span of the current trace"""
+    __slots__ = ('name', 'attrs', 'trace', 'parent', 'id', 'start', 'token')
+
+    def __init__(self, name: str, **attrs):
+        self.name = name
+        self.attrs = attrs
+        self.trace = None
+
+    def __enter__(self):
+        context = _current.get()
+        if context is None:
+            return self
+        self.trace, self.parent = context
+        self.id = next(self.trace.span_ids)
+        self.start = monotonic()
+        self.token = _current.set((self.trace, self.id))
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.trace is None:
+            return
+        _current.reset(self.token)
+        record = dict(
+            self.attrs, id=self.id, parent=self.parent, name=self.name,
+            start=round(self.start - self.trace.start, 6),
+            duration=round(monotonic() - self.start, 6), thread=current_thread().name
+        )
+        if exc_type:
+            record['error'] = exc_type.__name__
+            self.trace.error = True
+        self.trace.spans.append(record)
+
+
+def start_trace(name: str, **attrs) -> Optional[Trace]:
+    """Create a trace to pass to activate() or None if tracing is off"""
+    return Trace(name, **attrs) if sink else None
+
+
+class activate:
+    """Make trace current for the block and send it to the sink when the block ends"""
+    __slots__ = ('trace', 'token')
+
+    def __init__(self, trace: Optional[Trace]):
+        self.trace = trace
+
+    def __enter__(self):
+        if self.trace:
+            self.token = _current.set((self.trace, 0))
+        return self.trace
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.trace:
+            return
+        _current.reset(self.token)
+        self.trace.duration = round(self.trace.elapsed(), 6)
+        self.trace.error = self.trace.error or exc_type is not None
+        if sink:
+            sink(self.trace)
+
+
+def current_trace() -> Optional[Trace]:
+    context = _current.get()
+    return context and context[0]
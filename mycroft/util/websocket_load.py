@@ -0,0 +1,77 @@
+"""
+Load generator for the websocket interface
+
+Usage:
+    python -m mycroft.util.websocket_load -c 50 -n 20 'what time is it'
+"""
+import json
+import sys
+from argparse import ArgumentParser
+from threading import Thread
+from time import monotonic
+
+from websocket import create_connection
+
+
+def run_client(url: str, queries: list, pipeline: int, latencies: list, errors: list):
+    """Send queries over one connection, keeping up to <pipeline> of them in flight"""
+    ws = create_connection(url)
+    sent_times = {}
+    next_id = 0
+    try:
+        while next_id < len(queries) or sent_times:
+            while next_id < len(queries) and len(sent_times) < pipeline:
+                sent_times[next_id] = monotonic()
+                ws.send(json.dumps({'type': 'query', 'id': next_id, 'text': queries[next_id]}))
+                next_id += 1
+            message = json.loads(ws.recv())
+            start_time = sent_times.pop(message['id'], None)
+            if message['type'] == 'error':
+                errors.append(message['error'])
+            elif start_time is not None:
+                latencies.append(monotonic() - start_time)
+    finally:
+        ws.close()
+
+
+def percentile(values: list, fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))] if values else 0.0
+
+
+def main():
+    parser = ArgumentParser(description='Sends many concurrent queries to the websocket interface')
+    parser.add_argument('queries', nargs='+')
+    parser.add_argument('-u', '--url', default='ws://127.0.0.1:8181/query')
+    parser.add_argument('-c', '--clients', type=int, default=10, help='Concurrent connections')
+    parser.add_argument('-n', '--num-queries', type=int, default=10, help='Queries per client')
+    parser.add_argument('-p', '--pipeline', type=int, default=1,
+                        help='Queries each client keeps in flight')
+    args = parser.parse_args()
+
+    queries = [args.queries[i % len(args.queries)] for i in range(args.num_queries)]
+    latencies, errors = [], []
+    threads = [
+        Thread(target=run_client, args=(args.url, queries, args.pipeline, latencies, errors),
+               daemon=True)
+        for _ in range(args.clients)
+    ]
+    start_time = monotonic()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    duration = monotonic() - start_time
+
+    latencies.sort()
+    print('Responses: {} in {:.2f}s ({:.1f}/s), errors: {}'.format(
+        len(latencies), duration, len(latencies) / duration, len(errors)
+    ))
+    print('Latency ms: p50 {:.0f}, p95 {:.0f}, p99 {:.0f}, max {:.0f}'.format(
+        *(1000 * percentile(latencies, i) for i in (0.5, 0.95, 0.99, 1.0))
+    ))
+    for error in sorted(set(errors)):
+        print('Error:', error, 'x', errors.count(error), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,140 @@
+"""
+Supervisor that forks workers from a warm parent process
+
+The parent imports every plugin module once and never starts threads or
+opens devices, so forking it is safe. Each worker builds the Root and runs
+the interfaces. When a worker crashes or asks for a restart, a new one is
+forked from the parent instead of starting Python and importing everything
+again.
+
+Usage:
+    >>> sys.exit(supervise(run_worker, warm_up=preload))
+"""
+import os
+import pkgutil
+import random
+import signal
+import sys
+import threading
+from time import monotonic, sleep
+from traceback import print_exc
+from typing import Callable
+
+from mycroft.util import log
+
+#: Exit code of a worker that should be replaced by a fresh one
+RESTART_CODE = 75
+
+
+def preload(package: str = 'mycroft', skip=('mycroft.__main__',)):
+    """Import every module in the package so workers don't have to"""
+    from mycroft.plugin.util import timed_import
+    root = timed_import(package)
+    for _, name, _ in pkgutil.walk_packages(root.__path__, package + '.'):
+        if name in skip:
+            continue
+        try:
+            timed_import(name)
+        except Exception as e:  # Plugins with missing dependencies
+            log.debug('Not preloading', name, '--', e.__class__.__name__ + ':', e)
+
+
+def _exit_code(status: int) -> int:
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _close_on_exec():
+    """Keep files opened while warming up from leaking into programs that workers run"""
+    if not os.path.isdir('/proc/self/fd'):
+        return
+    for fd in map(int, os.listdir('/proc/self/fd')):
+        if fd > 2:
+            try:
+                os.set_inheritable(fd, False)
+            except OSError:  # The listing's own descriptor
+                pass
+
+
+def _fork_worker(run_worker: Callable[[], int]) -> int:
+    pid = os.fork()
+    if pid:
+        return pid
+    # Worker: undo what only makes sense in the supervisor
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGHUP, signal.SIG_DFL)
+    random.seed()
+    try:
+        code = run_worker()
+    except SystemExit:
+        raise
+    except BaseException:
+        print_exc()
+        code = 1
+    sys.exit(code or 0)
+
+
+def supervise(run_worker: Callable[[], int], warm_up: Callable = preload,
+              min_uptime=10.0, max_backoff=30.0) -> int:
+    """
+    Run run_worker in forked processes until one exits normally
+
+    Args:
+        run_worker: Starts everything and returns an exit code. RESTART_CODE forks a new worker
+        warm_up: Called once in the parent. Must not start threads or open devices
+        min_uptime: Workers that crash sooner than this are restarted with a growing delay
+        max_backoff: Longest delay in seconds between restarts
+    Returns:
+        exit code of the last worker
+    """
+    start = monotonic()
+    warm_up()
+    log.info('Warmed up in {:.2f}s'.format(monotonic() - start))
+    if threading.active_count() > 1:
+        log.warning('Threads running before fork, workers may deadlock:', threading.enumerate())
+    _close_on_exec()
+
+    worker = None
+    stopping = False
+
+    def on_signal(signum, _):
+        nonlocal stopping
+        stopping = True
+        if worker and signum != signal.SIGINT:  # The terminal sends SIGINT to the worker itself
+            os.kill(worker, signum)
+
+    signal.signal(signal.SIGINT, on_signal)
+    signal.signal(signal.SIGTERM, on_signal)
+    signal.signal(signal.SIGHUP, on_signal)
+
+    backoff = 0.0
+    while True:
+        started = monotonic()
+        worker = _fork_worker(run_worker)
+        log.info('Started worker', worker)
+        while True:
+            try:
+                _, status = os.waitpid(worker, 0)
+                break
+            except InterruptedError:
+                continue
+        code = _exit_code(status)
+        worker = None
+
+        if stopping or code == 0:
+            return code
+        if code == RESTART_CODE:
+            log.info('Restarting worker')
+            backoff = 0.0
+            continue
+        log.warning('Worker exited with code', code)
+        if monotonic() - started < min_uptime:
+            backoff = min(max_backoff, max(1.0, backoff * 2))
+            log.info('Restarting worker in {:.0f}s'.format(backoff))
+            sleep(backoff)
+            if stopping:
+                return code
+        else:
+            backoff = 0.0
@@ -46,7 +46,7 @@ setup(
         'fitipy',
         'lazy',
         'padaos',
-        'precise_runner'
+        'soundfile'
     ],
     entry_points={
         'console_scripts': [
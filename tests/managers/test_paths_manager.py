@@ -22,7 +22,7 @@
 import sys
 sys.path += ['.']  # noqa
 
-from unittest.mock import Mock
+from unittest.mock import MagicMock
 from mycroft.services.paths_service import resolve_refs, StringGetter
 from mycroft.services import paths_service
 PathsManager = paths_service.PathsService
@@ -41,7 +41,7 @@ class TestResolver:
 
     def test_2(self):
         config = {
-            'a': '$b',
+            'a': '${b}',
             'b': 'c'
         }
         resolve_refs(config)
@@ -50,33 +50,42 @@ class TestResolver:
     def test_3(self):
         config = {
             'a': '1',
-            'b': '2$a',
-            'c': '$a/$b:$d'
+            'b': '2${a}',
+            'c': '${a}/${b}:${d}'
         }
         resolve_refs(config)
-        assert config == {'a': '1', 'b': '21', 'c': '1/21:$d'}
+        assert config == {'a': '1', 'b': '21', 'c': '1/21:${d}'}
 
 
 class TestStringGetter:
     def test_1(self):
-        s = StringGetter('$a:$b')
+        s = StringGetter('${a}:${b}')
         assert s(a='1', b='2') == '1:2'
         assert s(3, 4) == '3:4'
 
+    def test_memoized(self):
+        s = StringGetter('${a}/${b}')
+        assert s('x', b='y') == s('x', b='y') == 'x/y'
+        assert s._cached_format.cache_info().hits == 1
+        assert s(b='z', a='w') == 'w/z'
+
 
 class TestPathsManager:
-    def setup(self):
-        self.rt = Mock()
-        self.rt.config = {'lang': 'en-us'}
-        PathsManager._attr_name = 'paths'
+    def setup_method(self):
+        self.config = {'lang': 'en-us'}
+        self.rt = MagicMock()
+        self.rt.__contains__.side_effect = lambda name: name == 'config'
+        self.rt.config.__getitem__.side_effect = lambda key: self.config[key]
+        self.rt.config.get_path.side_effect = lambda path: self.config[path]
+        PathsManager._attr_name = PathsManager._plugin_path = 'paths'
 
     def test_1(self):
-        self.rt.config['paths'] = {'a': '1', 'b': '2$a'}
+        self.config['paths'] = {'a': '1', 'b': '2${a}'}
         assert PathsManager(self.rt).b == '21'
 
     def test_2(self):
-        self.rt.config['paths'] = {'a': '1', 'b': '2$a', 'c': '$b$d'}
-        assert str(PathsManager(self.rt).c) == '21$d'
+        self.config['paths'] = {'a': '1', 'b': '2${a}', 'c': '${b}${d}'}
+        assert str(PathsManager(self.rt).c) == '21${d}'
         assert PathsManager(self.rt).c(3) == '213'
 
 
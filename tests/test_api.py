@@ -0,0 +1,100 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread
+from types import SimpleNamespace
+
+import pytest
+
+from mycroft.api import Api, STTApi
+
+
+class StandInServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StandInHandler)
+        self.connections = 0
+        self.failures_left = 0
+        self.paths = []
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.server.paths.append(self.path)
+        if self.server.failures_left:
+            self.server.failures_left -= 1
+            status, body = 503, b'"busy"'
+        else:
+            status, body = 200, b'"hello world"'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestApi:
+    def setup_method(self):
+        self.server = StandInServer()
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        Api.client = None
+        self.rt = SimpleNamespace(
+            config={
+                'server_url': 'http://127.0.0.1:{}/v1'.format(self.server.server_port),
+                'http': {
+                    'pool_size': 2, 'retries': 2, 'backoff': 0.01,
+                    'timeouts': {'default': {'timeout': [1, 1], 'budget': 5}}
+                }
+            },
+            identity=SimpleNamespace(access_token='token', is_expired=lambda: False)
+        )
+
+    def teardown_method(self):
+        Api.client.close()
+        Api.client = None
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_keep_alive(self):
+        api = STTApi(self.rt)
+        for i in range(3):
+            assert api.stt(b'audio', 'en-us', 1) == 'hello world'
+        assert self.server.connections == 1
+        stats = Api.client.pool_stats()
+        assert stats['requests'] == 3
+        assert list(stats['hosts'].values()) == [{'connections': 1, 'requests': 3}]
+
+    def test_retry(self):
+        self.server.failures_left = 2
+        assert STTApi(self.rt).stt(b'audio', 'en-us', 1) == 'hello world'
+        assert len(self.server.paths) == 3
+        assert Api.client.stats['retries'] == 2
+
+    def test_retries_exhausted(self):
+        self.server.failures_left = 3
+        with pytest.raises(ConnectionError):
+            STTApi(self.rt).stt(b'audio', 'en-us', 1)
+        assert Api.client.stats['failures'] == 1
+
+    def test_budget(self):
+        self.server.failures_left = 1
+        self.rt.config['http']['timeouts']['default']['budget'] = 0
+        with pytest.raises(ConnectionError):
+            STTApi(self.rt).stt(b'audio', 'en-us', 1)
+        assert len(self.server.paths) == 1
+
+    def test_no_retry_post(self):
+        self.server.failures_left = 1
+        with pytest.raises(ConnectionError):
+            STTApi(self.rt).request({'method': 'POST', 'path': '/activate', 'json': {'a': 1}})
+        assert len(self.server.paths) == 1
@@ -0,0 +1,36 @@
+from mycroft.interfaces.speech.audio_bus import AudioBus
+
+
+def test_cursors():
+    bus = AudioBus(stream=None, chunk_size=2, sample_width=2, buffer_size=12)
+    fast, slow = bus.cursor('fast'), bus.cursor('slow')
+    for i in range(6):
+        bus.write(bytes([i]) * 4)
+        assert fast.read(4) == bytes([i]) * 4
+
+    assert slow.read(4) == b'\x04' * 4  # Chunks 0 to 3 are gone or could be mid-write
+    assert slow.overflows == 1 and slow.lost_bytes == 16 and fast.overflows == 0
+
+    past = bus.cursor('recorder', position=bus.written - 8)
+    assert past.read(8) == b'\x04' * 4 + b'\x05' * 4
+
+    bus.close()
+    assert fast.read(4) == b''
+
+
+def test_capture_error():
+    class BrokenStream:
+        def read(self, num_frames, exception_on_overflow=True):
+            raise OSError('Device unavailable')
+
+    bus = AudioBus(BrokenStream(), chunk_size=2, sample_width=2, buffer_size=12)
+    cursor = bus.cursor('recorder')
+    bus.start()
+    assert cursor.read(4) == b''
+    assert bus.closed
+
+
+def test_stereo_chunks():
+    bus = AudioBus(stream=None, chunk_size=2, sample_width=2, buffer_size=20, channels=2)
+    assert bus.chunk_bytes == 8
+    assert bus.size == 16
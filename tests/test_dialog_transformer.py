@@ -0,0 +1,22 @@
+from types import SimpleNamespace
+
+from mycroft.formatters.formatter_plugin import Format
+from mycroft.package_cls import Package
+from mycroft.transformers.dialog_transformer import DialogTemplate, DialogTransformer
+
+
+def render(text, **data):
+    transformer = DialogTransformer.__new__(DialogTransformer)
+    formatter = SimpleNamespace(format=lambda value, fmt: str(value))
+    transformer.rt = SimpleNamespace(formatter=formatter)
+    p = Package({'data': dict})
+    p.data = data
+    return transformer.render(DialogTemplate(text), p, Format.speech)[1]
+
+
+def test_render():
+    template = 'It is cold.\nIt is {temp} degrees.\nIt is {temp} degrees in {city}.\n'
+    assert render(template) == 'It is cold.'
+    assert render(template, temp=3) == 'It is 3 degrees.'
+    assert render(template, temp=3, city='Paris') == 'It is 3 degrees in Paris.'
+    assert render('{day2_temp} tomorrow', day2_temp=5) == '5 tomorrow'
@@ -0,0 +1,87 @@
+import io
+import tarfile
+from hashlib import md5
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from os.path import isfile, join
+from threading import Thread
+
+from mycroft.util import misc
+from mycroft.util.misc import cached_md5, download_extract_tar
+
+
+def make_tar() -> bytes:
+    out = io.BytesIO()
+    with tarfile.open(fileobj=out, mode='w:gz') as tar:
+        for name, data in [('model/a.pb', b'a' * 5000), ('model/b.txt', b'hello')]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return out.getvalue()
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        data = self.server.data
+        if self.path.endswith('.md5'):
+            data = md5(data).hexdigest().encode() + b'  model.tar.gz'
+        etag = '"{}"'.format(md5(data).hexdigest())
+        start = int(self.headers.get('Range', 'bytes=0-')[6:-1])
+        if self.headers.get('If-Range', etag) != etag:
+            start = 0
+        self.server.ranges.append(start)
+        self.send_response(206 if start else 200)
+        self.send_header('Content-Length', str(len(data) - start))
+        self.send_header('ETag', etag)
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+class TestDownload:
+    def setup_method(self):
+        self.server = HTTPServer(('127.0.0.1', 0), RangeHandler)
+        self.server.data = make_tar()
+        self.server.ranges = []
+        self.url = 'http://127.0.0.1:{}/model.tar.gz'.format(self.server.server_port)
+        Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def teardown_method(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_download(self, tmpdir):
+        folder = str(tmpdir)
+        assert download_extract_tar(self.url, folder, subdir='model')
+        with open(join(folder, 'model', 'b.txt')) as f:
+            assert f.read() == 'hello'
+        assert cached_md5(join(folder, 'model.tar.gz')) == md5(self.server.data).hexdigest()
+
+    def write_part(self, folder, data):
+        with open(join(folder, 'model.tar.gz.part'), 'wb') as f:
+            f.write(data[:100])
+        with open(join(folder, 'model.tar.gz.part.validator'), 'w') as f:
+            f.write('"{}"'.format(md5(data).hexdigest()))
+
+    def test_resume(self, tmpdir):
+        folder = str(tmpdir)
+        self.write_part(folder, self.server.data)
+        assert download_extract_tar(self.url, folder, subdir='model')
+        assert self.server.ranges == [100]
+        assert isfile(join(folder, 'model', 'a.pb'))
+        assert not isfile(join(folder, 'model.tar.gz.part'))
+        assert not isfile(join(folder, 'model.tar.gz.part.validator'))
+
+    def test_resume_changed(self, tmpdir):
+        folder = str(tmpdir)
+        self.write_part(folder, b'\0' * 100)
+        assert download_extract_tar(self.url, folder, subdir='model')
+        assert self.server.ranges == [0]
+        assert cached_md5(join(folder, 'model.tar.gz')) == md5(self.server.data).hexdigest()
+
+    def test_cached_md5(self, tmpdir, monkeypatch):
+        folder = str(tmpdir)
+        download_extract_tar(self.url, folder, subdir='model')
+        monkeypatch.setattr(misc, 'calc_md5', None)
+        assert not download_extract_tar(self.url, folder, check_md5=True, subdir='model')
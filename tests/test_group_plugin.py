@@ -0,0 +1,76 @@
+import sys
+from threading import Thread
+from time import sleep
+
+from mycroft.plugin.group_plugin import GroupMeta, GroupPlugin
+from mycroft.plugin.base_plugin import BasePlugin
+
+
+class ThingPlugin(BasePlugin):
+    pass
+
+
+PLUGIN_SOURCE = '''
+from time import sleep
+
+import test_group_plugin
+from test_group_plugin import ThingPlugin, created
+
+
+class {cls}(ThingPlugin):
+    def __init__(self, rt):
+        super().__init__(rt)
+        sleep(test_group_plugin.delay)
+        created.append({name!r})
+'''
+
+created = []
+delay = 0.0  # Seconds each plugin takes to create
+
+
+def make_package(tmp_path, monkeypatch):
+    package = tmp_path / 'lazy_things'
+    package.mkdir()
+    (package / '__init__.py').write_text('')
+    for name, cls in [('eager', 'EagerThing'), ('later', 'LaterThing')]:
+        (package / (name + '_thing.py')).write_text(PLUGIN_SOURCE.format(cls=cls, name=name))
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setitem(sys.modules, 'test_group_plugin', sys.modules[__name__])
+    created.clear()
+    monkeypatch.setattr(sys.modules[__name__], 'delay', 0.0)
+
+    class Things(GroupPlugin, metaclass=GroupMeta, base=ThingPlugin,
+                 package='lazy_things', suffix='_thing'):
+        def __init__(self, rt, lazy):
+            GroupPlugin.__init__(self, rt, gp_order=['eager'], gp_lazy=lazy)
+
+    return Things
+
+
+def test_lazy_access(tmp_path, monkeypatch):
+    things = make_package(tmp_path, monkeypatch)([], lazy=True)
+    assert created == ['eager'] and 'lazy_things.later_thing' not in sys.modules
+    assert things.later.__class__.__name__ == 'LaterThing'
+    assert things.later is things['later']
+    assert created == ['eager', 'later']
+
+
+def test_lazy_all(tmp_path, monkeypatch):
+    things = make_package(tmp_path, monkeypatch)([], lazy=True)
+    things.all
+    assert sorted(created) == ['eager', 'later']
+    assert sorted(things) == ['eager', 'later']
+
+
+def test_lazy_concurrent_access(tmp_path, monkeypatch):
+    things = make_package(tmp_path, monkeypatch)([], lazy=True)
+    monkeypatch.setattr(sys.modules[__name__], 'delay', 0.2)
+    found = []
+    threads = [Thread(target=lambda: found.append(things.later)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+        sleep(0.05)
+    for thread in threads:
+        thread.join()
+    assert [i.__class__.__name__ for i in found] == ['LaterThing'] * 3
+    assert created == ['eager', 'later']
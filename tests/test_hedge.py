@@ -0,0 +1,155 @@
+import json
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn
+from threading import Thread
+from time import monotonic, sleep
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from mycroft.util.hedge import Hedger
+
+
+class StandInStt(ThreadingMixIn, HTTPServer):
+    """Answers POSTed audio like the Mycroft STT API after a delay"""
+    daemon_threads = True
+
+    def __init__(self, delay, status=200, text='what time is it'):
+        super().__init__(('127.0.0.1', 0), StandInSttHandler)
+        self.delay, self.status, self.text = delay, status, text
+        self.requests = 0
+        Thread(target=self.serve_forever, daemon=True).start()
+
+    def transcribe(self, audio):
+        response = requests.post('http://127.0.0.1:{}/v1/stt'.format(self.server_port), data=audio)
+        response.raise_for_status()
+        return response.json()[0]
+
+
+class StandInSttHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        self.server.requests += 1
+        sleep(self.server.delay)
+        body = '["{}"]'.format(self.server.text).encode()
+        self.send_response(self.server.status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servers():
+    servers = {
+        'slow': StandInStt(delay=1.0, text='slow'),
+        'broken': StandInStt(delay=0.0, status=503),
+        'fast': StandInStt(delay=0.1, text='fast'),
+    }
+    yield servers
+    for server in servers.values():
+        server.shutdown()
+        server.server_close()
+
+
+def test_hedged_calls(servers):
+    hedger = Hedger({name: s.transcribe for name, s in servers.items()}, hedge_delay=0.2)
+
+    start = monotonic()
+    assert hedger.call(b'audio') == ('fast', 'fast')  # slow is hedged, broken fails over
+    assert monotonic() - start < 0.5
+    assert hedger.latency['broken'] == hedger.timeout
+
+    sleep(1.0)  # Let the abandoned slow request finish and be measured
+    assert hedger.order() == ['fast', 'slow', 'broken']
+    servers['slow'].requests = 0
+    assert hedger.call(b'audio') == ('fast', 'fast')
+    assert servers['slow'].requests == 0
+
+
+def test_all_fail(servers):
+    hedger = Hedger({'broken': servers['broken'].transcribe}, hedge_delay=0.1)
+    with pytest.raises(requests.HTTPError):
+        hedger.call(b'audio')
+
+
+class NoWords(ValueError):
+    pass
+
+
+def test_conclusive():
+    def bad_json(audio):
+        raise json.JSONDecodeError('Expecting value', '<html>', 0)
+
+    def no_words(audio):
+        raise NoWords()
+
+    backends = {'bad_json': bad_json, 'rejected': lambda audio: '', 'good': lambda audio: 'hi'}
+    hedger = Hedger(backends, hedge_delay=5.0, conclusive=(NoWords,))
+    assert hedger.call(b'audio') == ('good', 'hi')  # Other errors fail over right away
+
+    hedger = Hedger(dict(backends, no_words=no_words), hedge_delay=5.0, conclusive=(NoWords,))
+    hedger.latency = {'no_words': 0.0, 'good': 1.0, 'bad_json': 1.0, 'rejected': 1.0}
+    with pytest.raises(NoWords):
+        hedger.call(b'audio')
+    assert hedger.latency['no_words'] < 1.0
+
+
+class StandInConfig(dict):
+    """The parts of rt.config that plugins use"""
+
+    def get_path(self, path):
+        config = self
+        for i in path.split('.'):
+            config = config.setdefault(i, {})
+        return config
+
+    def inject(self, config, path=''):
+        target = self.get_path(path)
+        for key, value in config.items():
+            target.setdefault(key, value)
+
+    def on_change(self, path, handler):
+        pass
+
+
+class StandInRoot(SimpleNamespace):
+    def __contains__(self, item):
+        return item in self.__dict__
+
+
+def make_hedged_stt(monkeypatch, servers, backends):
+    pytest.importorskip('speech_recognition')
+    from mycroft.interfaces.speech.stt import hedged_stt
+    from mycroft.interfaces.speech.stt.stt_plugin import SttPlugin
+
+    def make_backend(server):
+        class StandInBackend(SttPlugin):
+            def transcribe(self, audio):
+                return server.transcribe(audio)
+        return StandInBackend
+
+    classes = {name: make_backend(server) for name, server in servers.items()}
+    monkeypatch.setattr(hedged_stt, 'load_class', lambda package, suffix, name, path: classes[name])
+    monkeypatch.setattr(hedged_stt.HedgedStt, '_plugin_path', 'interfaces.speech.stt.hedged')
+    config = StandInConfig(lang='en-us')
+    config.get_path('interfaces.speech.stt.hedged').update(backends=backends, hedge_delay=0.2)
+    return hedged_stt.HedgedStt(StandInRoot(config=config))
+
+
+def test_hedged_stt(servers, monkeypatch):
+    stt = make_hedged_stt(monkeypatch, servers, ['slow', 'broken', 'fast'])
+    assert stt.transcribe(b'audio') == 'fast'
+
+
+def test_hedged_stt_silence(servers, monkeypatch):
+    servers['silent'] = StandInStt(delay=0.05, text='')
+    stt = make_hedged_stt(monkeypatch, servers, ['silent', 'fast'])
+    from mycroft.interfaces.speech.stt.stt_plugin import NoWordsError
+    with pytest.raises(NoWordsError):
+        stt.transcribe(b'silence')
+    assert stt.hedger.latency['silent'] < 1.0  # Measured, not counted as a failure
+    assert servers['fast'].requests == 0
@@ -0,0 +1,67 @@
+import requests
+
+from mycroft.util.http_cache import ResponseCache
+
+
+class FakeServer:
+    def __init__(self, headers):
+        self.headers = headers
+        self.requests = []
+
+    def send(self, method, url, **kwargs):
+        self.requests.append(kwargs.get('headers') or {})
+        response = requests.Response()
+        response.url = url
+        response.headers.update(self.headers)
+        etag = self.headers.get('ETag')
+        if etag and self.requests[-1].get('If-None-Match') == etag:
+            response.status_code, response._content = 304, b''
+        else:
+            response.status_code, response._content = 200, b'{"temp": 20}'
+        return response
+
+
+def test_max_age(tmpdir):
+    server = FakeServer({'Cache-Control': 'max-age=60'})
+    cache = ResponseCache(str(tmpdir))
+    for i in range(3):
+        assert cache.request(server.send, 'GET', 'http://a.com/x', params={'q': 1}).json() == {
+            'temp': 20
+        }
+    assert len(server.requests) == 1
+    assert cache.hit_rate == 2 / 3
+
+    cache.request(server.send, 'GET', 'http://a.com/x', params={'q': 2})
+    cache.request(server.send, 'POST', 'http://a.com/x', params={'q': 1})
+    assert len(server.requests) == 3
+
+
+def test_revalidate(tmpdir):
+    server = FakeServer({'Cache-Control': 'no-cache', 'ETag': '"v1"'})
+    cache = ResponseCache(str(tmpdir))
+    cache.request(server.send, 'GET', 'http://a.com/x')
+    assert cache.request(server.send, 'GET', 'http://a.com/x').json() == {'temp': 20}
+    assert server.requests[-1]['If-None-Match'] == '"v1"'
+    assert cache.stats['revalidated'] == 1
+
+
+def test_disk_and_overrides(tmpdir):
+    server = FakeServer({'Cache-Control': 'no-store'})
+    ResponseCache(str(tmpdir), host_ttls={'a.com': 60}).request(server.send, 'GET', 'http://a.com')
+    ResponseCache(str(tmpdir)).request(server.send, 'GET', 'http://b.com')
+
+    cache = ResponseCache(str(tmpdir))
+    cache.request(server.send, 'GET', 'http://a.com')
+    cache.request(server.send, 'GET', 'http://b.com')
+    assert len(server.requests) == 3
+    assert cache.stats['hits'] == 1
+
+
+def test_request_headers(tmpdir):
+    server = FakeServer({'Cache-Control': 'max-age=60', 'Vary': 'Accept-Language'})
+    cache = ResponseCache(str(tmpdir))
+    for headers in [{'Accept-Language': 'en'}, {'Accept-Language': 'de'},
+                    {'Accept-Language': 'de'}, {'Accept-Language': 'de', 'Authorization': 'a'}]:
+        cache.request(server.send, 'GET', 'http://a.com/x', headers=headers)
+    assert len(server.requests) == 3
+    assert cache.stats['hits'] == 1
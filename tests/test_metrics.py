@@ -0,0 +1,17 @@
+from mycroft.util import metrics
+from mycroft.util.metrics import format_prometheus, observe, timer
+
+
+def test_histogram(monkeypatch):
+    monkeypatch.setattr(metrics, 'histograms', {})
+    observe('stt', 0.2)
+    observe('stt', 3.0)
+    with timer('tts'):
+        pass
+
+    text = format_prometheus()
+    assert 'mycroft_stage_seconds_bucket{stage="stt",le="0.1"} 0' in text
+    assert 'mycroft_stage_seconds_bucket{stage="stt",le="0.25"} 1' in text
+    assert 'mycroft_stage_seconds_bucket{stage="stt",le="+Inf"} 2' in text
+    assert 'mycroft_stage_seconds_sum{stage="stt"} 3.2' in text
+    assert 'mycroft_stage_seconds_count{stage="tts"} 1' in text
@@ -0,0 +1,27 @@
+import audioop
+import wave
+
+from mycroft.util.audio import Mixer, load_pcm
+
+
+def test_mixer_sample_accurate():
+    mixer = Mixer(sample_rate=100, channels=1)
+    mixer.render(5)
+    first = mixer.schedule(b'\x01\x00' * 3, delay=0.03)  # Starts at frame 8
+    second = mixer.schedule(b'\x02\x00' * 2)
+    out = mixer.render(10)
+    assert out == b'\x02\x00' * 2 + b'\x00\x00' + b'\x01\x00' * 3 + b'\x00\x00' * 4
+    assert first.finished.is_set() and second.wait(0)
+    assert mixer.render(1) == b'\x00\x00'
+
+
+def test_load_pcm(tmp_path):
+    name = str(tmp_path / 'sound.wav')
+    with wave.open(name, 'wb') as wf:
+        wf.setnchannels(2)
+        wf.setsampwidth(2)
+        wf.setframerate(200)
+        wf.writeframes(b'\x10\x00\x30\x00' * 20)
+    data = load_pcm(name, sample_rate=100, channels=1)
+    assert len(data) == 2 * 10
+    assert audioop.max(data, 2) == 0x20
@@ -0,0 +1,70 @@
+import sys
+sys.path += ['.']  # noqa
+
+import pytest
+
+from mycroft.intent_match import IntentMatch
+from mycroft.package_cls import Package
+from mycroft.package_codec import PackageCodec
+
+STRUCT = {
+    'data': dict,
+    'speech': str,
+    'confidence': float,
+    'match': IntentMatch,
+    'faceplate': {
+        'mouth': {
+            'text': str,
+            'reset': ()
+        },
+        'eyes': {
+            'blink': (),
+            'color': (int, int, int)
+        }
+    }
+}
+
+
+class TestPackageCodec:
+    def setup_method(self):
+        self.codec = PackageCodec(STRUCT)
+        self.p = Package(STRUCT)
+        self.p.data = {'name': 'bob', 'count': 0}
+        self.p.speech = ''
+        self.p.confidence = 0.0
+        self.p.match = IntentMatch('weather:forecast', 0.8, {'city': 'paris'}, 'weather in paris')
+        self.p.faceplate.mouth.reset()
+        self.p.faceplate.eyes.color = (0, 255, 100)
+
+    def check(self, p):
+        assert p.data == {'name': 'bob', 'count': 0}
+        assert p.speech == '' and p.confidence == 0.0
+        assert repr(p.match) == repr(self.p.match)
+        assert p.faceplate.mouth.reset.value is True
+        assert p.faceplate.eyes.blink.value is False
+        assert p.faceplate.eyes.color == (0, 255, 100)
+        assert p.faceplate.mouth.text is None
+
+    def test_binary(self):
+        self.check(self.codec.decode(self.codec.encode(self.p)))
+
+    def test_json(self):
+        self.check(self.codec.decode_json(self.codec.encode_json(self.p)))
+
+    def test_extra_attributes(self):
+        self.p.__dict__['custom'] = object()
+        p = self.codec.decode(self.codec.encode(self.p))
+        assert type(p.custom) is object
+
+    def test_struct_mismatch(self):
+        other = PackageCodec(dict(STRUCT, text=str))
+        assert other.schema_id != self.codec.schema_id
+        with pytest.raises(ValueError):
+            other.decode(self.codec.encode(self.p))
+
+    def test_decode_into_newer_package(self):
+        newer = Package(dict(STRUCT, text=str))
+        newer.text = 'hi'
+        p = self.codec.decode(self.codec.encode(self.p), newer)
+        self.check(p)
+        assert p.text == 'hi'
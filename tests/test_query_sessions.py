@@ -0,0 +1,121 @@
+from contextvars import copy_context
+from threading import Thread
+from time import sleep, monotonic
+from types import SimpleNamespace
+
+from mycroft.package_cls import Package
+from mycroft.services.query_service import QueryService, current_session
+
+
+class FakeRoot(SimpleNamespace):
+    def __contains__(self, item):
+        return False  # No config or package service
+
+
+def make_service():
+    def calc_package(query):
+        p = Package({'session': str, 'trace_id': str, 'speech': str})
+        p.speech = 'Answer to ' + query
+        return p
+
+    rt = FakeRoot(intent=SimpleNamespace(calc_package=calc_package),
+                  transformers=SimpleNamespace(process=lambda p: None))
+    return QueryService(rt)
+
+
+def run_in_session(session_id, target, *args):
+    def run():
+        current_session.set(session_id)
+        return target(*args)
+    return copy_context().run(run)
+
+
+def wait_for(condition, timeout=5.0):
+    end = monotonic() + timeout
+    while not condition():
+        assert monotonic() < end
+        sleep(0.01)
+
+
+def join_queries(service):
+    for thread in service.threads:
+        thread.join()
+
+
+def test_session_routing():
+    service = make_service()
+    responses = {'a': [], 'b': []}
+    sessions = {
+        name: service.create_session(lambda p, query_id, name=name: responses[name].append(
+            (p.speech, query_id)
+        ))
+        for name in responses
+    }
+    local = []
+    service.on_response(local.append)
+
+    service.send('one', sessions['a'], query_id=1)
+    service.send('two', sessions['b'], query_id=2)
+    service.send('three', sessions['a'], query_id=3)
+    join_queries(service)
+
+    assert sorted(responses['a']) == [('Answer to one', 1), ('Answer to three', 3)]
+    assert responses['b'] == [('Answer to two', 2)]
+    assert local == []
+
+
+def test_concurrent_get_next_query():
+    service = make_service()
+    consumed = []
+    session_id = service.create_session(lambda p, query_id: consumed.append((p, query_id)))
+    session = service.sessions[session_id]
+
+    answers = []
+    waiters = [
+        Thread(target=lambda: answers.append(
+            run_in_session(session_id, service.get_next_query, 5.0)
+        ))
+        for _ in range(4)
+    ]
+    for thread in waiters:
+        thread.start()
+    wait_for(lambda: len(session.consumers) == 4)
+
+    for i in range(4):
+        service.send('query {}'.format(i), session_id, query_id=i)
+    join_queries(service)
+    for thread in waiters:
+        thread.join()
+
+    assert sorted(answers) == ['query {}'.format(i) for i in range(4)]
+    assert sorted(query_id for p, query_id in consumed) == [0, 1, 2, 3]
+    assert all(p is None for p, query_id in consumed)
+
+
+def test_timeout_after_consumer_taken():
+    service = make_service()
+    session_id = service.create_session(lambda p, query_id: None)
+    wait = run_in_session(session_id, service.expect_query)
+    consumer = service.sessions[session_id].take_consumer()  # As _run_query does
+
+    result = []
+    waiter = Thread(target=lambda: result.append(wait(0.01)))
+    waiter.start()
+    sleep(0.05)
+    consumer('late answer')
+    waiter.join(5.0)
+    assert result == ['late answer']
+
+
+def test_close_session():
+    service = make_service()
+    session_id = service.create_session(lambda p, query_id: None)
+    result = []
+    waiter = Thread(target=lambda: result.append(
+        run_in_session(session_id, service.get_next_query)
+    ))
+    waiter.start()
+    wait_for(lambda: service.sessions[session_id].consumers)
+    service.close_session(session_id)
+    waiter.join(5.0)
+    assert result == [None]
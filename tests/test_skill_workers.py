@@ -0,0 +1,47 @@
+import os
+
+import pytest
+
+from mycroft.services import skill_workers_service
+from mycroft.services.skill_workers_service import SkillWorker
+from mycroft.util.misc import MycroftException
+
+
+def load_handlers():
+    """Runs in the worker process in place of loading skills"""
+    def run(intent_id, data):
+        if intent_id == 'crash':
+            os._exit(1)
+        return os.getpid(), data
+    return run
+
+
+def test_restart_after_crash():
+    worker = SkillWorker(0, load_handlers, startup_timeout=30.0)
+    try:
+        pid, data = worker.call(('echo', b'hello'), timeout=5.0)
+        assert data == b'hello'
+        assert pid == worker.process.pid != os.getpid()
+
+        with pytest.raises(MycroftException):
+            worker.call(('crash', b''), timeout=5.0)
+
+        new_pid, data = worker.call(('echo', b'again'), timeout=5.0)
+        assert data == b'again'
+        assert new_pid == worker.process.pid != pid
+    finally:
+        worker.stop()
+
+
+def test_main_process_only(monkeypatch):
+    class TimerSkill:
+        skill_name = 'timer'
+
+        def create_thread(self, target):
+            target()
+
+    skill = skill_workers_service._isolate(TimerSkill)()
+    assert skill.create_thread(lambda: 1 / 0) is None  # Still loading the skill
+    monkeypatch.setattr(skill_workers_service, '_serving', True)
+    with pytest.raises(MycroftException, match='create_thread'):
+        skill.create_thread(print)
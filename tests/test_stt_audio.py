@@ -0,0 +1,30 @@
+import audioop
+import math
+import struct
+from io import BytesIO
+
+import soundfile
+
+from mycroft.util.audio import encode_flac, trim_silence
+
+
+def tone(seconds, amplitude, rate=16000):
+    return b''.join(
+        struct.pack('<h', int(amplitude * math.sin(i / 5))) for i in range(int(seconds * rate))
+    )
+
+
+def test_trim_silence():
+    audio = b'\0' * 2 + tone(1.0, 20) + tone(0.5, 8000) + tone(1.5, 20)
+    trimmed = trim_silence(audio, 16000)
+    assert abs(len(trimmed) / 2 / 16000 - 0.9) < 0.05  # 0.5s of speech and 0.2s on each side
+    assert audioop.rms(trimmed[-800:], 2) < 100
+    assert trim_silence(tone(1.0, 20), 16000) == tone(1.0, 20)
+
+
+def test_encode_flac():
+    audio = tone(0.5, 8000) + b'\0' * 16000
+    flac = encode_flac(audio, 16000)
+    assert flac[:4] == b'fLaC' and len(flac) < len(audio) / 2
+    data, rate = soundfile.read(BytesIO(flac), dtype='int16')
+    assert rate == 16000 and data.tobytes() == audio
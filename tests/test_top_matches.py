@@ -0,0 +1,11 @@
+from mycroft.intent_match import IntentMatch, TopMatches
+
+
+def test_top_matches():
+    top = TopMatches(k=2, floor=0.5)
+    top.add([IntentMatch('a:low', 0.5), IntentMatch('a:mid', 0.7)])
+    assert top.floor == 0.5
+    top.add([IntentMatch('b:high', 0.9), IntentMatch('b:tie', 0.7)])
+    assert top.floor == 0.7
+    top.add(None)
+    assert [i.intent_id for i in top] == ['b:high', 'a:mid']
@@ -0,0 +1,29 @@
+from mycroft.util import tracing
+from mycroft.util.parallel import run_parallel
+from mycroft.util.tracing import activate, span, start_trace
+
+
+def test_spans_across_threads(monkeypatch):
+    traces = []
+    monkeypatch.setattr(tracing, 'sink', traces.append)
+
+    def score():
+        with span('intent.padatious'):
+            pass
+
+    with activate(start_trace('query', query='hello')):
+        with span('handler', intent='greet'):
+            run_parallel([score, score])
+
+    trace, = traces
+    assert trace.attrs['query'] == 'hello' and trace.duration is not None
+    handler = next(s for s in trace.spans if s['name'] == 'handler')
+    engines = [s for s in trace.spans if s['name'] == 'intent.padatious']
+    assert len(engines) == 2 and all(s['parent'] == handler['id'] for s in engines)
+    assert handler['parent'] == 0 and handler['intent'] == 'greet'
+
+
+def test_disabled():
+    assert start_trace('query') is None
+    with activate(None), span('handler') as s:
+        assert s.trace is None
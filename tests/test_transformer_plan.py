@@ -0,0 +1,18 @@
+from mycroft.services.transformers_service import plan_stages
+
+
+class Transformer:
+    def __init__(self, reads=None, writes=None):
+        self.reads, self.writes = reads, writes
+
+
+def test_plan_stages():
+    assert plan_stages({'dialog': Transformer(('data',), ('speech',))}) == [['dialog']]
+    assert plan_stages({
+        'censor': Transformer(('speech',), ('speech_clean',)),
+        'dialog': Transformer(('data',), ('speech',)),
+        'emoji': Transformer(('data',), ('emoji',)),
+    }) == [['dialog', 'emoji'], ['censor']]
+    assert plan_stages({
+        'a': Transformer(), 'b': Transformer(('x',), ('y',)), 'c': Transformer(('z',), ('w',))
+    }) == [['a'], ['b', 'c']]